@@ -1,82 +1,20 @@
 """Async usage example for the ZipTax SDK.
 
-Note: This example demonstrates concurrent operations using asyncio with the
-synchronous client. Full async HTTP support (using aiohttp) can be added as
-a future enhancement for better performance.
+Note: This example uses AsyncZipTaxClient, which requires the optional httpx
+dependency (pip install "ziptax-sdk[async]"). All requests share one
+connection pool, so concurrent calls do not need a thread each.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from ziptax import ZipTaxClient
-
-
-async def get_tax_by_address_async(client, address):
-    """Async wrapper for GetSalesTaxByAddress.
-
-    Args:
-        client: ZipTaxClient instance
-        address: Address to query
-
-    Returns:
-        V60Response object
-    """
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        response = await loop.run_in_executor(
-            executor,
-            client.request.GetSalesTaxByAddress,
-            address,
-        )
-    return response
-
-
-async def get_tax_by_location_async(client, lat, lng):
-    """Async wrapper for GetSalesTaxByGeoLocation.
-
-    Args:
-        client: ZipTaxClient instance
-        lat: Latitude
-        lng: Longitude
-
-    Returns:
-        V60Response object
-    """
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        response = await loop.run_in_executor(
-            executor,
-            client.request.GetSalesTaxByGeoLocation,
-            lat,
-            lng,
-        )
-    return response
 
-
-async def get_account_metrics_async(client):
-    """Async wrapper for GetAccountMetrics.
-
-    Args:
-        client: ZipTaxClient instance
-
-    Returns:
-        V60AccountMetrics object
-    """
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        response = await loop.run_in_executor(
-            executor,
-            client.request.GetAccountMetrics,
-        )
-    return response
+from ziptax import AsyncZipTaxClient
 
 
 async def main():
     """Main async function demonstrating concurrent API calls."""
 
-    # Initialize the client
-    client = ZipTaxClient.api_key("your-api-key-here")
-
-    try:
+    # Initialize the client; the context manager closes the connection pool
+    async with AsyncZipTaxClient.api_key("your-api-key-here") as client:
         # Example 1: Run multiple address lookups concurrently
         print("=" * 60)
         print("Example 1: Concurrent Address Lookups")
@@ -89,7 +27,7 @@ async def main():
         ]
 
         # Create tasks for all addresses
-        tasks = [get_tax_by_address_async(client, addr) for addr in addresses]
+        tasks = [client.request.GetSalesTaxByAddress(addr) for addr in addresses]
 
         # Run all tasks concurrently
         responses = await asyncio.gather(*tasks)
@@ -106,23 +44,11 @@ async def main():
         print("Example 2: Mixed Concurrent API Calls")
         print("=" * 60)
 
-        # Create tasks for different API endpoints
-        address_task = get_tax_by_address_async(
-            client,
-            "123 Main St, Los Angeles, CA 90001"
-        )
-        location_task = get_tax_by_location_async(
-            client,
-            "34.0522",
-            "-118.2437"
-        )
-        metrics_task = get_account_metrics_async(client)
-
         # Run all tasks concurrently
         address_response, location_response, metrics = await asyncio.gather(
-            address_task,
-            location_task,
-            metrics_task,
+            client.request.GetSalesTaxByAddress("123 Main St, Los Angeles, CA 90001"),
+            client.request.GetSalesTaxByGeoLocation("34.0522", "-118.2437"),
+            client.request.GetAccountMetrics(),
         )
 
         print(f"\nAddress lookup: {address_response.address_detail.normalized_address}")
@@ -141,7 +67,7 @@ async def main():
         ]
 
         tasks = [
-            get_tax_by_location_async(client, lat, lng)
+            client.request.GetSalesTaxByGeoLocation(lat, lng)
             for lat, lng in locations
         ]
 
@@ -153,9 +79,18 @@ async def main():
                 rate = response.tax_summaries[0].rate
                 print(f"  Tax rate: {rate * 100:.2f}%")
 
-    finally:
-        # Always close the client
-        client.close()
+        # Example 4: Batch postal code lookups
+        print("\n" + "=" * 60)
+        print("Example 4: Batch Postal Code Lookups")
+        print("=" * 60)
+
+        postal_responses = await client.request.GetRatesByPostalCodes(
+            ["92694", "92618", "90001"]
+        )
+        for postal_response in postal_responses:
+            if postal_response.results:
+                result = postal_response.results[0]
+                print(f"{result.geo_postal_code}: {result.tax_sales * 100:.2f}%")
 
 
 if __name__ == "__main__":
@@ -12,12 +12,13 @@ Example:
     >>> print(response.tax_summaries[0].rate)
 """
 
-from .client import ZipTaxClient
+from .client import AsyncZipTaxClient, ZipTaxClient
 from .config import Config
 from .exceptions import (
     ZipTaxAPIError,
     ZipTaxAuthenticationError,
     ZipTaxAuthorizationError,
+    ZipTaxCircuitOpenError,
     ZipTaxCloudConfigError,
     ZipTaxConnectionError,
     ZipTaxError,
@@ -86,6 +87,7 @@ __version__ = "0.2.6-beta"
 
 __all__ = [
     "ZipTaxClient",
+    "AsyncZipTaxClient",
     "Config",
     # Exceptions
     "ZipTaxError",
@@ -96,6 +98,7 @@ __all__ = [
     "ZipTaxNotFoundError",
     "ZipTaxRateLimitError",
     "ZipTaxServerError",
+    "ZipTaxCircuitOpenError",
     "ZipTaxValidationError",
     "ZipTaxConnectionError",
     "ZipTaxTimeoutError",
@@ -4,8 +4,9 @@ import logging
 from typing import Optional
 
 from .config import Config
+from .resources.async_functions import AsyncFunctions
 from .resources.functions import Functions
-from .utils.http import HTTPClient
+from .utils.http import AsyncHTTPClient, HTTPClient
 from .utils.validation import validate_api_key
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,8 @@ class ZipTaxClient:
             api_key=config.api_key,
             base_url=config.base_url,
             timeout=config.timeout,
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
         )
 
         # Create TaxCloud HTTP client if configured
@@ -56,6 +59,8 @@ class ZipTaxClient:
                 api_key=config.taxcloud_api_key,
                 base_url=config.taxcloud_base_url,
                 timeout=config.timeout,
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
             )
 
         self.request = Functions(
@@ -64,6 +69,8 @@ class ZipTaxClient:
             config=config,
             max_retries=config.max_retries,
             retry_delay=config.retry_delay,
+            retry_max_delay=config.retry_max_delay,
+            retry_jitter=config.retry_jitter,
         )
 
     @classmethod
@@ -125,6 +132,10 @@ class ZipTaxClient:
 
         return cls(config)
 
+    def cache_clear(self) -> None:
+        """Clear cached rate lookups."""
+        self.request.cache_clear()
+
     def close(self) -> None:
         """Close the HTTP client session.
 
@@ -146,3 +157,134 @@ class ZipTaxClient:
     def __repr__(self) -> str:
         """String representation of the client."""
         return f"ZipTaxClient(base_url={self.config.base_url})"
+
+
+class AsyncZipTaxClient:
+    """Async client for interacting with the ZipTax API.
+
+    Requires the optional ``httpx`` dependency (``pip install ziptax-sdk[async]``).
+
+    Example:
+        >>> async with AsyncZipTaxClient.api_key('your-api-key') as client:
+        ...     response = await client.request.GetSalesTaxByAddress(
+        ...         "200 Spectrum Center Drive, Irvine, CA 92618"
+        ...     )
+    """
+
+    def __init__(self, config: Config):
+        """Initialize AsyncZipTaxClient.
+
+        Args:
+            config: Configuration object
+
+        Raises:
+            ImportError: If httpx is not installed
+
+        Note:
+            It's recommended to use AsyncZipTaxClient.api_key() class method
+            instead of instantiating directly.
+        """
+        self.config = config
+        self._http_client = AsyncHTTPClient(
+            api_key=config.api_key,
+            base_url=config.base_url,
+            timeout=config.timeout,
+            max_connections=config.pool_maxsize,
+        )
+
+        # Create TaxCloud HTTP client if configured
+        self._taxcloud_http_client = None
+        if config.has_taxcloud_config:
+            assert config.taxcloud_api_key is not None
+            self._taxcloud_http_client = AsyncHTTPClient(
+                api_key=config.taxcloud_api_key,
+                base_url=config.taxcloud_base_url,
+                timeout=config.timeout,
+                max_connections=config.pool_maxsize,
+            )
+
+        self.request = AsyncFunctions(
+            http_client=self._http_client,
+            taxcloud_http_client=self._taxcloud_http_client,
+            config=config,
+            max_retries=config.max_retries,
+            retry_delay=config.retry_delay,
+            retry_max_delay=config.retry_max_delay,
+            retry_jitter=config.retry_jitter,
+        )
+
+    @classmethod
+    def api_key(
+        cls,
+        api_key: str,
+        base_url: str = "https://api.zip-tax.com",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        taxcloud_connection_id: Optional[str] = None,
+        taxcloud_api_key: Optional[str] = None,
+        taxcloud_base_url: str = "https://api.v3.taxcloud.com",
+        **kwargs,
+    ) -> "AsyncZipTaxClient":
+        """Create an AsyncZipTaxClient instance with an API key.
+
+        Accepts the same arguments as :meth:`ZipTaxClient.api_key`.
+
+        Args:
+            api_key: ZipTax API key
+            base_url: Base URL for the ZipTax API (default: https://api.zip-tax.com)
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum number of retry attempts (default: 3)
+            retry_delay: Delay between retries in seconds (default: 1.0)
+            taxcloud_connection_id: Optional TaxCloud Connection ID for order management
+            taxcloud_api_key: Optional TaxCloud API key for order management
+            taxcloud_base_url: Base URL for the TaxCloud API (default: https://api.v3.taxcloud.com)
+            **kwargs: Additional configuration options
+
+        Returns:
+            AsyncZipTaxClient instance
+
+        Raises:
+            ZipTaxValidationError: If API key is invalid
+        """
+        validate_api_key(api_key)
+
+        config = Config(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            taxcloud_connection_id=taxcloud_connection_id,
+            taxcloud_api_key=taxcloud_api_key,
+            taxcloud_base_url=taxcloud_base_url,
+            **kwargs,
+        )
+
+        return cls(config)
+
+    def cache_clear(self) -> None:
+        """Clear cached rate lookups."""
+        self.request.cache_clear()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pools.
+
+        It's recommended to use the client as an async context manager instead
+        of calling this method directly.
+        """
+        await self._http_client.close()
+        if self._taxcloud_http_client:
+            await self._taxcloud_http_client.close()
+
+    async def __aenter__(self) -> "AsyncZipTaxClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the client."""
+        return f"AsyncZipTaxClient(base_url={self.config.base_url})"
@@ -1,6 +1,6 @@
 """Configuration module for the ZipTax SDK."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 
 class Config:
@@ -16,6 +16,14 @@ class Config:
         taxcloud_connection_id: Optional[str] = None,
         taxcloud_api_key: Optional[str] = None,
         taxcloud_base_url: str = "https://api.v3.taxcloud.com",
+        cache_maxsize: int = 4096,
+        cache_ttl: float = 3600.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_time: float = 30.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: Union[bool, str] = True,
         **kwargs: Any,
     ):
         """Initialize Config.
@@ -29,6 +37,16 @@ class Config:
             taxcloud_connection_id: Optional TaxCloud Connection ID (UUID format)
             taxcloud_api_key: Optional TaxCloud API key for order management
             taxcloud_base_url: Base URL for the TaxCloud API
+            cache_maxsize: Maximum number of cached rate lookups (0 disables)
+            cache_ttl: Time-to-live for cached rate lookups in seconds
+            pool_connections: Number of per-host HTTP connection pools to cache
+            pool_maxsize: Maximum number of keep-alive connections per pool
+            circuit_failure_threshold: Consecutive failures before requests to a
+                host fail fast (0 disables the circuit breaker)
+            circuit_recovery_time: Seconds before a failing host is probed again
+            retry_max_delay: Upper bound on the retry backoff delay in seconds
+            retry_jitter: Whether to randomize retry backoff delays; pass
+                ``"decorrelated"`` for decorrelated jitter
             **kwargs: Additional configuration options
         """
         self._api_key = api_key
@@ -39,6 +57,14 @@ class Config:
         self._taxcloud_connection_id = taxcloud_connection_id
         self._taxcloud_api_key = taxcloud_api_key
         self._taxcloud_base_url = taxcloud_base_url.rstrip("/")
+        self._cache_maxsize = cache_maxsize
+        self._cache_ttl = cache_ttl
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._circuit_failure_threshold = circuit_failure_threshold
+        self._circuit_recovery_time = circuit_recovery_time
+        self._retry_max_delay = retry_max_delay
+        self._retry_jitter = retry_jitter
         self._extra: Dict[str, Any] = kwargs
 
     @property
@@ -96,6 +122,46 @@ class Config:
         """Get TaxCloud base URL."""
         return self._taxcloud_base_url
 
+    @property
+    def cache_maxsize(self) -> int:
+        """Get cache max size."""
+        return self._cache_maxsize
+
+    @property
+    def cache_ttl(self) -> float:
+        """Get cache TTL."""
+        return self._cache_ttl
+
+    @property
+    def pool_connections(self) -> int:
+        """Get number of connection pools."""
+        return self._pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Get max connections per pool."""
+        return self._pool_maxsize
+
+    @property
+    def circuit_failure_threshold(self) -> int:
+        """Get circuit breaker failure threshold."""
+        return self._circuit_failure_threshold
+
+    @property
+    def circuit_recovery_time(self) -> float:
+        """Get circuit breaker recovery time."""
+        return self._circuit_recovery_time
+
+    @property
+    def retry_max_delay(self) -> float:
+        """Get retry max delay."""
+        return self._retry_max_delay
+
+    @property
+    def retry_jitter(self) -> Union[bool, str]:
+        """Get retry jitter strategy."""
+        return self._retry_jitter
+
     @property
     def has_taxcloud_config(self) -> bool:
         """Check if TaxCloud credentials are configured."""
@@ -153,6 +219,14 @@ class Config:
             "timeout": self._timeout,
             "max_retries": self._max_retries,
             "retry_delay": self._retry_delay,
+            "cache_maxsize": self._cache_maxsize,
+            "cache_ttl": self._cache_ttl,
+            "pool_connections": self._pool_connections,
+            "pool_maxsize": self._pool_maxsize,
+            "circuit_failure_threshold": self._circuit_failure_threshold,
+            "circuit_recovery_time": self._circuit_recovery_time,
+            "retry_max_delay": self._retry_max_delay,
+            "retry_jitter": self._retry_jitter,
         }
 
         if self._taxcloud_connection_id:
@@ -84,6 +84,12 @@ class ZipTaxServerError(ZipTaxAPIError):
     pass
 
 
+class ZipTaxCircuitOpenError(ZipTaxAPIError):
+    """Exception raised when a request is rejected by an open circuit breaker."""
+
+    pass
+
+
 class ZipTaxValidationError(ZipTaxError):
     """Exception raised for input validation errors."""
 
@@ -510,6 +510,14 @@ class CartAddress(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     address: str = Field(..., description="Full address string for geocoding")
+    structured: Optional["TaxCloudAddress"] = Field(
+        None,
+        exclude=True,
+        description=(
+            "Optional pre-parsed components of ``address``; when set, the "
+            "TaxCloud route uses them instead of parsing the address string"
+        ),
+    )
 
 
 class CartCurrency(BaseModel):
@@ -1,5 +1,6 @@
 """Resources module for ZipTax SDK."""
 
+from .async_functions import AsyncFunctions
 from .functions import Functions
 
-__all__ = ["Functions"]
+__all__ = ["Functions", "AsyncFunctions"]
@@ -0,0 +1,972 @@
+"""Async API functions for the ZipTax SDK."""
+
+import asyncio
+import logging
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ..config import Config
+from ..exceptions import ZipTaxError
+from ..models import (
+    CalculateCartRequest,
+    CalculateCartResponse,
+    CreateOrderFromCartRequest,
+    CreateOrderRequest,
+    OrderResponse,
+    ProductCodeRecommendationResponse,
+    ProductCodeSearchResponse,
+    RefundTransactionRequest,
+    RefundTransactionResponse,
+    TaxCloudCalculateCartResponse,
+    UpdateOrderRequest,
+    V60AccountMetrics,
+    V60PostalCodeResponse,
+    V60Response,
+)
+from ..utils.http import AsyncHTTPClient
+from ..utils.retry import async_retry_with_backoff
+from ..utils.serialization import dumps
+from ..utils.singleflight import AsyncSingleFlight
+from ..utils.validation import (
+    validate_address_autocomplete,
+    validate_address_request,
+    validate_format,
+    validate_geolocation_request,
+    validate_postal_code,
+    validate_postal_code_request,
+    validate_product_query,
+)
+from .functions import (
+    _REFUND_RESPONSES_ADAPTER,
+    M,
+    _address_key,
+    _by_position,
+    _FunctionsBase,
+    _Method,
+)
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+class _AsyncSender(Protocol):
+    """Retried async sender bound to one HTTP client."""
+
+    def __call__(
+        self, method: _Method, path: str, **kwargs: Any
+    ) -> Awaitable[bytes]: ...
+
+
+async def _send(client: Any, method: _Method, path: str, **kwargs: Any) -> Any:
+    """Await the HTTP client method named ``method`` (e.g. ``"get_bytes"``)."""
+    return await getattr(client, method)(path, **kwargs)
+
+
+class AsyncFunctions(_FunctionsBase):
+    """Async functions class for ZipTax API endpoints.
+
+    Mirrors :class:`Functions` with coroutine methods. All requests share the
+    connection pool of the given :class:`AsyncHTTPClient`, so concurrent
+    calls (e.g. via ``asyncio.gather``) are multiplexed rather than blocking
+    a thread each.
+    """
+
+    __slots__ = ("_inflight",)
+
+    http_client: AsyncHTTPClient
+    taxcloud_http_client: Optional[AsyncHTTPClient]
+    _send_zt: _AsyncSender
+    _send_tc: _AsyncSender
+
+    def __init__(
+        self,
+        http_client: AsyncHTTPClient,
+        config: Config,
+        taxcloud_http_client: Optional[AsyncHTTPClient] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: Union[bool, str] = True,
+    ):
+        """Initialize AsyncFunctions.
+
+        Args:
+            http_client: Async HTTP client for making ZipTax requests
+            config: Configuration object
+            taxcloud_http_client: Optional async HTTP client for TaxCloud requests
+            max_retries: Maximum number of retry attempts
+            retry_delay: Delay between retries in seconds
+            retry_max_delay: Upper bound on the backoff delay in seconds
+            retry_jitter: Whether to randomize backoff delays so concurrent
+                clients do not retry in lockstep; pass ``"decorrelated"`` for
+                decorrelated jitter
+        """
+        super().__init__(
+            http_client,
+            config,
+            taxcloud_http_client,
+            max_retries,
+            retry_delay,
+            retry_max_delay,
+            retry_jitter,
+        )
+        self._inflight = AsyncSingleFlight()
+
+        # Apply the retry policy once per instance; see Functions.__init__
+        retried = async_retry_with_backoff(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=retry_max_delay,
+            jitter=retry_jitter,
+            breaker=self._breaker_zt,
+        )(_send)
+        self._send_zt = partial(retried, http_client)
+        retried = async_retry_with_backoff(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=retry_max_delay,
+            jitter=retry_jitter,
+            breaker=self._breaker_tc,
+        )(_send)
+        self._send_tc = partial(retried, taxcloud_http_client)
+
+    @staticmethod
+    async def _fan_out(
+        func: Callable[[K], Awaitable[T]],
+        keys: List[K],
+        max_concurrency: Optional[int],
+    ) -> List[T]:
+        """Await ``func`` for every key concurrently.
+
+        If any call raises, the calls still running are cancelled before the
+        error propagates, so no request (e.g. an order creation) keeps going
+        after the batch has failed.
+
+        Args:
+            func: Coroutine function to call with each key
+            keys: Keys to process
+            max_concurrency: Maximum number of calls in flight at once, or
+                None for no limit
+
+        Returns:
+            Results in the same order as ``keys``
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        call = func
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                raise ValueError("max_concurrency must be at least 1")
+
+            # Bound in-flight requests so a large batch does not trip rate limits
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _bounded(key: K) -> T:
+                async with semaphore:
+                    return await func(key)
+
+            call = _bounded
+
+        tasks = [asyncio.ensure_future(call(key)) for key in keys]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations so no task outlives the batch
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _cached_lookup(
+        self, cache_key: Hashable, model: Type[M], params: Dict[str, Any]
+    ) -> M:
+        """Run a v60 rate lookup through the cache and request coalescing.
+
+        See :meth:`Functions._cached_lookup`.
+        """
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("cache hit %r", cache_key)
+            return model.model_validate_json(cached)
+
+        parsed: List[M] = []
+
+        # Make request with retry logic
+        async def _fetch() -> bytes:
+            data = await self._send_zt("get_bytes", "/request/v60/", params=params)
+            # Validate before caching so a malformed body is never stored
+            parsed.append(model.model_validate_json(data))
+            self._cache.set(cache_key, data)
+            return data
+
+        # Concurrent callers for the same lookup share one request
+        data = await self._inflight.do(cache_key, _fetch)
+
+        # The caller that issued the request keeps the model it validated
+        return parsed[0] if parsed else model.model_validate_json(data)
+
+    async def GetSalesTaxByAddress(
+        self,
+        address: str,
+        taxability_code: Optional[str] = None,
+        country_code: str = "USA",
+        historical: Optional[str] = None,
+        format: str = "json",
+    ) -> V60Response:
+        """Get sales tax rates by address.
+
+        Args:
+            address: Full or partial street address for geocoding
+            taxability_code: Optional taxability code
+            country_code: Country code (default: "USA")
+            historical: Historical date for rates (YYYYMM format, e.g. "202401")
+            format: Response format (default: "json")
+
+        Returns:
+            V60Response object with tax rate information
+
+        Raises:
+            ZipTaxValidationError: If input parameters are invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate inputs
+        validate_address_request(address, country_code, historical, format)
+
+        return await self._get_sales_tax_by_address(
+            address, taxability_code, country_code, historical, format
+        )
+
+    async def _get_sales_tax_by_address(
+        self,
+        address: str,
+        taxability_code: Optional[str],
+        country_code: str,
+        historical: Optional[str],
+        format: str,
+    ) -> V60Response:
+        """Look up rates by address; the caller has validated the inputs."""
+        # Build query parameters
+        params: Dict[str, Any] = {
+            "address": address,
+            "countryCode": country_code,
+            "format": format,
+        }
+
+        if taxability_code:
+            params["taxabilityCode"] = taxability_code
+
+        if historical:
+            params["historical"] = historical
+
+        # Serve repeated lookups from the cache. The key uses the
+        # whitespace-normalized address and only the parameters actually sent,
+        # so trivially different spellings of one lookup share an entry.
+        cache_key = (
+            "address",
+            _address_key(address),
+            params.get("taxabilityCode"),
+            country_code,
+            params.get("historical"),
+            format,
+        )
+        return await self._cached_lookup(cache_key, V60Response, params)
+
+    async def GetSalesTaxByAddresses(
+        self,
+        addresses: List[str],
+        taxability_code: Optional[str] = None,
+        country_code: str = "USA",
+        historical: Optional[str] = None,
+        format: str = "json",
+        max_concurrency: Optional[int] = None,
+    ) -> List[V60Response]:
+        """Get sales tax rates for multiple addresses concurrently.
+
+        Duplicate addresses are only requested once.
+
+        Args:
+            addresses: List of full or partial street addresses
+            taxability_code: Optional taxability code applied to every lookup
+            country_code: Country code (default: "USA")
+            historical: Historical date for rates (YYYYMM format, e.g. "202401")
+            format: Response format (default: "json")
+            max_concurrency: Maximum number of requests in flight at once
+                (default: no limit)
+
+        Returns:
+            List of V60Response objects, in the same order as ``addresses``
+
+        Raises:
+            ZipTaxValidationError: If any input parameter is invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate all inputs before issuing any request
+        for address in addresses:
+            validate_address_request(address, country_code, historical, format)
+
+        # Addresses differing only in whitespace share one lookup
+        keys = [_address_key(address) for address in addresses]
+        unique_addresses: Dict[str, str] = {}
+        for key, address in zip(keys, addresses):
+            unique_addresses.setdefault(key, address)
+
+        responses = await self._fan_out(
+            lambda address: self._get_sales_tax_by_address(
+                address, taxability_code, country_code, historical, format
+            ),
+            list(unique_addresses.values()),
+            max_concurrency,
+        )
+        results = dict(zip(unique_addresses, responses))
+
+        return _by_position(keys, results)
+
+    async def GetSalesTaxByGeoLocation(
+        self,
+        lat: str,
+        lng: str,
+        country_code: str = "USA",
+        historical: Optional[str] = None,
+        format: str = "json",
+    ) -> V60Response:
+        """Get sales tax rates by geolocation.
+
+        Args:
+            lat: Latitude for geolocation
+            lng: Longitude for geolocation
+            country_code: Country code (default: "USA")
+            historical: Historical date for rates (YYYYMM format, e.g. "202401")
+            format: Response format (default: "json")
+
+        Returns:
+            V60Response object with tax rate information
+
+        Raises:
+            ZipTaxValidationError: If input parameters are invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate inputs
+        validate_geolocation_request(lat, lng, country_code, historical, format)
+
+        # Build query parameters
+        params: Dict[str, Any] = {
+            "lat": lat,
+            "lng": lng,
+            "countryCode": country_code,
+            "format": format,
+        }
+
+        if historical:
+            params["historical"] = historical
+
+        # Serve repeated lookups from the cache
+        cache_key = ("geolocation", lat, lng, country_code, historical, format)
+        return await self._cached_lookup(cache_key, V60Response, params)
+
+    async def GetAccountMetrics(self, key: Optional[str] = None) -> V60AccountMetrics:
+        """Get account metrics.
+
+        Args:
+            key: Optional API key parameter
+
+        Returns:
+            V60AccountMetrics object with account metrics
+
+        Raises:
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Build query parameters
+        params: Dict[str, Any] = {}
+        if key:
+            params["key"] = key
+
+        # Make request with retry logic
+        response_data = await self._send_zt(
+            "get_bytes", "/account/v60/metrics", params=params
+        )
+        return V60AccountMetrics.model_validate_json(response_data)
+
+    async def GetRatesByPostalCode(
+        self,
+        postal_code: str,
+        format: str = "json",
+    ) -> V60PostalCodeResponse:
+        """Get sales tax rates by US postal code.
+
+        Args:
+            postal_code: US postal code (5-digit format, e.g., "92694")
+            format: Response format (default: "json")
+
+        Returns:
+            V60PostalCodeResponse object with tax rate information for all locations
+            within the postal code
+
+        Raises:
+            ZipTaxValidationError: If input parameters are invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate inputs
+        validate_postal_code_request(postal_code, format)
+
+        return await self._get_rates_by_postal_code(postal_code, format)
+
+    async def _get_rates_by_postal_code(
+        self, postal_code: str, format: str
+    ) -> V60PostalCodeResponse:
+        """Look up rates by postal code; the caller has validated the inputs."""
+        # Build query parameters
+        params: Dict[str, Any] = {
+            "postalcode": postal_code,
+            "format": format,
+        }
+
+        # Serve repeated lookups from the cache
+        cache_key = ("postalcode", postal_code, format)
+        return await self._cached_lookup(cache_key, V60PostalCodeResponse, params)
+
+    async def GetRatesByPostalCodes(
+        self,
+        postal_codes: List[str],
+        format: str = "json",
+        max_concurrency: Optional[int] = None,
+    ) -> List[V60PostalCodeResponse]:
+        """Get sales tax rates for multiple US postal codes concurrently.
+
+        Duplicate postal codes are only requested once.
+
+        Args:
+            postal_codes: List of US postal codes (5-digit format)
+            format: Response format (default: "json")
+            max_concurrency: Maximum number of requests in flight at once
+                (default: no limit)
+
+        Returns:
+            List of V60PostalCodeResponse objects, in the same order as
+            ``postal_codes``
+
+        Raises:
+            ZipTaxValidationError: If any postal code is invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate all inputs before issuing any request
+        for postal_code in postal_codes:
+            validate_postal_code(postal_code)
+        validate_format(format)
+
+        unique_codes = list(dict.fromkeys(postal_codes))
+        responses = await self._fan_out(
+            lambda code: self._get_rates_by_postal_code(code, format),
+            unique_codes,
+            max_concurrency,
+        )
+        results = dict(zip(unique_codes, responses))
+
+        return _by_position(postal_codes, results)
+
+    # =========================================================================
+    # Product Code (TIC) Search
+    # =========================================================================
+
+    async def SearchProductCodes(
+        self,
+        query: str,
+    ) -> ProductCodeSearchResponse:
+        """Search for product codes (TICs) by natural language description.
+
+        Args:
+            query: Natural language product description
+                (e.g., "baked goods sold in plastic packaging")
+
+        Returns:
+            ProductCodeSearchResponse with ranked search results
+
+        Raises:
+            ZipTaxValidationError: If query is empty or invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate inputs
+        validate_product_query(query)
+
+        # Make request with retry logic
+        response_data = await self._send_zt(
+            "post_bytes", "/search/tic", content=dumps({"query": query})
+        )
+        return ProductCodeSearchResponse.model_validate_json(response_data)
+
+    async def RecommendProductCode(
+        self,
+        query: str,
+    ) -> ProductCodeRecommendationResponse:
+        """Get an AI-powered product code (TIC) recommendation.
+
+        Args:
+            query: Natural language product description
+                (e.g., "baked goods sold in plastic packaging")
+
+        Returns:
+            ProductCodeRecommendationResponse with AI-powered recommendation
+
+        Raises:
+            ZipTaxValidationError: If query is empty or invalid
+            ZipTaxAPIError: If the API returns an error
+        """
+        # Validate inputs
+        validate_product_query(query)
+
+        # Make request with retry logic
+        response_data = await self._send_zt(
+            "post_bytes", "/search/tic/recommend", content=dumps({"query": query})
+        )
+        return ProductCodeRecommendationResponse.model_validate_json(response_data)
+
+    # =========================================================================
+    # Cart Tax Calculation (Dual API Routing)
+    # =========================================================================
+
+    async def CalculateCart(
+        self,
+        request: CalculateCartRequest,
+    ) -> Union[CalculateCartResponse, TaxCloudCalculateCartResponse]:
+        """Calculate sales tax for a shopping cart with multiple line items.
+
+        Routes to TaxCloud API when TaxCloud credentials are configured,
+        otherwise uses the ZipTax API.
+
+        Args:
+            request: CalculateCartRequest object with cart details including
+                customer ID, addresses, currency, and line items
+
+        Returns:
+            CalculateCartResponse when using ZipTax API, or
+            TaxCloudCalculateCartResponse when using TaxCloud API
+
+        Raises:
+            ZipTaxAPIError: If the API returns an error
+            ZipTaxValidationError: If address parsing fails (TaxCloud route)
+        """
+        # Route to TaxCloud if configured
+        if self._use_taxcloud:
+            return await self._calculate_cart_taxcloud(request)
+
+        return await self._calculate_cart_ziptax(request)
+
+    async def CalculateCarts(
+        self,
+        requests: List[CalculateCartRequest],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[CalculateCartResponse, TaxCloudCalculateCartResponse]]:
+        """Calculate sales tax for multiple shopping carts concurrently.
+
+        Each cart is routed exactly as :meth:`CalculateCart` would route it.
+
+        Args:
+            requests: List of CalculateCartRequest objects
+            max_concurrency: Maximum number of requests in flight at once
+                (default: no limit)
+
+        Returns:
+            List of cart responses, in the same order as ``requests``
+
+        Raises:
+            ZipTaxAPIError: If the API returns an error for any cart
+            ZipTaxValidationError: If address parsing fails (TaxCloud route)
+        """
+        if self._use_taxcloud:
+            # Parse every cart's addresses up front, before any request is sent
+            bodies = self._transform_carts_for_taxcloud(requests)
+            return await self._fan_out(
+                self._post_cart_taxcloud, bodies, max_concurrency
+            )
+
+        return await self._fan_out(
+            self._calculate_cart_ziptax, requests, max_concurrency
+        )
+
+    async def _calculate_cart_ziptax(
+        self,
+        request: CalculateCartRequest,
+    ) -> CalculateCartResponse:
+        """Send cart calculation request to ZipTax API.
+
+        Args:
+            request: CalculateCartRequest object
+
+        Returns:
+            CalculateCartResponse with per-item tax calculations
+        """
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
+
+        response_data = await self._send_zt(
+            "post_bytes", "/calculate/cart", content=request_body
+        )
+        return CalculateCartResponse.model_validate_json(response_data)
+
+    async def _calculate_cart_taxcloud(
+        self,
+        request: CalculateCartRequest,
+    ) -> TaxCloudCalculateCartResponse:
+        """Transform and send cart calculation request to TaxCloud API.
+
+        Args:
+            request: CalculateCartRequest object
+
+        Returns:
+            TaxCloudCalculateCartResponse with TaxCloud-style results
+
+        Raises:
+            ZipTaxValidationError: If address parsing fails
+        """
+        return await self._post_cart_taxcloud(
+            self._transform_cart_for_taxcloud(request)
+        )
+
+    async def _post_cart_taxcloud(
+        self,
+        body: Dict[str, Any],
+    ) -> TaxCloudCalculateCartResponse:
+        """Send a transformed cart to the TaxCloud API.
+
+        Args:
+            body: Cart in TaxCloud's request format
+
+        Returns:
+            TaxCloudCalculateCartResponse with TaxCloud-style results
+        """
+        # Encode once, so retries resend the same bytes instead of
+        # re-serializing the dict
+        request_body = dumps(body)
+
+        path = self._tc_carts_path
+
+        response_data = await self._send_tc("post_bytes", path, content=request_body)
+        return TaxCloudCalculateCartResponse.model_validate_json(response_data)
+
+    # =========================================================================
+    # TaxCloud API - Order Management Functions
+    # =========================================================================
+
+    async def CreateOrder(
+        self,
+        request: CreateOrderRequest,
+        address_autocomplete: str = "none",
+    ) -> OrderResponse:
+        """Create an order in TaxCloud.
+
+        Args:
+            request: CreateOrderRequest object with order details
+            address_autocomplete: Address autocomplete option (default: "none")
+                Options: "none", "origin", "destination", "all"
+
+        Returns:
+            OrderResponse object with created order details
+
+        Raises:
+            ZipTaxValidationError: If address_autocomplete value is invalid
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error
+        """
+        self._check_taxcloud_config()
+
+        # Validate inputs
+        validate_address_autocomplete(address_autocomplete)
+
+        # Build query parameters
+        params: Dict[str, Any] = {}
+        if address_autocomplete != "none":
+            params["addressAutocomplete"] = address_autocomplete
+
+        path = self._tc_orders_path
+
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
+
+        # Make request with retry logic
+        response_data = await self._send_tc(
+            "post_bytes", path, content=request_body, params=params
+        )
+        return OrderResponse.model_validate_json(response_data)
+
+    @overload
+    async def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_concurrency: Optional[int] = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[OrderResponse]: ...
+
+    @overload
+    async def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_concurrency: Optional[int] = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    @overload
+    async def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_concurrency: Optional[int] = ...,
+        return_exceptions: bool = ...,
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    async def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = "none",
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Union[List[OrderResponse], List[Union[OrderResponse, ZipTaxError]]]:
+        """Create multiple orders in TaxCloud.
+
+        Orders are sent concurrently.
+
+        Args:
+            requests: List of CreateOrderRequest objects
+            address_autocomplete: Address autocomplete option applied to every
+                order (default: "none")
+            max_concurrency: Maximum number of requests in flight at once
+                (default: no limit)
+            return_exceptions: If True, an order that fails is returned as its
+                ZipTaxError in place of an OrderResponse instead of raising,
+                so one failure does not hide the outcome of the others
+
+        Returns:
+            List of OrderResponse objects (or errors, see
+            ``return_exceptions``), in the same order as ``requests``
+
+        Raises:
+            ZipTaxValidationError: If address_autocomplete value is invalid
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error and
+                ``return_exceptions`` is False
+        """
+        self._check_taxcloud_config()
+        validate_address_autocomplete(address_autocomplete)
+
+        async def _create(
+            request: CreateOrderRequest,
+        ) -> Union[OrderResponse, ZipTaxError]:
+            try:
+                return await self.CreateOrder(
+                    request, address_autocomplete=address_autocomplete
+                )
+            except ZipTaxError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return await self._fan_out(_create, requests, max_concurrency)
+
+    async def GetOrder(self, order_id: str) -> OrderResponse:
+        """Retrieve an order from TaxCloud by ID.
+
+        Args:
+            order_id: The ID of the order to retrieve
+
+        Returns:
+            OrderResponse object with order details
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error
+        """
+        self._check_taxcloud_config()
+
+        # Build path with order ID
+        path = self._tc_order_prefix + order_id
+
+        # Make request with retry logic
+        response_data = await self._send_tc("get_bytes", path)
+        return OrderResponse.model_validate_json(response_data)
+
+    @overload
+    async def GetOrders(
+        self,
+        order_ids: List[str],
+        max_concurrency: Optional[int] = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[OrderResponse]: ...
+
+    @overload
+    async def GetOrders(
+        self,
+        order_ids: List[str],
+        max_concurrency: Optional[int] = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    @overload
+    async def GetOrders(
+        self,
+        order_ids: List[str],
+        max_concurrency: Optional[int] = ...,
+        return_exceptions: bool = ...,
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    async def GetOrders(
+        self,
+        order_ids: List[str],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Union[List[OrderResponse], List[Union[OrderResponse, ZipTaxError]]]:
+        """Retrieve multiple orders from TaxCloud by ID.
+
+        Orders are fetched concurrently.
+
+        Args:
+            order_ids: IDs of the orders to retrieve
+            max_concurrency: Maximum number of requests in flight at once
+                (default: no limit)
+            return_exceptions: If True, an order that cannot be retrieved is
+                returned as its ZipTaxError instead of raising
+
+        Returns:
+            List of OrderResponse objects (or errors, see
+            ``return_exceptions``), in the same order as ``order_ids``
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error and
+                ``return_exceptions`` is False
+        """
+        self._check_taxcloud_config()
+
+        async def _get(order_id: str) -> Union[OrderResponse, ZipTaxError]:
+            try:
+                return await self.GetOrder(order_id)
+            except ZipTaxError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return await self._fan_out(_get, order_ids, max_concurrency)
+
+    async def UpdateOrder(
+        self,
+        order_id: str,
+        request: UpdateOrderRequest,
+    ) -> OrderResponse:
+        """Update an existing order's completedDate in TaxCloud.
+
+        Args:
+            order_id: The ID of the order to update
+            request: UpdateOrderRequest object with updated completedDate
+
+        Returns:
+            OrderResponse object with updated order details
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error
+        """
+        self._check_taxcloud_config()
+
+        # Build path with order ID
+        path = self._tc_order_prefix + order_id
+
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
+
+        # Make request with retry logic
+        response_data = await self._send_tc("patch_bytes", path, content=request_body)
+        return OrderResponse.model_validate_json(response_data)
+
+    async def RefundOrder(
+        self,
+        order_id: str,
+        request: Optional[RefundTransactionRequest] = None,
+    ) -> List[RefundTransactionResponse]:
+        """Create a refund against an order in TaxCloud.
+
+        Args:
+            order_id: The ID of the order to refund
+            request: Optional RefundTransactionRequest with items to refund.
+                If None or items is empty, entire order will be refunded.
+
+        Returns:
+            List of RefundTransactionResponse objects
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error
+        """
+        self._check_taxcloud_config()
+
+        # Build path with order ID
+        path = self._tc_refunds_path + order_id
+
+        # Prepare request body
+        request_body = b"{}"
+        if request:
+            request_body = request.model_dump_json(
+                by_alias=True, exclude_none=True
+            ).encode()
+
+        # Make request with retry logic
+        response_data = await self._send_tc("post_bytes", path, content=request_body)
+
+        # API may return a single object or a list of objects
+        refunds = _REFUND_RESPONSES_ADAPTER.validate_json(response_data)
+        if isinstance(refunds, RefundTransactionResponse):
+            return [refunds]
+
+        return refunds
+
+    async def CreateOrderFromCart(
+        self,
+        request: CreateOrderFromCartRequest,
+    ) -> OrderResponse:
+        """Create an order from a previously calculated cart in TaxCloud.
+
+        Args:
+            request: CreateOrderFromCartRequest object with cart_id and order_id
+
+        Returns:
+            OrderResponse object with created order details
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error
+        """
+        self._check_taxcloud_config()
+
+        path = self._tc_cart_orders_path
+
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
+
+        # Make request with retry logic
+        response_data = await self._send_tc("post_bytes", path, content=request_body)
+        return OrderResponse.model_validate_json(response_data)
@@ -1,13 +1,33 @@
 """API functions for the ZipTax SDK."""
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter
 
 from ..config import Config
-from ..exceptions import ZipTaxCloudConfigError
+from ..exceptions import ZipTaxCloudConfigError, ZipTaxError
 from ..models import (
     CalculateCartRequest,
     CalculateCartResponse,
+    CartAddress,
+    CartItem,
     CreateOrderFromCartRequest,
     CreateOrderRequest,
     OrderResponse,
@@ -21,35 +41,125 @@ from ..models import (
     V60PostalCodeResponse,
     V60Response,
 )
+from ..utils.cache import TTLCache
+from ..utils.circuit import CircuitBreaker
 from ..utils.http import HTTPClient
 from ..utils.retry import retry_with_backoff
+from ..utils.serialization import dumps
+from ..utils.singleflight import SingleFlight
 from ..utils.validation import (
-    parse_address_string,
-    validate_address,
+    parse_address_strings,
     validate_address_autocomplete,
-    validate_coordinates,
-    validate_country_code,
+    validate_address_request,
     validate_format,
-    validate_historical_date,
+    validate_geolocation_request,
     validate_postal_code,
+    validate_postal_code_request,
     validate_product_query,
 )
 
 logger = logging.getLogger(__name__)
 
+K = TypeVar("K")
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
-class Functions:
-    """Functions class for ZipTax API endpoints."""
+# RefundOrder responses may be a single object or a list of objects
+_REFUND_RESPONSES_ADAPTER: TypeAdapter[
+    Union[List[RefundTransactionResponse], RefundTransactionResponse]
+] = TypeAdapter(Union[List[RefundTransactionResponse], RefundTransactionResponse])
+
+
+# HTTP client methods an endpoint may send through; typed so mypy rejects a
+# misspelled method name at the call site
+_Method = Literal["get_bytes", "post_bytes", "patch_bytes"]
+
+
+class _Sender(Protocol):
+    """Retried sender bound to one HTTP client (``_send_zt``/``_send_tc``)."""
+
+    def __call__(self, method: _Method, path: str, **kwargs: Any) -> bytes: ...
+
+
+def _send(client: Any, method: _Method, path: str, **kwargs: Any) -> Any:
+    """Call the HTTP client method named ``method`` (e.g. ``"get_bytes"``)."""
+    return getattr(client, method)(path, **kwargs)
+
+
+def _by_position(keys: List[K], results: Dict[K, M]) -> List[M]:
+    """Map deduplicated batch results back onto the input positions.
+
+    Repeated inputs are fetched once; every later position receives a deep
+    copy, so mutating one result cannot change another.
+    """
+    seen: Set[K] = set()
+    responses: List[M] = []
+    for key in keys:
+        response = results[key]
+        if key in seen:
+            response = response.model_copy(deep=True)
+        seen.add(key)
+        responses.append(response)
+
+    return responses
+
+
+def _address_key(address: str) -> str:
+    """Normalize whitespace in an address for use as a lookup key."""
+    return " ".join(address.split())
+
+
+def _same_address(first: str, second: str) -> bool:
+    """Check whether two address strings differ only in case or whitespace."""
+    return first == second or (
+        _address_key(first).casefold() == _address_key(second).casefold()
+    )
+
+
+def _reuses_destination(cart_item: CartItem) -> bool:
+    """Check whether a cart item's origin string repeats its destination."""
+    return cart_item.origin.structured is None and _same_address(
+        cart_item.origin.address, cart_item.destination.address
+    )
+
+
+class _FunctionsBase:
+    """State and helpers shared by :class:`Functions` and ``AsyncFunctions``."""
+
+    # Endpoint objects are long-lived and may be created per tenant; slots
+    # drop the per-instance __dict__ and make attribute loads cheaper
+    __slots__ = (
+        "http_client",
+        "taxcloud_http_client",
+        "config",
+        "max_retries",
+        "retry_delay",
+        "retry_max_delay",
+        "retry_jitter",
+        "_cache",
+        "_breaker_zt",
+        "_breaker_tc",
+        "_send_zt",
+        "_send_tc",
+        "_use_taxcloud",
+        "_tc_orders_path",
+        "_tc_order_prefix",
+        "_tc_refunds_path",
+        "_tc_carts_path",
+        "_tc_cart_orders_path",
+    )
 
     def __init__(
         self,
-        http_client: HTTPClient,
+        http_client: Any,
         config: Config,
-        taxcloud_http_client: Optional[HTTPClient] = None,
+        taxcloud_http_client: Optional[Any] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: Union[bool, str] = True,
     ):
-        """Initialize Functions.
+        """Initialize shared endpoint state.
 
         Args:
             http_client: HTTP client for making ZipTax requests
@@ -57,12 +167,262 @@ class Functions:
             taxcloud_http_client: Optional HTTP client for TaxCloud requests
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            retry_max_delay: Upper bound on the backoff delay in seconds
+            retry_jitter: Whether to randomize backoff delays so concurrent
+                clients do not retry in lockstep; pass ``"decorrelated"`` for
+                decorrelated jitter
         """
         self.http_client = http_client
         self.taxcloud_http_client = taxcloud_http_client
         self.config = config
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
+        self._cache = TTLCache(maxsize=config.cache_maxsize, ttl=config.cache_ttl)
+
+        # One circuit breaker per upstream host so an outage fails fast
+        self._breaker_zt = CircuitBreaker(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_time=config.circuit_recovery_time,
+            name=config.base_url,
+        )
+        self._breaker_tc = CircuitBreaker(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_time=config.circuit_recovery_time,
+            name=config.taxcloud_base_url,
+        )
+
+        # TaxCloud credentials and client are fixed per instance, so decide once
+        self._use_taxcloud = bool(
+            config.has_taxcloud_config and taxcloud_http_client is not None
+        )
+
+        # Precompute TaxCloud paths once; the connection ID is fixed per client
+        tc_base = f"/tax/connections/{config.taxcloud_connection_id}"
+        self._tc_orders_path = tc_base + "/orders"
+        self._tc_order_prefix = tc_base + "/orders/"
+        self._tc_refunds_path = tc_base + "/orders/refunds/"
+        self._tc_carts_path = tc_base + "/carts"
+        self._tc_cart_orders_path = tc_base + "/carts/orders"
+
+    def cache_clear(self) -> None:
+        """Clear cached rate lookups."""
+        self._cache.clear()
+
+    def _check_taxcloud_config(self) -> None:
+        """Check if TaxCloud credentials are configured.
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials are not configured
+        """
+        if not self._use_taxcloud:
+            raise ZipTaxCloudConfigError(
+                "TaxCloud credentials not configured. Please provide "
+                "taxcloud_connection_id and taxcloud_api_key when creating the client."
+            )
+
+    @staticmethod
+    def _transform_carts_for_taxcloud(
+        requests: List[CalculateCartRequest],
+    ) -> List[Dict[str, Any]]:
+        """Transform CalculateCartRequests into TaxCloud's request format.
+
+        Args:
+            requests: CalculateCartRequests with ZipTax-style addresses
+
+        Returns:
+            One dictionary per request, matching TaxCloud's request body schema
+
+        Raises:
+            ZipTaxValidationError: If any address string cannot be parsed
+        """
+        cart_items = [cart_item for request in requests for cart_item in request.items]
+
+        # Parse single-string addresses into structured components (unless
+        # the caller supplied them) in one batch, so an address shared by
+        # several carts, e.g. a warehouse origin, is parsed once. Pickup and
+        # walk-in carts repeat the destination as the origin; that origin is
+        # not parsed at all.
+        pending = []
+        for cart_item in cart_items:
+            if cart_item.destination.structured is None:
+                pending.append(cart_item.destination.address)
+            if cart_item.origin.structured is None and not _reuses_destination(
+                cart_item
+            ):
+                pending.append(cart_item.origin.address)
+        parsed = iter(parse_address_strings(pending))
+
+        def _components(address: CartAddress) -> Dict[str, Any]:
+            if address.structured is not None:
+                return address.structured.model_dump(by_alias=True, exclude_none=True)
+            return next(parsed)
+
+        # Transform line items: add index, map taxabilityCode -> tic
+        bodies = []
+        for request in requests:
+            items = []
+            for cart_item in request.items:
+                destination = _components(cart_item.destination)
+                if _reuses_destination(cart_item):
+                    origin = dict(destination)
+                else:
+                    origin = _components(cart_item.origin)
+
+                items.append(
+                    {
+                        "customerId": cart_item.customer_id,
+                        "currency": {
+                            "currencyCode": cart_item.currency.currency_code,
+                        },
+                        "destination": destination,
+                        "origin": origin,
+                        "lineItems": [
+                            {
+                                "index": idx,
+                                "itemId": line_item.item_id,
+                                "price": line_item.price,
+                                "quantity": line_item.quantity,
+                                # taxabilityCode is an int; None maps to tic 0
+                                "tic": line_item.taxability_code or 0,
+                            }
+                            for idx, line_item in enumerate(cart_item.line_items)
+                        ],
+                    }
+                )
+            bodies.append({"items": items})
+
+        return bodies
+
+    @staticmethod
+    def _transform_cart_for_taxcloud(
+        request: CalculateCartRequest,
+    ) -> Dict[str, Any]:
+        """Transform a CalculateCartRequest into TaxCloud's request format.
+
+        Args:
+            request: CalculateCartRequest with ZipTax-style addresses
+
+        Returns:
+            Dictionary matching TaxCloud's expected request body schema
+
+        Raises:
+            ZipTaxValidationError: If address string cannot be parsed
+        """
+        return _FunctionsBase._transform_carts_for_taxcloud([request])[0]
+
+
+class Functions(_FunctionsBase):
+    """Functions class for ZipTax API endpoints."""
+
+    __slots__ = ("_inflight",)
+
+    http_client: HTTPClient
+    taxcloud_http_client: Optional[HTTPClient]
+    _send_zt: _Sender
+    _send_tc: _Sender
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        config: Config,
+        taxcloud_http_client: Optional[HTTPClient] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: Union[bool, str] = True,
+    ):
+        """Initialize Functions.
+
+        Args:
+            http_client: HTTP client for making ZipTax requests
+            config: Configuration object
+            taxcloud_http_client: Optional HTTP client for TaxCloud requests
+            max_retries: Maximum number of retry attempts
+            retry_delay: Delay between retries in seconds
+            retry_max_delay: Upper bound on the backoff delay in seconds
+            retry_jitter: Whether to randomize backoff delays so concurrent
+                clients do not retry in lockstep; pass ``"decorrelated"`` for
+                decorrelated jitter
+        """
+        super().__init__(
+            http_client,
+            config,
+            taxcloud_http_client,
+            max_retries,
+            retry_delay,
+            retry_max_delay,
+            retry_jitter,
+        )
+        self._inflight = SingleFlight()
+
+        # Apply the retry policy once per instance instead of re-decorating a
+        # request closure on every call; each sender takes (method, path, ...)
+        retried = retry_with_backoff(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=retry_max_delay,
+            jitter=retry_jitter,
+            breaker=self._breaker_zt,
+        )(_send)
+        self._send_zt = partial(retried, http_client)
+        retried = retry_with_backoff(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=retry_max_delay,
+            jitter=retry_jitter,
+            breaker=self._breaker_tc,
+        )(_send)
+        self._send_tc = partial(retried, taxcloud_http_client)
+
+    @staticmethod
+    def _fan_out(func: Callable[[K], T], keys: List[K], max_workers: int) -> List[T]:
+        """Call ``func`` for every key concurrently.
+
+        Args:
+            func: Function to call with each key
+            keys: Keys to process
+            max_workers: Maximum number of worker threads; 1 runs sequentially
+
+        Returns:
+            Results in the same order as ``keys``
+        """
+        if max_workers <= 1 or len(keys) <= 1:
+            return [func(key) for key in keys]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            return list(executor.map(func, keys))
+
+    def _cached_lookup(
+        self, cache_key: Hashable, model: Type[M], params: Dict[str, Any]
+    ) -> M:
+        """Run a v60 rate lookup through the cache and request coalescing.
+
+        The cache and coalesced callers share the raw response body; each
+        caller validates its own model, so mutating a returned response
+        never leaks into another lookup.
+        """
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("cache hit %r", cache_key)
+            return model.model_validate_json(cached)
+
+        parsed: List[M] = []
+
+        # Make request with retry logic
+        def _fetch() -> bytes:
+            data = self._send_zt("get_bytes", "/request/v60/", params=params)
+            # Validate before caching so a malformed body is never stored
+            parsed.append(model.model_validate_json(data))
+            self._cache.set(cache_key, data)
+            return data
+
+        # Concurrent callers for the same lookup share one request
+        data = self._inflight.do(cache_key, _fetch)
+
+        # The caller that issued the request keeps the model it validated
+        return parsed[0] if parsed else model.model_validate_json(data)
 
     def GetSalesTaxByAddress(
         self,
@@ -89,12 +449,21 @@ class Functions:
             ZipTaxAPIError: If the API returns an error
         """
         # Validate inputs
-        validate_address(address)
-        validate_country_code(country_code)
-        if historical:
-            validate_historical_date(historical)
-        validate_format(format)
+        validate_address_request(address, country_code, historical, format)
 
+        return self._get_sales_tax_by_address(
+            address, taxability_code, country_code, historical, format
+        )
+
+    def _get_sales_tax_by_address(
+        self,
+        address: str,
+        taxability_code: Optional[str],
+        country_code: str,
+        historical: Optional[str],
+        format: str,
+    ) -> V60Response:
+        """Look up rates by address; the caller has validated the inputs."""
         # Build query parameters
         params: Dict[str, Any] = {
             "address": address,
@@ -108,16 +477,80 @@ class Functions:
         if historical:
             params["historical"] = historical
 
-        # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        # Serve repeated lookups from the cache. The key uses the
+        # whitespace-normalized address and only the parameters actually sent,
+        # so trivially different spellings of one lookup share an entry.
+        cache_key = (
+            "address",
+            _address_key(address),
+            params.get("taxabilityCode"),
+            country_code,
+            params.get("historical"),
+            format,
+        )
+        return self._cached_lookup(cache_key, V60Response, params)
+
+    def GetSalesTaxByAddresses(
+        self,
+        addresses: List[str],
+        taxability_code: Optional[str] = None,
+        country_code: str = "USA",
+        historical: Optional[str] = None,
+        format: str = "json",
+        max_workers: int = 8,
+    ) -> List[V60Response]:
+        """Get sales tax rates for multiple addresses.
+
+        Lookups are independent, so they are issued concurrently over the
+        shared HTTP client's connection pool (e.g. resolving a cart's origin
+        and destination costs one round-trip of wall-clock time instead of
+        two). Duplicate addresses are only requested once.
+
+        Args:
+            addresses: List of full or partial street addresses
+            taxability_code: Optional taxability code applied to every lookup
+            country_code: Country code (default: "USA")
+            historical: Historical date for rates (YYYYMM format, e.g. "202401")
+            format: Response format (default: "json")
+            max_workers: Maximum number of concurrent requests (default: 8);
+                1 issues the lookups sequentially without extra threads
+
+        Returns:
+            List of V60Response objects, in the same order as ``addresses``
+
+        Raises:
+            ZipTaxValidationError: If any input parameter is invalid
+            ZipTaxAPIError: If the API returns an error
+
+        Example:
+            >>> destination, origin = client.request.GetSalesTaxByAddresses(
+            ...     [
+            ...         "200 Spectrum Center Drive, Irvine, CA 92618",
+            ...         "323 Washington Ave N, Minneapolis, MN 55401",
+            ...     ]
+            ... )
+        """
+        # Validate all inputs before issuing any request
+        for address in addresses:
+            validate_address_request(address, country_code, historical, format)
+
+        # Addresses differing only in whitespace share one lookup, matching
+        # the normalization of the rate cache key
+        keys = [_address_key(address) for address in addresses]
+        unique_addresses: Dict[str, str] = {}
+        for key, address in zip(keys, addresses):
+            unique_addresses.setdefault(key, address)
+
+        responses = self._fan_out(
+            lambda address: self._get_sales_tax_by_address(
+                address, taxability_code, country_code, historical, format
+            ),
+            list(unique_addresses.values()),
+            max_workers,
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.get("/request/v60/", params=params)
+        results = dict(zip(unique_addresses, responses))
 
-        response_data = _make_request()
-        return V60Response(**response_data)
+        return _by_position(keys, results)
 
     def GetSalesTaxByGeoLocation(
         self,
@@ -144,11 +577,7 @@ class Functions:
             ZipTaxAPIError: If the API returns an error
         """
         # Validate inputs
-        validate_coordinates(lat, lng)
-        validate_country_code(country_code)
-        if historical:
-            validate_historical_date(historical)
-        validate_format(format)
+        validate_geolocation_request(lat, lng, country_code, historical, format)
 
         # Build query parameters
         params: Dict[str, Any] = {
@@ -161,16 +590,9 @@ class Functions:
         if historical:
             params["historical"] = historical
 
-        # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.get("/request/v60/", params=params)
-
-        response_data = _make_request()
-        return V60Response(**response_data)
+        # Serve repeated lookups from the cache
+        cache_key = ("geolocation", lat, lng, country_code, historical, format)
+        return self._cached_lookup(cache_key, V60Response, params)
 
     def GetAccountMetrics(self, key: Optional[str] = None) -> V60AccountMetrics:
         """Get account metrics.
@@ -190,15 +612,10 @@ class Functions:
             params["key"] = key
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        response_data = self._send_zt(
+            "get_bytes", "/account/v60/metrics", params=params
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.get("/account/v60/metrics", params=params)
-
-        response_data = _make_request()
-        return V60AccountMetrics(**response_data)
+        return V60AccountMetrics.model_validate_json(response_data)
 
     def GetRatesByPostalCode(
         self,
@@ -220,25 +637,68 @@ class Functions:
             ZipTaxAPIError: If the API returns an error
         """
         # Validate inputs
-        validate_postal_code(postal_code)
-        validate_format(format)
+        validate_postal_code_request(postal_code, format)
 
+        return self._get_rates_by_postal_code(postal_code, format)
+
+    def _get_rates_by_postal_code(
+        self, postal_code: str, format: str
+    ) -> V60PostalCodeResponse:
+        """Look up rates by postal code; the caller has validated the inputs."""
         # Build query parameters
         params: Dict[str, Any] = {
             "postalcode": postal_code,
             "format": format,
         }
 
-        # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        # Serve repeated lookups from the cache
+        cache_key = ("postalcode", postal_code, format)
+        return self._cached_lookup(cache_key, V60PostalCodeResponse, params)
+
+    def GetRatesByPostalCodes(
+        self,
+        postal_codes: List[str],
+        format: str = "json",
+        max_workers: int = 8,
+    ) -> List[V60PostalCodeResponse]:
+        """Get sales tax rates for multiple US postal codes.
+
+        The API has no batch route, so lookups are issued concurrently over
+        the shared HTTP client's connection pool. Duplicate postal codes are
+        only requested once.
+
+        Args:
+            postal_codes: List of US postal codes (5-digit format)
+            format: Response format (default: "json")
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            List of V60PostalCodeResponse objects, in the same order as
+            ``postal_codes``
+
+        Raises:
+            ZipTaxValidationError: If any postal code is invalid
+            ZipTaxAPIError: If the API returns an error
+
+        Example:
+            >>> responses = client.request.GetRatesByPostalCodes(
+            ...     ["92694", "55401"]
+            ... )
+        """
+        # Validate all inputs before issuing any request
+        for postal_code in postal_codes:
+            validate_postal_code(postal_code)
+        validate_format(format)
+
+        unique_codes = list(dict.fromkeys(postal_codes))
+        responses = self._fan_out(
+            lambda code: self._get_rates_by_postal_code(code, format),
+            unique_codes,
+            max_workers,
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.get("/request/v60/", params=params)
+        results = dict(zip(unique_codes, responses))
 
-        response_data = _make_request()
-        return V60PostalCodeResponse(**response_data)
+        return _by_position(postal_codes, results)
 
     # =========================================================================
     # Product Code (TIC) Search
@@ -279,18 +739,10 @@ class Functions:
         validate_product_query(query)
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        response_data = self._send_zt(
+            "post_bytes", "/search/tic", content=dumps({"query": query})
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.post(
-                "/search/tic",
-                json={"query": query},
-            )
-
-        response_data = _make_request()
-        return ProductCodeSearchResponse(**response_data)
+        return ProductCodeSearchResponse.model_validate_json(response_data)
 
     def RecommendProductCode(
         self,
@@ -330,18 +782,10 @@ class Functions:
         validate_product_query(query)
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        response_data = self._send_zt(
+            "post_bytes", "/search/tic/recommend", content=dumps({"query": query})
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.post(
-                "/search/tic/recommend",
-                json={"query": query},
-            )
-
-        response_data = _make_request()
-        return ProductCodeRecommendationResponse(**response_data)
+        return ProductCodeRecommendationResponse.model_validate_json(response_data)
 
     # =========================================================================
     # Cart Tax Calculation (Dual API Routing)
@@ -358,6 +802,10 @@ class Functions:
         is the same regardless of which backend is used. The response type
         differs based on the backend.
 
+        The TaxCloud route needs structured addresses. It parses each
+        ``CartAddress.address`` string unless the address already carries
+        ``structured`` components, which are then used as-is.
+
         Args:
             request: CalculateCartRequest object with cart details including
                 customer ID, addresses, currency, and line items
@@ -399,11 +847,43 @@ class Functions:
             >>> result = client.request.CalculateCart(request)
         """
         # Route to TaxCloud if configured
-        if self.config.has_taxcloud_config and self.taxcloud_http_client is not None:
+        if self._use_taxcloud:
             return self._calculate_cart_taxcloud(request)
 
         return self._calculate_cart_ziptax(request)
 
+    def CalculateCarts(
+        self,
+        requests: List[CalculateCartRequest],
+        max_workers: int = 8,
+    ) -> List[Union[CalculateCartResponse, TaxCloudCalculateCartResponse]]:
+        """Calculate sales tax for multiple shopping carts.
+
+        The cart APIs take one cart per call, so carts are sent concurrently
+        over the shared HTTP client's connection pool. Each cart is routed
+        exactly as :meth:`CalculateCart` would route it.
+
+        Args:
+            requests: List of CalculateCartRequest objects
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            List of cart responses, in the same order as ``requests``
+
+        Raises:
+            ZipTaxAPIError: If the API returns an error for any cart
+            ZipTaxValidationError: If address parsing fails (TaxCloud route)
+
+        Example:
+            >>> results = client.request.CalculateCarts([cart_a, cart_b])
+        """
+        if self._use_taxcloud:
+            # Parse every cart's addresses up front, before any request is sent
+            bodies = self._transform_carts_for_taxcloud(requests)
+            return self._fan_out(self._post_cart_taxcloud, bodies, max_workers)
+
+        return self._fan_out(self._calculate_cart_ziptax, requests, max_workers)
+
     def _calculate_cart_ziptax(
         self,
         request: CalculateCartRequest,
@@ -416,19 +896,15 @@ class Functions:
         Returns:
             CalculateCartResponse with per-item tax calculations
         """
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
 
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        response_data = self._send_zt(
+            "post_bytes", "/calculate/cart", content=request_body
         )
-        def _make_request() -> Dict[str, Any]:
-            return self.http_client.post(
-                "/calculate/cart",
-                json=request.model_dump(by_alias=True, exclude_none=True),
-            )
-
-        response_data = _make_request()
-        return CalculateCartResponse(**response_data)
+        return CalculateCartResponse.model_validate_json(response_data)
 
     def _calculate_cart_taxcloud(
         self,
@@ -450,95 +926,33 @@ class Functions:
         Raises:
             ZipTaxValidationError: If address parsing fails
         """
-        assert self.taxcloud_http_client is not None
+        return self._post_cart_taxcloud(self._transform_cart_for_taxcloud(request))
 
-        # Transform request to TaxCloud format
-        taxcloud_body = self._transform_cart_for_taxcloud(request)
-
-        # Build path with connection ID
-        path = f"/tax/connections/{self.config.taxcloud_connection_id}/carts"
-
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> Dict[str, Any]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.post(
-                path,
-                json=taxcloud_body,
-            )
-
-        response_data = _make_request()
-        return TaxCloudCalculateCartResponse(**response_data)
-
-    @staticmethod
-    def _transform_cart_for_taxcloud(
-        request: CalculateCartRequest,
-    ) -> Dict[str, Any]:
-        """Transform a CalculateCartRequest into TaxCloud's request format.
+    def _post_cart_taxcloud(
+        self,
+        body: Dict[str, Any],
+    ) -> TaxCloudCalculateCartResponse:
+        """Send a transformed cart to the TaxCloud API.
 
         Args:
-            request: CalculateCartRequest with ZipTax-style addresses
+            body: Cart in TaxCloud's request format
 
         Returns:
-            Dictionary matching TaxCloud's expected request body schema
-
-        Raises:
-            ZipTaxValidationError: If address string cannot be parsed
+            TaxCloudCalculateCartResponse with TaxCloud-style results
         """
-        items = []
-        for cart_item in request.items:
-            # Parse addresses from single strings to structured components
-            destination = parse_address_string(cart_item.destination.address)
-            origin = parse_address_string(cart_item.origin.address)
-
-            # Transform line items: add index, map taxabilityCode -> tic
-            line_items = []
-            for idx, line_item in enumerate(cart_item.line_items):
-                tc_line_item: Dict[str, Any] = {
-                    "index": idx,
-                    "itemId": line_item.item_id,
-                    "price": line_item.price,
-                    "quantity": line_item.quantity,
-                    "tic": (
-                        line_item.taxability_code
-                        if line_item.taxability_code is not None
-                        else 0
-                    ),
-                }
-                line_items.append(tc_line_item)
-
-            items.append(
-                {
-                    "customerId": cart_item.customer_id,
-                    "currency": {
-                        "currencyCode": cart_item.currency.currency_code,
-                    },
-                    "destination": destination,
-                    "origin": origin,
-                    "lineItems": line_items,
-                }
-            )
+        # Encode once, so retries resend the same bytes instead of
+        # re-serializing the dict
+        request_body = dumps(body)
+
+        path = self._tc_carts_path
 
-        return {"items": items}
+        response_data = self._send_tc("post_bytes", path, content=request_body)
+        return TaxCloudCalculateCartResponse.model_validate_json(response_data)
 
     # =========================================================================
     # TaxCloud API - Order Management Functions
     # =========================================================================
 
-    def _check_taxcloud_config(self) -> None:
-        """Check if TaxCloud credentials are configured.
-
-        Raises:
-            ZipTaxCloudConfigError: If TaxCloud credentials are not configured
-        """
-        if not self.config.has_taxcloud_config or self.taxcloud_http_client is None:
-            raise ZipTaxCloudConfigError(
-                "TaxCloud credentials not configured. Please provide "
-                "taxcloud_connection_id and taxcloud_api_key when creating the client."
-            )
-
     def CreateOrder(
         self,
         request: CreateOrderRequest,
@@ -604,24 +1018,96 @@ class Functions:
         if address_autocomplete != "none":
             params["addressAutocomplete"] = address_autocomplete
 
-        # Build path with connection ID
-        path = f"/tax/connections/{self.config.taxcloud_connection_id}/orders"
+        path = self._tc_orders_path
+
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
+        response_data = self._send_tc(
+            "post_bytes", path, content=request_body, params=params
         )
-        def _make_request() -> Dict[str, Any]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.post(
-                path,
-                json=request.model_dump(by_alias=True, exclude_none=True),
-                params=params,
-            )
+        return OrderResponse.model_validate_json(response_data)
+
+    @overload
+    def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_workers: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[OrderResponse]: ...
+
+    @overload
+    def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_workers: int = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    @overload
+    def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = ...,
+        max_workers: int = ...,
+        return_exceptions: bool = ...,
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    def CreateOrders(
+        self,
+        requests: List[CreateOrderRequest],
+        address_autocomplete: str = "none",
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> Union[List[OrderResponse], List[Union[OrderResponse, ZipTaxError]]]:
+        """Create multiple orders in TaxCloud.
+
+        Orders are sent concurrently over the shared TaxCloud connection pool.
+
+        Args:
+            requests: List of CreateOrderRequest objects
+            address_autocomplete: Address autocomplete option applied to every
+                order (default: "none")
+            max_workers: Maximum number of concurrent requests (default: 8)
+            return_exceptions: If True, an order that fails is returned as its
+                ZipTaxError in place of an OrderResponse instead of raising,
+                so one failure does not hide the outcome of the others
+
+        Returns:
+            List of OrderResponse objects (or errors, see
+            ``return_exceptions``), in the same order as ``requests``
+
+        Raises:
+            ZipTaxValidationError: If address_autocomplete value is invalid
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error and
+                ``return_exceptions`` is False
+
+        Example:
+            >>> orders = client.request.CreateOrders(
+            ...     [request_a, request_b], return_exceptions=True
+            ... )
+        """
+        self._check_taxcloud_config()
+        validate_address_autocomplete(address_autocomplete)
 
-        response_data = _make_request()
-        return OrderResponse(**response_data)
+        def _create(request: CreateOrderRequest) -> Union[OrderResponse, ZipTaxError]:
+            try:
+                return self.CreateOrder(
+                    request, address_autocomplete=address_autocomplete
+                )
+            except ZipTaxError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return self._fan_out(_create, requests, max_workers)
 
     def GetOrder(self, order_id: str) -> OrderResponse:
         """Retrieve an order from TaxCloud by ID.
@@ -641,22 +1127,78 @@ class Functions:
         """
         self._check_taxcloud_config()
 
-        # Build path with connection ID and order ID
-        path = (
-            f"/tax/connections/{self.config.taxcloud_connection_id}/orders/{order_id}"
-        )
+        # Build path with order ID
+        path = self._tc_order_prefix + order_id
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> Dict[str, Any]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.get(path)
+        response_data = self._send_tc("get_bytes", path)
+        return OrderResponse.model_validate_json(response_data)
+
+    @overload
+    def GetOrders(
+        self,
+        order_ids: List[str],
+        max_workers: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[OrderResponse]: ...
+
+    @overload
+    def GetOrders(
+        self,
+        order_ids: List[str],
+        max_workers: int = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    @overload
+    def GetOrders(
+        self,
+        order_ids: List[str],
+        max_workers: int = ...,
+        return_exceptions: bool = ...,
+    ) -> List[Union[OrderResponse, ZipTaxError]]: ...
+
+    def GetOrders(
+        self,
+        order_ids: List[str],
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> Union[List[OrderResponse], List[Union[OrderResponse, ZipTaxError]]]:
+        """Retrieve multiple orders from TaxCloud by ID.
+
+        Orders are fetched concurrently over the shared TaxCloud connection
+        pool.
+
+        Args:
+            order_ids: IDs of the orders to retrieve
+            max_workers: Maximum number of concurrent requests (default: 8)
+            return_exceptions: If True, an order that cannot be retrieved is
+                returned as its ZipTaxError instead of raising
+
+        Returns:
+            List of OrderResponse objects (or errors, see
+            ``return_exceptions``), in the same order as ``order_ids``
+
+        Raises:
+            ZipTaxCloudConfigError: If TaxCloud credentials not configured
+            ZipTaxAPIError: If the API returns an error and
+                ``return_exceptions`` is False
+
+        Example:
+            >>> orders = client.request.GetOrders(["my-order-1", "my-order-2"])
+        """
+        self._check_taxcloud_config()
 
-        response_data = _make_request()
-        return OrderResponse(**response_data)
+        def _get(order_id: str) -> Union[OrderResponse, ZipTaxError]:
+            try:
+                return self.GetOrder(order_id)
+            except ZipTaxError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return self._fan_out(_get, order_ids, max_workers)
 
     def UpdateOrder(
         self,
@@ -685,24 +1227,17 @@ class Functions:
         """
         self._check_taxcloud_config()
 
-        # Build path with connection ID and order ID
-        path = (
-            f"/tax/connections/{self.config.taxcloud_connection_id}/orders/{order_id}"
-        )
+        # Build path with order ID
+        path = self._tc_order_prefix + order_id
 
-        # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> Dict[str, Any]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.patch(
-                path, json=request.model_dump(by_alias=True, exclude_none=True)
-            )
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
 
-        response_data = _make_request()
-        return OrderResponse(**response_data)
+        # Make request with retry logic
+        response_data = self._send_tc("patch_bytes", path, content=request_body)
+        return OrderResponse.model_validate_json(response_data)
 
     def RefundOrder(
         self,
@@ -746,31 +1281,25 @@ class Functions:
         """
         self._check_taxcloud_config()
 
-        # Build path with connection ID and order ID
-        conn_id = self.config.taxcloud_connection_id
-        path = f"/tax/connections/{conn_id}/orders/refunds/{order_id}"
+        # Build path with order ID
+        path = self._tc_refunds_path + order_id
 
         # Prepare request body
-        request_body = {}
+        request_body = b"{}"
         if request:
-            request_body = request.model_dump(by_alias=True, exclude_none=True)
+            request_body = request.model_dump_json(
+                by_alias=True, exclude_none=True
+            ).encode()
 
         # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> List[Dict[str, Any]]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.post(path, json=request_body)
-
-        response_data = _make_request()
+        response_data = self._send_tc("post_bytes", path, content=request_body)
 
-        # API may return a single dict or a list of dicts
-        if isinstance(response_data, dict):
-            response_data = [response_data]
+        # API may return a single object or a list of objects
+        refunds = _REFUND_RESPONSES_ADAPTER.validate_json(response_data)
+        if isinstance(refunds, RefundTransactionResponse):
+            return [refunds]
 
-        return [RefundTransactionResponse(**item) for item in response_data]
+        return refunds
 
     def CreateOrderFromCart(
         self,
@@ -807,21 +1336,13 @@ class Functions:
         """
         self._check_taxcloud_config()
 
-        # Build path with connection ID
-        conn_id = self.config.taxcloud_connection_id
-        path = f"/tax/connections/{conn_id}/carts/orders"
+        path = self._tc_cart_orders_path
 
-        # Make request with retry logic
-        @retry_with_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.retry_delay,
-        )
-        def _make_request() -> Dict[str, Any]:
-            assert self.taxcloud_http_client is not None
-            return self.taxcloud_http_client.post(
-                path,
-                json=request.model_dump(by_alias=True, exclude_none=True),
-            )
+        # Serialize straight to JSON bytes once so retries reuse the same body
+        request_body = request.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode()
 
-        response_data = _make_request()
-        return OrderResponse(**response_data)
+        # Make request with retry logic
+        response_data = self._send_tc("post_bytes", path, content=request_body)
+        return OrderResponse.model_validate_json(response_data)
@@ -1,7 +1,10 @@
 """Utilities module for ZipTax SDK."""
 
-from .http import HTTPClient
+from .cache import TTLCache
+from .circuit import CircuitBreaker
+from .http import AsyncHTTPClient, HTTPClient
 from .retry import async_retry_with_backoff, retry_with_backoff, should_retry
+from .singleflight import AsyncSingleFlight, SingleFlight
 from .validation import (
     validate_address,
     validate_address_autocomplete,
@@ -15,6 +18,11 @@ from .validation import (
 
 __all__ = [
     "HTTPClient",
+    "AsyncHTTPClient",
+    "TTLCache",
+    "CircuitBreaker",
+    "SingleFlight",
+    "AsyncSingleFlight",
     "retry_with_backoff",
     "async_retry_with_backoff",
     "should_retry",
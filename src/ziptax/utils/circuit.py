@@ -0,0 +1,124 @@
+"""Circuit breaker for the ZipTax SDK."""
+
+import logging
+import threading
+import time
+
+from ..exceptions import ZipTaxCircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single upstream host.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast with :class:`ZipTaxCircuitOpenError` instead of
+    sleeping through the retry budget. Once ``recovery_time`` seconds have
+    passed, a single probe request is let through (half-open); its outcome
+    closes or re-opens the circuit. A ``failure_threshold`` of 0 disables
+    the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        name: str = "upstream",
+    ):
+        """Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening (0 disables)
+            recovery_time: Seconds to stay open before allowing a probe
+            name: Name of the protected upstream, used in error messages
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.name = name
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the current circuit state."""
+        return self._state
+
+    def allow(self) -> None:
+        """Check whether a request may be sent.
+
+        Raises:
+            ZipTaxCircuitOpenError: If the circuit is open, or half-open with
+                a probe already in flight
+        """
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            if self._state == CLOSED:
+                return
+
+            if self._state == OPEN:
+                remaining = self._opened_at + self.recovery_time - time.monotonic()
+                if remaining > 0:
+                    raise ZipTaxCircuitOpenError(
+                        f"Circuit open for {self.name}; " f"retry in {remaining:.1f}s"
+                    )
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._probe_in_flight:
+                raise ZipTaxCircuitOpenError(
+                    f"Circuit half-open for {self.name}; probe in progress"
+                )
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuit closed for %s", self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot without recording an outcome.
+
+        Called when an attempt is interrupted (e.g. task cancellation or
+        ``KeyboardInterrupt``) before the upstream answered, so the next
+        request can probe instead of failing fast forever.
+        """
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "Circuit opened for %s after %d consecutive failures",
+                        self.name,
+                        self._failures,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
@@ -1,9 +1,11 @@
 """HTTP utilities for the ZipTax SDK."""
 
 import logging
-from typing import Any, Dict, Optional, cast
+import math
+from typing import Any, Dict, Optional, Tuple, Type, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..exceptions import (
     ZipTaxAPIError,
@@ -15,26 +17,188 @@ from ..exceptions import (
     ZipTaxServerError,
     ZipTaxTimeoutError,
 )
+from .retry import parse_retry_after
+from .serialization import dumps, loads
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+def _log_request(
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]],
+    json: Optional[Dict[str, Any]],
+    content: Optional[bytes],
+) -> None:
+    """Debug-log the shape of a request without its parameter or body values.
+
+    Args:
+        method: HTTP method
+        path: API endpoint path
+        params: Query parameters
+        json: JSON request body
+        content: Pre-encoded JSON request body
+    """
+    # Skip building the key lists entirely unless DEBUG is enabled
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    param_keys = list(params) if params else []
+    if content is not None:
+        logger.debug(
+            "%s %s body_bytes=%d params=%s", method, path, len(content), param_keys
+        )
+    else:
+        body_keys = list(json) if json else []
+        logger.debug(
+            "%s %s body_keys=%s params=%s", method, path, body_keys, param_keys
+        )
+
+
+# Client errors that map directly to an exception type and message prefix;
+# 429 and 5xx need extra handling in _raise_error_response
+_ERROR_TYPES: Dict[int, Tuple[Type[ZipTaxAPIError], str]] = {
+    401: (ZipTaxAuthenticationError, "Authentication failed"),
+    403: (ZipTaxAuthorizationError, "Authorization failed"),
+    404: (ZipTaxNotFoundError, "Resource not found"),
+}
+
+
+def _raise_error_response(response: Any) -> None:
+    """Raise the SDK exception matching an error response.
+
+    Works with both ``requests`` and ``httpx`` response objects.
+
+    Args:
+        response: HTTP response object
+
+    Raises:
+        ZipTaxAuthenticationError: For 401 errors
+        ZipTaxAuthorizationError: For 403 errors
+        ZipTaxNotFoundError: For 404 errors
+        ZipTaxRateLimitError: For 429 errors
+        ZipTaxServerError: For 5xx errors
+        ZipTaxAPIError: For other errors
+    """
+    status_code = response.status_code
+    try:
+        message = loads(response.content).get("message")
+        if message is None:
+            # Only decode the body as text when the envelope has no message
+            message = response.text
+    except Exception:
+        message = response.text or f"HTTP {status_code} error"
+
+    error_type = _ERROR_TYPES.get(status_code)
+    if error_type is not None:
+        exc_class, prefix = error_type
+        raise exc_class(
+            message=f"{prefix}: {message}",
+            status_code=status_code,
+            response=response,
+        )
+    if status_code == 429:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        raise ZipTaxRateLimitError(
+            message=f"Rate limit exceeded: {message}",
+            retry_after=(math.ceil(retry_after) if retry_after is not None else None),
+            status_code=status_code,
+            response=response,
+        )
+    if 500 <= status_code < 600:
+        raise ZipTaxServerError(
+            message=f"Server error: {message}",
+            status_code=status_code,
+            response=response,
+        )
+    raise ZipTaxAPIError(
+        message=f"API error: {message}",
+        status_code=status_code,
+        response=response,
+    )
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """Connection pool adapter shared by every HTTPClient in the process."""
+
+    def close(self) -> None:
+        """Keep pooled connections open when a client's session is closed."""
+
+
+# Adapters keyed by (pool_connections, pool_maxsize), so short-lived clients
+# reuse warm keep-alive connections instead of reconnecting on first request
+_ADAPTERS: Dict[Tuple[int, int], HTTPAdapter] = {}
+
+
+def _shared_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """Return the process-wide adapter for a connection pool size.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of keep-alive connections per pool
+
+    Returns:
+        Shared HTTPAdapter
+    """
+    key = (pool_connections, pool_maxsize)
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
+        adapter = _ADAPTERS.setdefault(
+            key,
+            _SharedHTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=False,
+                # Retries are handled by retry_with_backoff; never let urllib3
+                # retry behind its back and skew the circuit breaker accounting
+                max_retries=0,
+            ),
+        )
+    return adapter
+
+
 class HTTPClient:
     """HTTP client for making requests to the ZipTax API."""
 
-    def __init__(self, api_key: str, base_url: str, timeout: int = 30):
+    # Clients may be created per tenant or per request; slots drop the
+    # per-instance __dict__
+    __slots__ = ("api_key", "base_url", "timeout", "session")
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+    ):
         """Initialize HTTPClient.
 
+        A single session is kept for the lifetime of the client, and its
+        connection pool is shared with other clients using the same pool
+        sizes, so TCP/TLS connections to the API host outlive the client.
+
         Args:
             api_key: ZipTax API key
             base_url: Base URL for the API
             timeout: Request timeout in seconds
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of keep-alive connections per pool
         """
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
         self.session = requests.Session()
-        self.session.headers.update({"X-API-Key": api_key})
+        self.session.headers.update({"X-API-Key": api_key, "Connection": "keep-alive"})
+
+        adapter = _shared_adapter(pool_connections, pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _handle_error_response(self, response: requests.Response) -> None:
         """Handle error responses from the API.
@@ -50,51 +214,7 @@ class HTTPClient:
             ZipTaxServerError: For 5xx errors
             ZipTaxAPIError: For other errors
         """
-        status_code = response.status_code
-        try:
-            error_data = response.json()
-            message = error_data.get("message", response.text)
-        except Exception:
-            message = response.text or f"HTTP {status_code} error"
-
-        if status_code == 401:
-            raise ZipTaxAuthenticationError(
-                message=f"Authentication failed: {message}",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 403:
-            raise ZipTaxAuthorizationError(
-                message=f"Authorization failed: {message}",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 404:
-            raise ZipTaxNotFoundError(
-                message=f"Resource not found: {message}",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise ZipTaxRateLimitError(
-                message=f"Rate limit exceeded: {message}",
-                retry_after=int(retry_after) if retry_after else None,
-                status_code=status_code,
-                response=response,
-            )
-        elif 500 <= status_code < 600:
-            raise ZipTaxServerError(
-                message=f"Server error: {message}",
-                status_code=status_code,
-                response=response,
-            )
-        else:
-            raise ZipTaxAPIError(
-                message=f"API error: {message}",
-                status_code=status_code,
-                response=response,
-            )
+        _raise_error_response(response)
 
     def get(
         self,
@@ -111,29 +231,121 @@ class HTTPClient:
 
         Returns:
             Response data as dictionary
+        """
+        return cast(
+            Dict[str, Any], self._request("GET", path, params=params, headers=headers)
+        )
+
+    def post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """Make a POST request to the API.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Response data (dict or list)
+        """
+        return self._request(
+            "POST", path, json=json, params=params, headers=headers, content=content
+        )
+
+    def patch(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Make a PATCH request to the API.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Response data as dictionary
+        """
+        return cast(
+            Dict[str, Any],
+            self._request(
+                "PATCH",
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+                content=content,
+            ),
+        )
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        raw: bool = False,
+    ) -> Any:
+        """Make a request to the API.
+
+        Args:
+            method: HTTP method ("GET", "POST" or "PATCH")
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+            raw: Return the raw response body instead of decoded JSON
+
+        Returns:
+            Response data (dict or list), or raw bytes if ``raw`` is True
 
         Raises:
             ZipTaxConnectionError: For connection errors
             ZipTaxTimeoutError: For timeout errors
             ZipTaxAPIError: For API errors
         """
-        url = f"{self.base_url}{path}"
-        param_keys = list(params.keys()) if params else []
-        logger.debug(f"GET {path} params={param_keys}")
+        url = self.base_url + path
+        _log_request(method, path, params, json, content)
+        if content is None and json is not None:
+            # Encode the body once here instead of via requests' json=
+            content = dumps(json)
+        if content is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+
+        kwargs: Dict[str, Any] = {
+            "params": params,
+            "headers": headers,
+            "timeout": self.timeout,
+        }
+        if method != "GET":
+            kwargs["data"] = content
 
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            logger.debug(f"GET {path} status={response.status_code}")
+            response = self.session.request(method, url, **kwargs)
+            logger.debug("%s %s status=%s", method, path, response.status_code)
 
-            if not response.ok:
+            # Same test as response.ok without the property call
+            if response.status_code >= 400:
                 self._handle_error_response(response)
 
-            return cast(Dict[str, Any], response.json())
+            return response.content if raw else loads(response.content)
 
         except requests.exceptions.Timeout as e:
             raise ZipTaxTimeoutError(f"Request timed out after {self.timeout}s: {e}")
@@ -144,64 +356,283 @@ class HTTPClient:
         except Exception as e:
             raise ZipTaxAPIError(f"Unexpected error: {e}")
 
-    def post(
+    def get_bytes(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Make a GET request to the API and return the raw JSON body.
+
+        Lets callers validate the body straight into a Pydantic model with
+        ``Model.model_validate_json`` instead of decoding to a dict first.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            Raw response body
+        """
+        return cast(
+            bytes, self._request("GET", path, params=params, headers=headers, raw=True)
+        )
+
+    def post_bytes(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """Make a POST request to the API and return the raw JSON body.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Raw response body
+        """
+        return cast(
+            bytes,
+            self._request(
+                "POST",
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+                content=content,
+                raw=True,
+            ),
+        )
+
+    def patch_bytes(
         self,
         path: str,
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """Make a PATCH request to the API and return the raw JSON body.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Raw response body
+        """
+        return cast(
+            bytes,
+            self._request(
+                "PATCH",
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+                content=content,
+                raw=True,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the HTTP session.
+
+        The shared connection pool is left open for other clients.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "HTTPClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+class AsyncHTTPClient:
+    """Async HTTP client for making requests to the ZipTax API.
+
+    Requires the optional ``httpx`` dependency
+    (``pip install "ziptax-sdk[async]"``). Requests are sent over HTTP/2 when
+    available, so concurrent requests are multiplexed over a single
+    connection instead of queueing behind one another.
+    """
+
+    __slots__ = ("api_key", "base_url", "timeout", "client")
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+    ):
+        """Initialize AsyncHTTPClient.
+
+        Args:
+            api_key: ZipTax API key
+            base_url: Base URL for the API
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle keep-alive
+                connections
+            http2: Whether to use HTTP/2 when the ``h2`` package is installed
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncHTTPClient requires httpx. "
+                'Install it with: pip install "ziptax-sdk[async]"'
+            )
+
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                http2 = False
+
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.client = httpx.AsyncClient(
+            headers={"X-API-Key": api_key},
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        raw: bool = False,
     ) -> Any:
-        """Make a POST request to the API.
+        """Make a request to the API.
 
         Args:
+            method: HTTP method
             path: API endpoint path
             json: JSON request body
             params: Query parameters
             headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+            raw: Return the raw response body instead of decoded JSON
 
         Returns:
-            Response data (dict or list)
+            Response data (dict or list), or raw bytes if ``raw`` is True
 
         Raises:
             ZipTaxConnectionError: For connection errors
             ZipTaxTimeoutError: For timeout errors
             ZipTaxAPIError: For API errors
         """
-        url = f"{self.base_url}{path}"
-        body_keys = list(json.keys()) if json else []
-        param_keys = list(params.keys()) if params else []
-        logger.debug(f"POST {path} body_keys={body_keys} params={param_keys}")
+        url = self.base_url + path
+        _log_request(method, path, params, json, content)
+        if content is not None:
+            json = None
+            headers = {**(headers or {}), "Content-Type": "application/json"}
 
         try:
-            response = self.session.post(
+            response = await self.client.request(
+                method,
                 url,
+                content=content,
                 json=json,
                 params=params,
                 headers=headers,
-                timeout=self.timeout,
             )
-            logger.debug(f"POST {path} status={response.status_code}")
+            logger.debug("%s %s status=%s", method, path, response.status_code)
 
-            if not response.ok:
-                self._handle_error_response(response)
+            # Same test as response.is_success without the property call
+            if not 200 <= response.status_code < 300:
+                _raise_error_response(response)
 
-            return response.json()
+            return response.content if raw else loads(response.content)
 
-        except requests.exceptions.Timeout as e:
+        except httpx.TimeoutException as e:
             raise ZipTaxTimeoutError(f"Request timed out after {self.timeout}s: {e}")
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             raise ZipTaxConnectionError(f"Connection error: {e}")
         except (ZipTaxAPIError, ZipTaxTimeoutError, ZipTaxConnectionError):
             raise
         except Exception as e:
             raise ZipTaxAPIError(f"Unexpected error: {e}")
 
-    def patch(
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Make a GET request to the API.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            Response data as dictionary
+        """
+        return cast(
+            Dict[str, Any],
+            await self._request("GET", path, params=params, headers=headers),
+        )
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """Make a POST request to the API.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Response data (dict or list)
+        """
+        return await self._request(
+            "POST", path, json=json, params=params, headers=headers, content=content
+        )
+
+    async def patch(
         self,
         path: str,
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """Make a PATCH request to the API.
 
@@ -210,52 +641,118 @@ class HTTPClient:
             json: JSON request body
             params: Query parameters
             headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
 
         Returns:
             Response data as dictionary
+        """
+        return cast(
+            Dict[str, Any],
+            await self._request(
+                "PATCH",
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+                content=content,
+            ),
+        )
 
-        Raises:
-            ZipTaxConnectionError: For connection errors
-            ZipTaxTimeoutError: For timeout errors
-            ZipTaxAPIError: For API errors
+    async def get_bytes(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Make a GET request to the API and return the raw JSON body.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            Raw response body
         """
-        url = f"{self.base_url}{path}"
-        body_keys = list(json.keys()) if json else []
-        param_keys = list(params.keys()) if params else []
-        logger.debug(f"PATCH {path} body_keys={body_keys} params={param_keys}")
+        return cast(
+            bytes,
+            await self._request("GET", path, params=params, headers=headers, raw=True),
+        )
 
-        try:
-            response = self.session.patch(
-                url,
+    async def post_bytes(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """Make a POST request to the API and return the raw JSON body.
+
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
+
+        Returns:
+            Raw response body
+        """
+        return cast(
+            bytes,
+            await self._request(
+                "POST",
+                path,
                 json=json,
                 params=params,
                 headers=headers,
-                timeout=self.timeout,
-            )
-            logger.debug(f"PATCH {path} status={response.status_code}")
+                content=content,
+                raw=True,
+            ),
+        )
 
-            if not response.ok:
-                self._handle_error_response(response)
+    async def patch_bytes(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """Make a PATCH request to the API and return the raw JSON body.
 
-            return cast(Dict[str, Any], response.json())
+        Args:
+            path: API endpoint path
+            json: JSON request body
+            params: Query parameters
+            headers: Additional headers
+            content: Pre-encoded JSON request body (takes precedence over json)
 
-        except requests.exceptions.Timeout as e:
-            raise ZipTaxTimeoutError(f"Request timed out after {self.timeout}s: {e}")
-        except requests.exceptions.ConnectionError as e:
-            raise ZipTaxConnectionError(f"Connection error: {e}")
-        except (ZipTaxAPIError, ZipTaxTimeoutError, ZipTaxConnectionError):
-            raise
-        except Exception as e:
-            raise ZipTaxAPIError(f"Unexpected error: {e}")
+        Returns:
+            Raw response body
+        """
+        return cast(
+            bytes,
+            await self._request(
+                "PATCH",
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+                content=content,
+                raw=True,
+            ),
+        )
 
-    def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+    async def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self.client.aclose()
 
-    def __enter__(self) -> "HTTPClient":
-        """Context manager entry."""
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        """Async context manager entry."""
         return self
 
-    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Context manager exit."""
-        self.close()
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
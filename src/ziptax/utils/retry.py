@@ -1,41 +1,171 @@
 """Retry utilities for the ZipTax SDK."""
 
 import logging
+import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any, Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 
 from ..exceptions import (
+    ZipTaxAPIError,
     ZipTaxConnectionError,
     ZipTaxRateLimitError,
     ZipTaxRetryError,
     ZipTaxServerError,
     ZipTaxTimeoutError,
 )
+from .circuit import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# HTTP status codes that indicate a transient failure worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Exception types that are always retried (server errors depend on status)
+_RETRYABLE_ERRORS = (ZipTaxRateLimitError, ZipTaxConnectionError, ZipTaxTimeoutError)
+
+# ``jitter`` value selecting AWS-style decorrelated jitter
+DECORRELATED_JITTER = "decorrelated"
+
 
 def should_retry(exception: Exception) -> bool:
     """Determine if an exception should trigger a retry.
 
+    Server errors are only retried for transient status codes (500, 502,
+    503, 504). Authentication, authorization, and validation errors are
+    never retried.
+
     Args:
         exception: The exception to check
 
     Returns:
         True if the exception should trigger a retry
     """
-    return isinstance(
-        exception,
-        (
-            ZipTaxServerError,
-            ZipTaxRateLimitError,
-            ZipTaxConnectionError,
-            ZipTaxTimeoutError,
-        ),
-    )
+    if isinstance(exception, ZipTaxServerError):
+        return (
+            exception.status_code is None
+            or exception.status_code in RETRYABLE_STATUS_CODES
+        )
+
+    return isinstance(exception, _RETRYABLE_ERRORS)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delta-seconds (e.g. "120") or an
+            HTTP-date (e.g. "Wed, 21 Oct 2015 07:28:00 GMT")
+
+    Returns:
+        Number of seconds to wait (never negative), or None if the value
+        is missing or cannot be parsed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return max(seconds, 0.0)
+
+
+def _get_retry_after(exception: Exception) -> Optional[float]:
+    """Get the server-requested retry delay from an exception, if any.
+
+    Args:
+        exception: The exception raised by the failed attempt
+
+    Returns:
+        Seconds to wait as requested by the server, or None
+    """
+    if isinstance(exception, ZipTaxRateLimitError) and exception.retry_after:
+        return float(exception.retry_after)
+
+    if isinstance(exception, ZipTaxAPIError):
+        headers = getattr(exception.response, "headers", None)
+        if headers is not None:
+            return parse_retry_after(headers.get("Retry-After"))
+
+    return None
+
+
+def _check_jitter(jitter: Union[bool, str]) -> None:
+    """Validate the ``jitter`` option of the retry decorators.
+
+    Args:
+        jitter: True, False, or ``DECORRELATED_JITTER``
+
+    Raises:
+        ValueError: If jitter is an unknown strategy name
+    """
+    if isinstance(jitter, str) and jitter != DECORRELATED_JITTER:
+        raise ValueError(
+            f"jitter must be a bool or {DECORRELATED_JITTER!r}, got: {jitter!r}"
+        )
+
+
+def _compute_delay(
+    attempt: int,
+    exception: Exception,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float,
+    jitter: Union[bool, str],
+    prev_delay: float,
+) -> float:
+    """Compute the delay before the next retry attempt.
+
+    By default uses "full jitter" exponential backoff, i.e. a random delay
+    between 0 and the capped exponential delay, so that many clients failing
+    at the same time do not retry in lockstep. With ``DECORRELATED_JITTER``
+    each delay is drawn between ``base_delay`` and three times the previous
+    delay instead, which spreads retries out further under sustained
+    contention. A ``Retry-After`` value sent by the server is honored as a
+    lower bound, but never beyond ``max_delay`` so a hostile or misconfigured
+    header cannot stall the caller indefinitely.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        exception: The exception raised by the failed attempt
+        base_delay: Initial delay between retries in seconds
+        max_delay: Maximum delay between retries in seconds
+        exponential_base: Base for exponential backoff calculation
+        jitter: True for full jitter, False for none, or
+            ``DECORRELATED_JITTER``
+        prev_delay: Delay used before the previous attempt (``base_delay``
+            before the first retry)
+
+    Returns:
+        Delay in seconds
+    """
+    if jitter == DECORRELATED_JITTER:
+        delay = min(max_delay, random.uniform(base_delay, prev_delay * 3))
+    else:
+        delay = min(base_delay * (exponential_base**attempt), max_delay)
+        if jitter:
+            delay = random.uniform(0, delay)
+
+    retry_after = _get_retry_after(exception)
+    if retry_after is not None:
+        delay = min(max(retry_after, delay), max_delay)
+
+    return delay
 
 
 def retry_with_backoff(
@@ -43,32 +173,55 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
+    jitter: Union[bool, str] = True,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Decorator to retry a function with exponential backoff.
+    """Decorator to retry a function with jittered exponential backoff.
 
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay between retries in seconds
         max_delay: Maximum delay between retries in seconds
         exponential_base: Base for exponential backoff calculation
+        jitter: True for full jitter, False for deterministic delays, or
+            ``DECORRELATED_JITTER`` for decorrelated jitter
+        breaker: Optional circuit breaker checked before every attempt
 
     Returns:
         Decorated function with retry logic
+
+    Raises:
+        ValueError: If jitter is an unknown strategy name
     """
+    _check_jitter(jitter)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception: Exception = Exception("Unknown error")
+            delay = base_delay
 
             for attempt in range(max_retries + 1):
+                # Fail fast while the upstream's circuit is open
+                if breaker is not None:
+                    breaker.allow()
+
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
+                    retryable = should_retry(e)
+
+                    # Only transient failures count against the circuit;
+                    # any other error still means the upstream answered
+                    if breaker is not None:
+                        if retryable:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
 
                     # Don't retry if it's not a retryable exception
-                    if not should_retry(e):
+                    if not retryable:
                         raise
 
                     # Don't retry if we've exhausted our attempts
@@ -79,19 +232,38 @@ def retry_with_backoff(
                             last_exception=last_exception,
                         )
 
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
-
-                    # For rate limit errors, use the retry-after header if available
-                    if isinstance(e, ZipTaxRateLimitError) and e.retry_after:
-                        delay = e.retry_after
+                    # Calculate delay with jittered exponential backoff,
+                    # honoring any Retry-After sent by the server
+                    delay = _compute_delay(
+                        attempt,
+                        e,
+                        base_delay,
+                        max_delay,
+                        exponential_base,
+                        jitter,
+                        delay,
+                    )
 
                     logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
-                        f"Retrying in {delay}s..."
+                        "Attempt %d/%d failed: %s. Retrying in %.2fs...",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                        delay,
                     )
 
                     time.sleep(delay)
+                except BaseException:
+                    # Interrupted before the upstream answered (cancellation,
+                    # KeyboardInterrupt): free a half-open probe slot so the
+                    # circuit is not left waiting on a probe that never ends
+                    if breaker is not None:
+                        breaker.release_probe()
+                    raise
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
 
             # This should never be reached, but just in case
             raise ZipTaxRetryError(
@@ -110,33 +282,57 @@ def async_retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
+    jitter: Union[bool, str] = True,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    """Decorator to retry an async function with exponential backoff.
+    """Decorator to retry an async function with jittered exponential backoff.
 
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay between retries in seconds
         max_delay: Maximum delay between retries in seconds
         exponential_base: Base for exponential backoff calculation
+        jitter: True for full jitter, False for deterministic delays, or
+            ``DECORRELATED_JITTER`` for decorrelated jitter
+        breaker: Optional circuit breaker checked before every attempt
 
     Returns:
         Decorated async function with retry logic
+
+    Raises:
+        ValueError: If jitter is an unknown strategy name
     """
     import asyncio
 
+    _check_jitter(jitter)
+
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception: Exception = Exception("Unknown error")
+            delay = base_delay
 
             for attempt in range(max_retries + 1):
+                # Fail fast while the upstream's circuit is open
+                if breaker is not None:
+                    breaker.allow()
+
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
+                    retryable = should_retry(e)
+
+                    # Only transient failures count against the circuit;
+                    # any other error still means the upstream answered
+                    if breaker is not None:
+                        if retryable:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
 
                     # Don't retry if it's not a retryable exception
-                    if not should_retry(e):
+                    if not retryable:
                         raise
 
                     # Don't retry if we've exhausted our attempts
@@ -147,19 +343,38 @@ def async_retry_with_backoff(
                             last_exception=last_exception,
                         )
 
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
-
-                    # For rate limit errors, use the retry-after header if available
-                    if isinstance(e, ZipTaxRateLimitError) and e.retry_after:
-                        delay = e.retry_after
+                    # Calculate delay with jittered exponential backoff,
+                    # honoring any Retry-After sent by the server
+                    delay = _compute_delay(
+                        attempt,
+                        e,
+                        base_delay,
+                        max_delay,
+                        exponential_base,
+                        jitter,
+                        delay,
+                    )
 
                     logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
-                        f"Retrying in {delay}s..."
+                        "Attempt %d/%d failed: %s. Retrying in %.2fs...",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                        delay,
                     )
 
                     await asyncio.sleep(delay)
+                except BaseException:
+                    # Interrupted before the upstream answered (cancellation,
+                    # KeyboardInterrupt): free a half-open probe slot so the
+                    # circuit is not left waiting on a probe that never ends
+                    if breaker is not None:
+                        breaker.release_probe()
+                    raise
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
 
             # This should never be reached, but just in case
             raise ZipTaxRetryError(
@@ -0,0 +1,43 @@
+"""JSON serialization helpers for the ZipTax SDK."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(data: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON.
+
+    Uses ``orjson`` when it is installed (``pip install "ziptax-sdk[speedups]"``)
+    and falls back to the standard library otherwise.
+
+    Args:
+        data: JSON-serializable value
+
+    Returns:
+        Encoded JSON body
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+
+    Uses ``orjson`` when it is installed and falls back to the standard
+    library otherwise. Both raise a ``ValueError`` subclass on invalid input.
+
+    Args:
+        data: Raw JSON body
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,134 @@
+"""Request coalescing utilities for the ZipTax SDK."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Result handed to async waiters when the leading call was cancelled
+_LEADER_CANCELLED = object()
+
+
+class _Call:
+    """An in-flight call shared by all callers of the same key."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe coalescing of concurrent calls with the same key.
+
+    The first caller for a key runs the function; callers arriving while
+    it is still running wait for it and receive the same result (or
+    exception) instead of issuing a duplicate request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Key identifying identical calls
+            func: Function to run if no call for ``key`` is in flight
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Coalescing of concurrent coroutine calls with the same key.
+
+    Must be used from a single event loop. Waiters share the leader's
+    result through an ``asyncio.Future``; if the leader's caller is
+    cancelled, the waiters retry rather than being cancelled with it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize AsyncSingleFlight."""
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Key identifying identical calls
+            func: Coroutine function to await if no call for ``key`` is in flight
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        future = self._calls.get(key)
+        while future is not None:
+            # Shield so a cancelled waiter does not cancel the shared call
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+            # The leader was cancelled; retry, possibly as the new leader
+            future = self._calls.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Only the leader's caller was cancelled: wake the waiters so
+            # they retry instead of failing with a cancellation of their own
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
@@ -1,10 +1,22 @@
 """Validation utilities for the ZipTax SDK."""
 
 import re
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..exceptions import ZipTaxValidationError
 
+# Accepted parameter values; the tuples keep a stable order for error messages
+_COUNTRY_CODE_OPTIONS = ("USA", "CAN")
+_FORMAT_OPTIONS = ("json",)
+_ADDRESS_AUTOCOMPLETE_OPTIONS = ("none", "origin", "destination", "all")
+_COUNTRY_CODES = frozenset(_COUNTRY_CODE_OPTIONS)
+_FORMATS = frozenset(_FORMAT_OPTIONS)
+_ADDRESS_AUTOCOMPLETE = frozenset(_ADDRESS_AUTOCOMPLETE_OPTIONS)
+
+# Trailing "ST 12345" or "ST 12345-6789" segment of an address string. Applied
+# with fullmatch(), which unlike "^...$" does not accept a trailing newline
+_STATE_ZIP_RE = re.compile(r"([A-Za-z]{2})\s+(\d{5}(?:-\d{4})?)")
+
 
 def validate_address(address: str) -> None:
     """Validate address parameter.
@@ -65,11 +77,10 @@ def validate_country_code(country_code: str) -> None:
     Raises:
         ZipTaxValidationError: If country code is invalid
     """
-    valid_codes = ["USA", "CAN"]
-
-    if country_code not in valid_codes:
+    if country_code not in _COUNTRY_CODES:
         raise ZipTaxValidationError(
-            f"Country code must be one of {valid_codes}, got: {country_code}"
+            f"Country code must be one of {list(_COUNTRY_CODE_OPTIONS)}, "
+            f"got: {country_code}"
         )
 
 
@@ -82,28 +93,21 @@ def validate_historical_date(historical: str) -> None:
     Raises:
         ZipTaxValidationError: If historical date is invalid
     """
-    pattern = r"^[0-9]{4}[0-9]{2}$"
-
-    if not re.match(pattern, historical):
+    # Six ASCII digits; isascii() rules out digits int() would also accept
+    if not (len(historical) == 6 and historical.isascii() and historical.isdigit()):
         raise ZipTaxValidationError(
             f"Historical date must be in YYYYMM format, got: {historical}"
         )
 
     # Validate year and month ranges
-    try:
-        year_int = int(historical[:4])
-        month_int = int(historical[4:6])
+    year_int = int(historical[:4])
+    month_int = int(historical[4:])
 
-        if year_int < 1900 or year_int > 2100:
-            raise ZipTaxValidationError(f"Invalid year: {year_int}")
+    if year_int < 1900 or year_int > 2100:
+        raise ZipTaxValidationError(f"Invalid year: {year_int}")
 
-        if month_int < 1 or month_int > 12:
-            raise ZipTaxValidationError(f"Invalid month: {month_int}")
-
-    except (ValueError, IndexError):
-        raise ZipTaxValidationError(
-            f"Historical date must be in YYYYMM format, got: {historical}"
-        )
+    if month_int < 1 or month_int > 12:
+        raise ZipTaxValidationError(f"Invalid month: {month_int}")
 
 
 def validate_format(format_str: str) -> None:
@@ -115,11 +119,9 @@ def validate_format(format_str: str) -> None:
     Raises:
         ZipTaxValidationError: If format is invalid
     """
-    valid_formats = ["json"]
-
-    if format_str not in valid_formats:
+    if format_str not in _FORMATS:
         raise ZipTaxValidationError(
-            f"Format must be one of {valid_formats}, got: {format_str}"
+            f"Format must be one of {list(_FORMAT_OPTIONS)}, got: {format_str}"
         )
 
 
@@ -151,11 +153,10 @@ def validate_address_autocomplete(address_autocomplete: str) -> None:
     Raises:
         ZipTaxValidationError: If address_autocomplete value is invalid
     """
-    valid_options = ["none", "origin", "destination", "all"]
-
-    if address_autocomplete not in valid_options:
+    if address_autocomplete not in _ADDRESS_AUTOCOMPLETE:
         raise ZipTaxValidationError(
-            f"address_autocomplete must be one of {valid_options}, "
+            f"address_autocomplete must be one of "
+            f"{list(_ADDRESS_AUTOCOMPLETE_OPTIONS)}, "
             f"got: {address_autocomplete!r}"
         )
 
@@ -175,10 +176,9 @@ def validate_postal_code(postal_code: str) -> None:
     if not isinstance(postal_code, str):
         raise ZipTaxValidationError("Postal code must be a string")
 
-    # Pattern for 5-digit format only (API does not accept 9-digit codes)
-    pattern = r"^[0-9]{5}$"
-
-    if not re.match(pattern, postal_code):
+    # 5 ASCII digits only; the API does not accept 9-digit codes. isascii()
+    # keeps out characters like "²" and "٥" that str.isdigit() accepts
+    if not (len(postal_code) == 5 and postal_code.isascii() and postal_code.isdigit()):
         raise ZipTaxValidationError(
             f"Postal code must be in 5-digit format (e.g., 92694), "
             f"got: {postal_code}"
@@ -201,6 +201,116 @@ def validate_product_query(query: str) -> None:
         raise ZipTaxValidationError("Product query cannot be empty")
 
 
+def validate_address_request(
+    address: str,
+    country_code: str,
+    historical: Optional[str],
+    format_str: str,
+) -> None:
+    """Validate all parameters of an address rate lookup in one call.
+
+    Valid inputs are checked inline; on failure the matching single-field
+    validator is called so that error messages stay identical.
+
+    Args:
+        address: Address string to validate
+        country_code: Country code to validate
+        historical: Optional historical date (YYYYMM format)
+        format_str: Format string to validate
+
+    Raises:
+        ZipTaxValidationError: If any parameter is invalid
+    """
+    if not (isinstance(address, str) and 0 < len(address) <= 100):
+        validate_address(address)
+    if country_code not in _COUNTRY_CODES:
+        validate_country_code(country_code)
+    if historical:
+        validate_historical_date(historical)
+    if format_str not in _FORMATS:
+        validate_format(format_str)
+
+
+def validate_geolocation_request(
+    lat: str,
+    lng: str,
+    country_code: str,
+    historical: Optional[str],
+    format_str: str,
+) -> None:
+    """Validate all parameters of a geolocation rate lookup in one call.
+
+    Args:
+        lat: Latitude string to validate
+        lng: Longitude string to validate
+        country_code: Country code to validate
+        historical: Optional historical date (YYYYMM format)
+        format_str: Format string to validate
+
+    Raises:
+        ZipTaxValidationError: If any parameter is invalid
+    """
+    validate_coordinates(lat, lng)
+    if country_code not in _COUNTRY_CODES:
+        validate_country_code(country_code)
+    if historical:
+        validate_historical_date(historical)
+    if format_str not in _FORMATS:
+        validate_format(format_str)
+
+
+def validate_postal_code_request(postal_code: str, format_str: str) -> None:
+    """Validate all parameters of a postal code rate lookup in one call.
+
+    Args:
+        postal_code: Postal code string to validate
+        format_str: Format string to validate
+
+    Raises:
+        ZipTaxValidationError: If any parameter is invalid
+    """
+    validate_postal_code(postal_code)
+    if format_str not in _FORMATS:
+        validate_format(format_str)
+
+
+def _is_zip(value: str) -> bool:
+    """Check for a plain ASCII ``12345`` or ``12345-6789`` ZIP code."""
+    if not value.isascii() or not value[:5].isdigit():
+        return False
+    if len(value) == 5:
+        return True
+    return len(value) == 10 and value[5] == "-" and value[6:].isdigit()
+
+
+def _split_state_zip(state_zip: str) -> Tuple[str, str]:
+    """Split a ``"ST 12345"`` address segment into state and ZIP code.
+
+    The common single-space ASCII form is handled with string methods;
+    anything else falls back to ``_STATE_ZIP_RE``.
+
+    Args:
+        state_zip: Trailing segment of an address string
+
+    Returns:
+        Tuple of upper-cased state abbreviation and ZIP code
+
+    Raises:
+        ZipTaxValidationError: If the segment is not a state and ZIP code
+    """
+    state, _, zip_code = state_zip.partition(" ")
+    if len(state) == 2 and state.isascii() and state.isalpha() and _is_zip(zip_code):
+        return state.upper(), zip_code
+
+    match = _STATE_ZIP_RE.fullmatch(state_zip)
+    if not match:
+        raise ZipTaxValidationError(
+            f"Cannot parse state and ZIP from address segment: {state_zip!r}. "
+            f"Expected format: 'ST 12345' or 'ST 12345-6789'"
+        )
+    return match.group(1).upper(), match.group(2)
+
+
 def parse_address_string(address: str) -> Dict[str, str]:
     """Parse a single address string into structured TaxCloud address components.
 
@@ -247,15 +357,7 @@ def parse_address_string(address: str) -> Dict[str, str]:
     state_zip = parts[-1]
 
     # Parse state and zip from the last segment (e.g., "CA 92618" or "CA 92618-1905")
-    state_zip_match = re.match(r"^([A-Za-z]{2})\s+(\d{5}(?:-\d{4})?)$", state_zip)
-    if not state_zip_match:
-        raise ZipTaxValidationError(
-            f"Cannot parse state and ZIP from address segment: {state_zip!r}. "
-            f"Expected format: 'ST 12345' or 'ST 12345-6789'"
-        )
-
-    state = state_zip_match.group(1).upper()
-    zip_code = state_zip_match.group(2)
+    state, zip_code = _split_state_zip(state_zip)
 
     return {
         "line1": line1,
@@ -264,3 +366,30 @@ def parse_address_string(address: str) -> Dict[str, str]:
         "zip": zip_code,
         "countryCode": "US",
     }
+
+
+def parse_address_strings(addresses: Iterable[str]) -> List[Dict[str, str]]:
+    """Parse several address strings into structured TaxCloud address components.
+
+    Each distinct string is parsed once, so a cart whose items share an
+    origin (e.g. one warehouse) pays for a single parse. Every result is a
+    separate dictionary that callers may modify.
+
+    Args:
+        addresses: Full address strings to parse
+
+    Returns:
+        List of component dictionaries in input order, as returned by
+        ``parse_address_string``
+
+    Raises:
+        ZipTaxValidationError: If any address cannot be parsed
+    """
+    parsed: Dict[str, Dict[str, str]] = {}
+    results = []
+    for address in addresses:
+        components = parsed.get(address)
+        if components is None:
+            components = parsed[address] = parse_address_string(address)
+        results.append(dict(components))
+    return results
@@ -1,21 +1,28 @@
 """Pytest configuration and fixtures."""
 
-from unittest.mock import Mock
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from ziptax import ZipTaxClient
 from ziptax.config import Config
-from ziptax.utils.http import HTTPClient
+from ziptax.models import CreateOrderRequest
+from ziptax.resources.functions import Functions
+from ziptax.utils.serialization import loads
 
+# Credentials and configs are shared across the session; tests that need to
+# change a setting build their own Config rather than editing these
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_api_key():
     """Mock API key for testing."""
     return "test-api-key-1234567890"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config(mock_api_key):
     """Mock configuration for testing."""
     return Config(
@@ -27,7 +34,7 @@ def mock_config(mock_api_key):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_taxcloud_config(mock_api_key):
     """Mock configuration with TaxCloud credentials for testing."""
     return Config(
@@ -41,24 +48,65 @@ def mock_taxcloud_config(mock_api_key):
     )
 
 
+class _StubHTTPClient:
+    """Lightweight stand-in for HTTPClient/AsyncHTTPClient.
+
+    Only the request methods the endpoint classes call are mocks (recording
+    calls); slots make any other attribute access fail loudly, like a spec.
+    """
+
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "get_bytes",
+        "post_bytes",
+        "patch_bytes",
+    )
+
+    def __init__(self, api_key, base_url, method_type=Mock):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = 30
+        self.get_bytes = method_type()
+        self.post_bytes = method_type()
+        self.patch_bytes = method_type()
+
+
 @pytest.fixture
 def mock_http_client(mock_api_key):
     """Mock HTTP client for testing."""
-    client = Mock(spec=HTTPClient)
-    client.api_key = mock_api_key
-    client.base_url = "https://api.zip-tax.com"
-    client.timeout = 30
-    return client
+    return _StubHTTPClient(mock_api_key, "https://api.zip-tax.com")
 
 
 @pytest.fixture
 def mock_taxcloud_http_client():
     """Mock HTTP client for TaxCloud API testing."""
-    client = Mock(spec=HTTPClient)
-    client.api_key = "test-taxcloud-api-key-1234567890"
-    client.base_url = "https://api.v3.taxcloud.com"
-    client.timeout = 30
-    return client
+    return _StubHTTPClient(
+        "test-taxcloud-api-key-1234567890", "https://api.v3.taxcloud.com"
+    )
+
+
+@pytest.fixture
+def mock_async_http_client(mock_api_key):
+    """Mock async HTTP client for testing."""
+    return _StubHTTPClient(mock_api_key, "https://api.zip-tax.com", AsyncMock)
+
+
+@pytest.fixture
+def mock_async_taxcloud_http_client():
+    """Mock async HTTP client for TaxCloud API testing."""
+    return _StubHTTPClient(
+        "test-taxcloud-api-key-1234567890", "https://api.v3.taxcloud.com", AsyncMock
+    )
+
+
+@pytest.fixture(scope="session")
+def session_client(mock_api_key):
+    """ZipTaxClient shared by read-only tests that never send a request."""
+    client = ZipTaxClient.api_key(mock_api_key)
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -70,361 +118,125 @@ def mock_client(mock_config, mock_http_client, monkeypatch):
 
 
 @pytest.fixture
+def functions(mock_http_client, mock_config):
+    """Functions bound to the mock ZipTax HTTP client.
+
+    Built per test: each instance carries its own response cache.
+    """
+    return Functions(mock_http_client, mock_config)
+
+
+@pytest.fixture
+def taxcloud_functions(
+    mock_http_client, mock_taxcloud_config, mock_taxcloud_http_client
+):
+    """Functions bound to the mock ZipTax and TaxCloud HTTP clients."""
+    return Functions(
+        mock_http_client,
+        mock_taxcloud_config,
+        taxcloud_http_client=mock_taxcloud_http_client,
+    )
+
+
+# Sample API payloads are loaded once from fixtures/samples.json, frozen and
+# shared by every test; derive variants with ``dict(sample, key=value)``
+# instead of editing
+_SAMPLES = loads((Path(__file__).parent / "fixtures" / "samples.json").read_bytes())
+
+
+def _freeze(obj):
+    """Recursively turn dicts into read-only views and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+@pytest.fixture(scope="session")
 def sample_v60_response():
     """Sample V60Response data for testing (matches actual API format)."""
-    return {
-        "metadata": {
-            "version": "v60",
-            "response": {
-                "code": 100,
-                "name": "RESPONSE_CODE_SUCCESS",
-                "message": "Successful API Request.",
-                "definition": "http://api.zip-tax.com/request/v60/schema",
-            },
-        },
-        "baseRates": [
-            {
-                "rate": 0.06,
-                "jurType": "US_STATE_SALES_TAX",
-                "jurName": "CA",
-                "jurDescription": "US State Sales Tax",
-                "jurTaxCode": "06",
-            }
-        ],
-        "service": {
-            "adjustmentType": "SERVICE_TAXABLE",
-            "taxable": "N",
-            "description": "Services non-taxable",
-        },
-        "shipping": {
-            "adjustmentType": "FREIGHT_TAXABLE",
-            "taxable": "N",
-            "description": "Freight non-taxable",
-        },
-        "sourcingRules": {
-            "adjustmentType": "ORIGIN_DESTINATION",
-            "description": "Destination Based Taxation",
-            "value": "D",
-        },
-        "taxSummaries": [
-            {
-                "rate": 0.0775,
-                "taxType": "SALES_TAX",
-                "summaryName": "Total Base Sales Tax",
-                "displayRates": [{"name": "Total Rate", "rate": 0.0775}],
-            }
-        ],
-        "addressDetail": {
-            "normalizedAddress": (
-                "200 Spectrum Center Dr, Irvine, CA 92618-5003, United States"
-            ),
-            "incorporated": "true",
-            "geoLat": 33.65253,
-            "geoLng": -117.74794,
-        },
-    }
+    return _freeze(_SAMPLES["v60_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_account_metrics():
     """Sample V60AccountMetrics data for testing (matches live API format)."""
-    return {
-        "request_count": 15595,
-        "request_limit": 1000000,
-        "usage_percent": 1.5595,
-        "is_active": True,
-        "message": "Contact support@zip.tax to modify your account",
-    }
+    return _freeze(_SAMPLES["account_metrics"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_postal_code_response():
     """Sample V60PostalCodeResponse data for testing."""
-    return {
-        "version": "v60",
-        "rCode": 100,
-        "results": [
-            {
-                "geoPostalCode": "92694",
-                "geoCity": "LADERA RANCH",
-                "geoCounty": "ORANGE",
-                "geoState": "CA",
-                "taxSales": 0.0775,
-                "taxUse": 0.0775,
-                "txbService": "N",
-                "txbFreight": "N",
-                "stateSalesTax": 0.06,
-                "stateUseTax": 0.06,
-                "citySalesTax": 0.0,
-                "cityUseTax": 0.0,
-                "cityTaxCode": "",
-                "countySalesTax": 0.0025,
-                "countyUseTax": 0.0025,
-                "countyTaxCode": "30",
-                "districtSalesTax": 0.015,
-                "districtUseTax": 0.015,
-                "district1Code": "26",
-                "district1SalesTax": 0.005,
-                "district1UseTax": 0.005,
-                "district2Code": "38",
-                "district2SalesTax": 0.01,
-                "district2UseTax": 0.01,
-                "district3Code": "",
-                "district3SalesTax": 0.0,
-                "district3UseTax": 0.0,
-                "district4Code": "",
-                "district4SalesTax": 0.0,
-                "district4UseTax": 0.0,
-                "district5Code": "",
-                "district5SalesTax": 0.0,
-                "district5UseTax": 0.0,
-                "originDestination": "D",
-            }
-        ],
-        "addressDetail": {
-            "normalizedAddress": "",
-            "incorporated": "",
-            "geoLat": 0.0,
-            "geoLng": 0.0,
-        },
-    }
+    return _freeze(_SAMPLES["postal_code_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_calculate_cart_response():
     """Sample CalculateCartResponse data for testing (matches actual API format)."""
-    return {
-        "items": [
-            {
-                "cartId": "ce4a1234-5678-90ab-cdef-1234567890ab",
-                "customerId": "customer-453",
-                "destination": {
-                    "address": "200 Spectrum Center Dr, Irvine, CA 92618-1905"
-                },
-                "origin": {
-                    "address": "323 Washington Ave N, Minneapolis, MN 55401-2427"
-                },
-                "lineItems": [
-                    {
-                        "itemId": "item-1",
-                        "price": 10.75,
-                        "quantity": 1.5,
-                        "tax": {"rate": 0.09025, "amount": 1.45528},
-                    },
-                    {
-                        "itemId": "item-2",
-                        "price": 25.00,
-                        "quantity": 2.0,
-                        "tax": {"rate": 0.09025, "amount": 4.5125},
-                    },
-                ],
-            }
-        ]
-    }
+    return _freeze(_SAMPLES["calculate_cart_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_taxcloud_calculate_cart_response():
     """Sample TaxCloudCalculateCartResponse data for testing."""
-    return {
-        "connectionId": "test-connection-id-uuid",
-        "items": [
-            {
-                "cartId": "ce4a1234-5678-90ab-cdef-1234567890ab",
-                "customerId": "customer-453",
-                "currency": {"currencyCode": "USD"},
-                "deliveredBySeller": False,
-                "destination": {
-                    "line1": "200 Spectrum Center Dr",
-                    "city": "Irvine",
-                    "state": "CA",
-                    "zip": "92618-1905",
-                    "countryCode": "US",
-                },
-                "origin": {
-                    "line1": "323 Washington Ave N",
-                    "city": "Minneapolis",
-                    "state": "MN",
-                    "zip": "55401-2427",
-                    "countryCode": "US",
-                },
-                "exemption": {
-                    "exemptionId": None,
-                    "isExempt": None,
-                },
-                "lineItems": [
-                    {
-                        "index": 0,
-                        "itemId": "item-1",
-                        "price": 10.75,
-                        "quantity": 1.5,
-                        "tax": {"amount": 1.46, "rate": 0.0903},
-                        "tic": 0,
-                    },
-                    {
-                        "index": 1,
-                        "itemId": "item-2",
-                        "price": 25.00,
-                        "quantity": 2.0,
-                        "tax": {"amount": 4.52, "rate": 0.0903},
-                        "tic": 0,
-                    },
-                ],
-            }
-        ],
-        "transactionDate": "2024-01-15T09:30:00Z",
-    }
+    return _freeze(_SAMPLES["taxcloud_calculate_cart_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_response():
     """Sample TaxCloud OrderResponse data for testing."""
-    return {
-        "orderId": "test-order-1",
-        "customerId": "customer-1",
-        "connectionId": "test-connection-id-uuid",
-        "transactionDate": "2024-01-15T09:30:00Z",
-        "completedDate": "2024-01-15T09:30:00Z",
-        "origin": {
-            "line1": "323 Washington Ave N",
-            "city": "Minneapolis",
-            "state": "MN",
-            "zip": "55401",
-            "countryCode": "US",
-        },
-        "destination": {
-            "line1": "323 Washington Ave N",
-            "city": "Minneapolis",
-            "state": "MN",
-            "zip": "55401",
-            "countryCode": "US",
-        },
-        "lineItems": [
+    return _freeze(_SAMPLES["order_response"])
+
+
+@pytest.fixture(scope="session")
+def sample_create_order_request():
+    """Sample CreateOrderRequest; use ``model_copy(update=...)`` to vary it."""
+    address = {
+        "line1": "323 Washington Ave N",
+        "city": "Minneapolis",
+        "state": "MN",
+        "zip": "55401",
+    }
+    return CreateOrderRequest(
+        order_id="test-order-1",
+        customer_id="customer-1",
+        transaction_date="2024-01-15T09:30:00Z",
+        completed_date="2024-01-15T09:30:00Z",
+        origin=address,
+        destination=address,
+        line_items=[
             {
                 "index": 0,
                 "itemId": "item-1",
                 "price": 10.80,
                 "quantity": 1.5,
                 "tax": {"amount": 1.31, "rate": 0.0813},
-                "tic": 0,
             }
         ],
-        "currency": {"currencyCode": "USD"},
-        "deliveredBySeller": False,
-        "excludeFromFiling": False,
-    }
+        currency={"currencyCode": "USD"},
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_create_order_from_cart_response():
     """Sample TaxCloud OrderResponse data for CreateOrderFromCart testing."""
-    return {
-        "orderId": "my-order-1",
-        "customerId": "customer-453",
-        "connectionId": "test-connection-id-uuid",
-        "transactionDate": "2024-01-15T09:30:00Z",
-        "origin": {
-            "line1": "323 Washington Ave N",
-            "city": "Minneapolis",
-            "state": "MN",
-            "zip": "55401-2427",
-            "countryCode": "US",
-        },
-        "destination": {
-            "line1": "200 Spectrum Center Dr",
-            "city": "Irvine",
-            "state": "CA",
-            "zip": "92618-1905",
-            "countryCode": "US",
-        },
-        "lineItems": [
-            {
-                "index": 0,
-                "itemId": "item-1",
-                "price": 10.75,
-                "quantity": 1.5,
-                "tax": {"amount": 1.46, "rate": 0.0903},
-                "tic": 0,
-            }
-        ],
-        "currency": {"currencyCode": "USD"},
-        "deliveredBySeller": False,
-        "excludeFromFiling": False,
-    }
+    return _freeze(_SAMPLES["create_order_from_cart_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_product_code_search_response():
     """Sample ProductCodeSearchResponse data for testing."""
-    return {
-        "query": "baked goods sold in plastic packaging",
-        "results": [
-            {
-                "ticId": "41030",
-                "label": "Bakery Items",
-                "naturalLabel": "Bakery Items",
-                "description": (
-                    "Bakery items sold without eating utensils "
-                    "provided by the seller"
-                ),
-                "documentation": (
-                    "Bakery items sold without eating utensils "
-                    "provided by the seller, not sold as a prepared food"
-                ),
-                "rank": "1",
-                "score": "0.891025641025641",
-            },
-            {
-                "ticId": "40030",
-                "label": "Food and Food Ingredients",
-                "naturalLabel": "Food and Food Ingredients",
-                "description": "Food and food ingredients for human consumption",
-                "documentation": (
-                    "Food and food ingredients for human consumption "
-                    "that are not candy, dietary supplements, or soft drinks"
-                ),
-                "rank": "2",
-                "score": "0.750512820512821",
-            },
-        ],
-    }
+    return _freeze(_SAMPLES["product_code_search_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_product_code_recommendation_response():
     """Sample ProductCodeRecommendationResponse data for testing."""
-    return {
-        "predictions": [
-            {
-                "status": "success",
-                "error": None,
-                "ticId": "41030",
-                "label": "Bakery Items",
-                "naturalLabel": "Bakery Items",
-                "tic_description": (
-                    "Bakery items sold without eating utensils "
-                    "provided by the seller"
-                ),
-                "product_description": "baked goods sold in plastic packaging",
-            }
-        ]
-    }
+    return _freeze(_SAMPLES["product_code_recommendation_response"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_refund_response():
     """Sample TaxCloud RefundTransactionResponse data for testing."""
-    return {
-        "connectionId": "test-connection-id-uuid",
-        "createdDate": "2024-01-16T10:00:00Z",
-        "items": [
-            {
-                "index": 0,
-                "itemId": "item-1",
-                "price": 10.80,
-                "quantity": 1.0,
-                "tax": {"amount": 0.88},
-                "tic": 0,
-            }
-        ],
-    }
+    return _freeze(_SAMPLES["refund_response"])
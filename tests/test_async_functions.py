@@ -0,0 +1,562 @@
+"""Tests for async API functions."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ziptax import AsyncZipTaxClient
+from ziptax.config import Config
+from ziptax.exceptions import (
+    ZipTaxCloudConfigError,
+    ZipTaxNotFoundError,
+    ZipTaxServerError,
+    ZipTaxValidationError,
+)
+from ziptax.models import (
+    CalculateCartRequest,
+    CalculateCartResponse,
+    CartAddress,
+    CartCurrency,
+    CartItem,
+    CartLineItem,
+    CreateOrderFromCartRequest,
+    OrderResponse,
+    ProductCodeSearchResponse,
+    RefundTransactionResponse,
+    TaxCloudCalculateCartResponse,
+    UpdateOrderRequest,
+    V60AccountMetrics,
+    V60PostalCodeResponse,
+    V60Response,
+)
+from ziptax.resources.async_functions import AsyncFunctions
+
+
+def _json_bytes(data):
+    """Encode response data as the raw JSON body returned by the HTTP client."""
+    return json.dumps(data, default=dict).encode()
+
+
+def _build_cart_request():
+    """Build a sample CalculateCartRequest for testing."""
+    return CalculateCartRequest(
+        items=[
+            CartItem(
+                customer_id="customer-453",
+                currency=CartCurrency(currency_code="USD"),
+                destination=CartAddress(
+                    address="200 Spectrum Center Dr, Irvine, CA 92618-1905"
+                ),
+                origin=CartAddress(
+                    address="323 Washington Ave N, Minneapolis, MN 55401-2427"
+                ),
+                line_items=[
+                    CartLineItem(item_id="item-1", price=10.75, quantity=1.5),
+                ],
+            )
+        ]
+    )
+
+
+class TestAsyncRateLookups:
+    """Test cases for async rate lookup functions."""
+
+    async def test_get_sales_tax_by_address(
+        self, mock_async_http_client, mock_config, sample_v60_response
+    ):
+        """Test basic async address request."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        response = await functions.GetSalesTaxByAddress(
+            "200 Spectrum Center Drive, Irvine, CA 92618"
+        )
+
+        assert isinstance(response, V60Response)
+        call_args = mock_async_http_client.get_bytes.call_args
+        assert call_args[0][0] == "/request/v60/"
+        assert call_args[1]["params"]["countryCode"] == "USA"
+
+    async def test_address_validation(self, mock_async_http_client, mock_config):
+        """Test that invalid input is rejected before any request."""
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        with pytest.raises(ZipTaxValidationError):
+            await functions.GetSalesTaxByAddress("")
+
+        mock_async_http_client.get_bytes.assert_not_called()
+
+    async def test_get_sales_tax_by_addresses(
+        self, mock_async_http_client, mock_config, sample_v60_response
+    ):
+        """Test concurrent address lookups dedupe and keep input order."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        responses = await functions.GetSalesTaxByAddresses([address, address])
+
+        assert len(responses) == 2
+        assert responses[0] == responses[1]
+        assert responses[0] is not responses[1]
+        mock_async_http_client.get_bytes.assert_called_once()
+
+    async def test_duplicate_results_are_independent(
+        self, mock_async_http_client, mock_config, sample_v60_response
+    ):
+        """Test mutating one result leaves duplicates and the cache intact."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        responses = await functions.GetSalesTaxByAddresses([address, address])
+        responses[0].metadata.response.message = "changed"
+
+        assert responses[1].metadata.response.message != "changed"
+        cached = await functions.GetSalesTaxByAddress(address)
+        assert cached.metadata.response.message != "changed"
+        mock_async_http_client.get_bytes.assert_called_once()
+
+    async def test_get_sales_tax_by_geolocation(
+        self, mock_async_http_client, mock_config, sample_v60_response
+    ):
+        """Test basic async geolocation request."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        response = await functions.GetSalesTaxByGeoLocation("33.6489", "-117.8386")
+
+        assert isinstance(response, V60Response)
+        call_args = mock_async_http_client.get_bytes.call_args
+        assert call_args[1]["params"]["lat"] == "33.6489"
+
+    async def test_get_account_metrics(
+        self, mock_async_http_client, mock_config, sample_account_metrics
+    ):
+        """Test async account metrics request."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(
+            sample_account_metrics
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        response = await functions.GetAccountMetrics()
+
+        assert isinstance(response, V60AccountMetrics)
+        assert mock_async_http_client.get_bytes.call_args[0][0] == (
+            "/account/v60/metrics"
+        )
+
+    async def test_repeated_lookup_served_from_cache(
+        self, mock_async_http_client, mock_config, sample_postal_code_response
+    ):
+        """Test that a repeated postal code lookup hits the cache."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        first = await functions.GetRatesByPostalCode("92694")
+        second = await functions.GetRatesByPostalCode("92694")
+
+        assert isinstance(first, V60PostalCodeResponse)
+        assert second == first
+        assert second is not first
+        mock_async_http_client.get_bytes.assert_called_once()
+
+    async def test_mutating_result_does_not_affect_cache(
+        self, mock_async_http_client, mock_config, sample_postal_code_response
+    ):
+        """Test a caller mutating its response does not corrupt the cache."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        first = await functions.GetRatesByPostalCode("92694")
+        first.results.clear()
+        second = await functions.GetRatesByPostalCode("92694")
+
+        assert second.results
+        mock_async_http_client.get_bytes.assert_called_once()
+
+    async def test_concurrent_lookups_share_one_request(
+        self, mock_async_http_client, mock_api_key, sample_postal_code_response
+    ):
+        """Test concurrent lookups for the same postal code are coalesced."""
+        config = Config(api_key=mock_api_key, cache_maxsize=0)
+
+        async def slow_get_bytes(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _json_bytes(sample_postal_code_response)
+
+        mock_async_http_client.get_bytes.side_effect = slow_get_bytes
+        functions = AsyncFunctions(mock_async_http_client, config)
+
+        responses = await asyncio.gather(
+            *(functions.GetRatesByPostalCode("92694") for _ in range(3))
+        )
+
+        assert all(response == responses[0] for response in responses)
+        assert len({id(response) for response in responses}) == 3
+        mock_async_http_client.get_bytes.assert_called_once()
+
+    async def test_get_rates_by_postal_codes(
+        self, mock_async_http_client, mock_config, sample_postal_code_response
+    ):
+        """Test concurrent postal code lookups dedupe and keep input order."""
+        mock_async_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        responses = await functions.GetRatesByPostalCodes(["92694", "92618", "92694"])
+
+        assert len(responses) == 3
+        assert responses[0] == responses[2]
+        assert responses[0] is not responses[2]
+        requested = [
+            call[1]["params"]["postalcode"]
+            for call in mock_async_http_client.get_bytes.call_args_list
+        ]
+        assert sorted(requested) == ["92618", "92694"]
+
+    async def test_retry_on_server_error(
+        self, mock_async_http_client, mock_config, sample_v60_response
+    ):
+        """Test that transient server errors are retried."""
+        mock_async_http_client.get_bytes.side_effect = [
+            ZipTaxServerError("Server error", 503, None),
+            _json_bytes(sample_v60_response),
+        ]
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            response = await functions.GetSalesTaxByGeoLocation("33.6489", "-117.8386")
+
+        assert isinstance(response, V60Response)
+        assert mock_async_http_client.get_bytes.call_count == 2
+
+    async def test_search_product_codes(
+        self,
+        mock_async_http_client,
+        mock_config,
+        sample_product_code_search_response,
+    ):
+        """Test async product code search."""
+        mock_async_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        response = await functions.SearchProductCodes("baked goods")
+
+        assert isinstance(response, ProductCodeSearchResponse)
+        call_args = mock_async_http_client.post_bytes.call_args
+        assert call_args[0][0] == "/search/tic"
+        assert json.loads(call_args[1]["content"]) == {"query": "baked goods"}
+
+
+class TestAsyncCalculateCart:
+    """Test cases for async CalculateCart routing."""
+
+    async def test_routes_to_ziptax(
+        self,
+        mock_async_http_client,
+        mock_config,
+        sample_calculate_cart_response,
+    ):
+        """Test that carts go to the ZipTax API without TaxCloud config."""
+        mock_async_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        response = await functions.CalculateCart(_build_cart_request())
+
+        assert isinstance(response, CalculateCartResponse)
+        call_args = mock_async_http_client.post_bytes.call_args
+        assert call_args[0][0] == "/calculate/cart"
+        body = json.loads(call_args[1]["content"])
+        assert body["items"][0]["customerId"] == "customer-453"
+
+    async def test_routes_to_taxcloud(
+        self,
+        mock_async_http_client,
+        mock_taxcloud_config,
+        mock_async_taxcloud_http_client,
+        sample_taxcloud_calculate_cart_response,
+    ):
+        """Test that carts go to TaxCloud when it is configured."""
+        mock_async_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_taxcloud_calculate_cart_response
+        )
+        functions = AsyncFunctions(
+            mock_async_http_client,
+            mock_taxcloud_config,
+            taxcloud_http_client=mock_async_taxcloud_http_client,
+        )
+
+        response = await functions.CalculateCart(_build_cart_request())
+
+        assert isinstance(response, TaxCloudCalculateCartResponse)
+        call_args = mock_async_taxcloud_http_client.post_bytes.call_args
+        assert call_args[0][0] == "/tax/connections/test-connection-id-uuid/carts"
+        mock_async_http_client.post_bytes.assert_not_called()
+
+    async def test_calculate_carts_runs_concurrently(
+        self,
+        mock_async_http_client,
+        mock_config,
+        sample_calculate_cart_response,
+    ):
+        """Test that CalculateCarts overlaps requests and keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        async def post_bytes(path, content):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            body = json.loads(content)
+            data = dict(sample_calculate_cart_response)
+            data["items"] = [
+                dict(
+                    sample_calculate_cart_response["items"][0],
+                    customerId=body["items"][0]["customerId"],
+                )
+            ]
+            return _json_bytes(data)
+
+        mock_async_http_client.post_bytes.side_effect = post_bytes
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+        carts = []
+        for customer_id in ("customer-1", "customer-2", "customer-3"):
+            cart = _build_cart_request()
+            cart.items[0].customer_id = customer_id
+            carts.append(cart)
+
+        responses = await functions.CalculateCarts(carts)
+
+        assert [r.items[0].customer_id for r in responses] == [
+            "customer-1",
+            "customer-2",
+            "customer-3",
+        ]
+        assert peak == 3
+
+    @pytest.mark.parametrize("max_concurrency, expected_peak", [(1, 1), (2, 2)])
+    async def test_batch_max_concurrency(
+        self,
+        mock_async_http_client,
+        mock_config,
+        sample_postal_code_response,
+        max_concurrency,
+        expected_peak,
+    ):
+        """Test max_concurrency bounds the requests in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def get_bytes(path, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _json_bytes(sample_postal_code_response)
+
+        mock_async_http_client.get_bytes.side_effect = get_bytes
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        responses = await functions.GetRatesByPostalCodes(
+            ["92694", "92618", "10001", "60601"], max_concurrency=max_concurrency
+        )
+
+        assert len(responses) == 4
+        assert peak == expected_peak
+
+    async def test_batch_invalid_max_concurrency(
+        self, mock_async_http_client, mock_config
+    ):
+        """Test a max_concurrency below 1 is rejected."""
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await functions.GetRatesByPostalCodes(["92694"], max_concurrency=0)
+
+
+class TestAsyncTaxCloudFunctions:
+    """Test cases for async TaxCloud order management functions."""
+
+    @pytest.fixture
+    def functions(
+        self,
+        mock_async_http_client,
+        mock_taxcloud_config,
+        mock_async_taxcloud_http_client,
+    ):
+        """AsyncFunctions configured with a TaxCloud client."""
+        return AsyncFunctions(
+            mock_async_http_client,
+            mock_taxcloud_config,
+            taxcloud_http_client=mock_async_taxcloud_http_client,
+        )
+
+    async def test_get_order(
+        self, functions, mock_async_taxcloud_http_client, sample_order_response
+    ):
+        """Test retrieving an order."""
+        mock_async_taxcloud_http_client.get_bytes.return_value = _json_bytes(
+            sample_order_response
+        )
+
+        response = await functions.GetOrder("test-order-1")
+
+        assert isinstance(response, OrderResponse)
+        mock_async_taxcloud_http_client.get_bytes.assert_called_once_with(
+            "/tax/connections/test-connection-id-uuid/orders/test-order-1"
+        )
+
+    async def test_get_orders_return_exceptions(
+        self, functions, mock_async_taxcloud_http_client, sample_order_response
+    ):
+        """Test a failed order is returned in place when return_exceptions is set."""
+        error = ZipTaxNotFoundError("Order not found", 404)
+
+        async def get_bytes(path):
+            if path.endswith("/missing"):
+                raise error
+            return _json_bytes(sample_order_response)
+
+        mock_async_taxcloud_http_client.get_bytes.side_effect = get_bytes
+
+        responses = await functions.GetOrders(
+            ["test-order-1", "missing"], return_exceptions=True
+        )
+
+        assert isinstance(responses[0], OrderResponse)
+        assert responses[1] is error
+        with pytest.raises(ZipTaxNotFoundError):
+            await functions.GetOrders(["missing"])
+
+    async def test_get_orders_failure_cancels_siblings(
+        self, functions, mock_async_taxcloud_http_client
+    ):
+        """Test a failing order cancels the lookups still in flight."""
+        cancelled = []
+
+        async def get_bytes(path):
+            if path.endswith("/missing"):
+                raise ZipTaxNotFoundError("Order not found", 404)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(path)
+                raise
+
+        mock_async_taxcloud_http_client.get_bytes.side_effect = get_bytes
+
+        with pytest.raises(ZipTaxNotFoundError):
+            await functions.GetOrders(["test-order-1", "missing", "test-order-2"])
+
+        assert len(cancelled) == 2
+
+    async def test_update_order(
+        self, functions, mock_async_taxcloud_http_client, sample_order_response
+    ):
+        """Test updating an order."""
+        mock_async_taxcloud_http_client.patch_bytes.return_value = _json_bytes(
+            sample_order_response
+        )
+
+        request = UpdateOrderRequest(completed_date="2024-01-16T10:00:00Z")
+        response = await functions.UpdateOrder("test-order-1", request)
+
+        assert isinstance(response, OrderResponse)
+        mock_async_taxcloud_http_client.patch_bytes.assert_called_once()
+
+    async def test_refund_order_single_dict_response(
+        self, functions, mock_async_taxcloud_http_client, sample_refund_response
+    ):
+        """Test that a single refund object is wrapped in a list."""
+        mock_async_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_refund_response
+        )
+
+        response = await functions.RefundOrder("test-order-1")
+
+        assert len(response) == 1
+        assert isinstance(response[0], RefundTransactionResponse)
+        call_args = mock_async_taxcloud_http_client.post_bytes.call_args
+        assert call_args[1]["content"] == b"{}"
+
+    async def test_create_order_from_cart(
+        self,
+        functions,
+        mock_async_taxcloud_http_client,
+        sample_create_order_from_cart_response,
+    ):
+        """Test creating an order from a cart."""
+        mock_async_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_create_order_from_cart_response
+        )
+
+        request = CreateOrderFromCartRequest(
+            cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
+            order_id="my-order-1",
+        )
+        response = await functions.CreateOrderFromCart(request)
+
+        assert isinstance(response, OrderResponse)
+        assert response.order_id == "my-order-1"
+
+    async def test_without_taxcloud_config_raises(
+        self, mock_async_http_client, mock_config
+    ):
+        """Test that TaxCloud functions raise without TaxCloud config."""
+        functions = AsyncFunctions(mock_async_http_client, mock_config)
+
+        with pytest.raises(ZipTaxCloudConfigError):
+            await functions.GetOrder("test-order-1")
+
+
+class TestAsyncZipTaxClient:
+    """Test cases for AsyncZipTaxClient."""
+
+    async def test_api_key_creates_client(self, mock_api_key):
+        """Test creating an async client with an API key."""
+        async with AsyncZipTaxClient.api_key(mock_api_key) as client:
+            assert isinstance(client.request, AsyncFunctions)
+            assert client._taxcloud_http_client is None
+            assert repr(client) == (
+                "AsyncZipTaxClient(base_url=https://api.zip-tax.com)"
+            )
+
+    async def test_taxcloud_client_created(self, mock_api_key):
+        """Test that a TaxCloud client is created when configured."""
+        client = AsyncZipTaxClient.api_key(
+            mock_api_key,
+            taxcloud_connection_id="test-connection-id-uuid",
+            taxcloud_api_key="test-taxcloud-api-key-1234567890",
+        )
+
+        assert client._taxcloud_http_client is not None
+        assert client.request._use_taxcloud is True
+        await client.close()
+
+    async def test_retry_policy_forwarded(self, mock_api_key):
+        """Test the retry cap and jitter strategy reach AsyncFunctions."""
+        async with AsyncZipTaxClient.api_key(
+            mock_api_key, retry_max_delay=10.0, retry_jitter="decorrelated"
+        ) as client:
+            assert client.request.retry_max_delay == 10.0
+            assert client.request.retry_jitter == "decorrelated"
+
+    def test_invalid_api_key(self):
+        """Test that an invalid API key is rejected."""
+        with pytest.raises(ZipTaxValidationError):
+            AsyncZipTaxClient.api_key("")
@@ -0,0 +1,68 @@
+"""Tests for caching utilities."""
+
+from unittest.mock import patch
+
+from ziptax.utils.cache import TTLCache
+
+
+def test_cache_get_missing_key():
+    """Test get returns None for a missing key."""
+    cache = TTLCache()
+
+    assert cache.get("missing") is None
+
+
+def test_cache_set_and_get():
+    """Test a stored value can be retrieved."""
+    cache = TTLCache()
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert len(cache) == 1
+
+
+def test_cache_entry_expires():
+    """Test entries expire after the TTL."""
+    cache = TTLCache(ttl=10.0)
+
+    with patch("ziptax.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("ziptax.utils.cache.time.monotonic", return_value=109.0):
+        assert cache.get("key") == "value"
+    with patch("ziptax.utils.cache.time.monotonic", return_value=110.0):
+        assert cache.get("key") is None
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_disabled_with_zero_maxsize():
+    """Test a maxsize of 0 disables caching."""
+    cache = TTLCache(maxsize=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    """Test clear removes all entries."""
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
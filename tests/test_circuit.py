@@ -0,0 +1,134 @@
+"""Tests for the circuit breaker."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from ziptax.exceptions import ZipTaxAPIError, ZipTaxCircuitOpenError
+from ziptax.utils.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def _open_breaker(breaker):
+    """Record enough failures to open the breaker."""
+    for _ in range(breaker.failure_threshold):
+        breaker.allow()
+        breaker.record_failure()
+
+
+def test_circuit_starts_closed():
+    """Test a new breaker allows requests."""
+    breaker = CircuitBreaker()
+
+    breaker.allow()
+    assert breaker.state == CLOSED
+
+
+def test_circuit_opens_after_threshold():
+    """Test the breaker opens after consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=100.0):
+        _open_breaker(breaker)
+        assert breaker.state == OPEN
+
+        with pytest.raises(ZipTaxCircuitOpenError, match="Circuit open"):
+            breaker.allow()
+
+
+def test_circuit_open_error_is_api_error():
+    """Test the fail-fast error is a ZipTaxAPIError."""
+    assert issubclass(ZipTaxCircuitOpenError, ZipTaxAPIError)
+
+
+def test_circuit_success_resets_failures():
+    """Test a success resets the consecutive failure count."""
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_circuit_logs_state_changes(caplog):
+    """Test opening and closing the circuit is logged with lazy arguments."""
+    breaker = CircuitBreaker(failure_threshold=2, name="https://api.zip-tax.com")
+
+    with caplog.at_level(logging.INFO, logger="ziptax.utils.circuit"):
+        _open_breaker(breaker)
+        breaker.record_success()
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "Circuit opened for https://api.zip-tax.com after 2 consecutive failures",
+        "Circuit closed for https://api.zip-tax.com",
+    ]
+    assert caplog.records[0].args == ("https://api.zip-tax.com", 2)
+
+
+def test_circuit_half_open_allows_single_probe():
+    """Test a single probe is let through after the recovery time."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30.0)
+
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=100.0):
+        _open_breaker(breaker)
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=130.0):
+        breaker.allow()
+        assert breaker.state == HALF_OPEN
+
+        with pytest.raises(ZipTaxCircuitOpenError, match="probe in progress"):
+            breaker.allow()
+
+
+def test_circuit_probe_success_closes():
+    """Test a successful probe closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30.0)
+
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=100.0):
+        _open_breaker(breaker)
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=130.0):
+        breaker.allow()
+        breaker.record_success()
+
+    assert breaker.state == CLOSED
+    breaker.allow()
+
+
+def test_circuit_probe_failure_reopens():
+    """Test a failed probe re-opens the circuit for another recovery period."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=30.0)
+
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=100.0):
+        _open_breaker(breaker)
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=130.0):
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=159.0):
+        with pytest.raises(ZipTaxCircuitOpenError):
+            breaker.allow()
+
+
+def test_circuit_released_probe_allows_next_probe():
+    """Test releasing an unfinished probe lets the next request probe."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30.0)
+
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=100.0):
+        _open_breaker(breaker)
+    with patch("ziptax.utils.circuit.time.monotonic", return_value=130.0):
+        breaker.allow()
+        breaker.release_probe()
+        breaker.allow()
+        assert breaker.state == HALF_OPEN
+
+
+def test_circuit_disabled_with_zero_threshold():
+    """Test a failure threshold of 0 disables the breaker."""
+    breaker = CircuitBreaker(failure_threshold=0)
+
+    for _ in range(10):
+        breaker.record_failure()
+
+    breaker.allow()
+    assert breaker.state == CLOSED
@@ -28,12 +28,18 @@ class TestZipTaxClient:
             timeout=60,
             max_retries=5,
             retry_delay=2.0,
+            retry_max_delay=10.0,
+            retry_jitter="decorrelated",
         )
 
         assert client.config.base_url == "https://custom.api.com"
         assert client.config.timeout == 60
         assert client.config.max_retries == 5
         assert client.config.retry_delay == 2.0
+        assert client.config.retry_max_delay == 10.0
+        assert client.request.retry_max_delay == 10.0
+        assert client.config.retry_jitter == "decorrelated"
+        assert client.request.retry_jitter == "decorrelated"
 
     def test_api_key_validation(self):
         """Test API key validation."""
@@ -93,19 +99,16 @@ class TestZipTaxClient:
             assert client is not None
             assert isinstance(client, ZipTaxClient)
 
-    def test_repr(self, mock_api_key):
+    def test_repr(self, session_client):
         """Test string representation of client."""
-        client = ZipTaxClient.api_key(mock_api_key)
-        repr_str = repr(client)
+        repr_str = repr(session_client)
 
         assert "ZipTaxClient" in repr_str
         assert "https://api.zip-tax.com" in repr_str
 
-    def test_request_attribute(self, mock_api_key):
+    def test_request_attribute(self, session_client):
         """Test that client has request attribute."""
-        client = ZipTaxClient.api_key(mock_api_key)
-
-        assert hasattr(client, "request")
-        assert hasattr(client.request, "GetSalesTaxByAddress")
-        assert hasattr(client.request, "GetSalesTaxByGeoLocation")
-        assert hasattr(client.request, "GetAccountMetrics")
+        assert hasattr(session_client, "request")
+        assert hasattr(session_client.request, "GetSalesTaxByAddress")
+        assert hasattr(session_client.request, "GetSalesTaxByGeoLocation")
+        assert hasattr(session_client.request, "GetAccountMetrics")
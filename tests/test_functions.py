@@ -1,9 +1,23 @@
 """Tests for API functions."""
 
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
-from ziptax.exceptions import ZipTaxCloudConfigError, ZipTaxValidationError
+from ziptax.config import Config
+from ziptax.exceptions import (
+    ZipTaxCircuitOpenError,
+    ZipTaxCloudConfigError,
+    ZipTaxNotFoundError,
+    ZipTaxRetryError,
+    ZipTaxServerError,
+    ZipTaxValidationError,
+)
 from ziptax.models import (
     CalculateCartRequest,
     CalculateCartResponse,
@@ -12,12 +26,12 @@ from ziptax.models import (
     CartItem,
     CartLineItem,
     CreateOrderFromCartRequest,
-    CreateOrderRequest,
     OrderResponse,
     ProductCodeRecommendationResponse,
     ProductCodeSearchResponse,
     RefundTransactionRequest,
     RefundTransactionResponse,
+    TaxCloudAddress,
     TaxCloudCalculateCartResponse,
     UpdateOrderRequest,
     V60AccountMetrics,
@@ -25,15 +39,24 @@ from ziptax.models import (
     V60Response,
 )
 from ziptax.resources.functions import Functions
+from ziptax.utils.validation import parse_address_string
+
+
+def _json_bytes(data):
+    """Encode response data as the raw JSON body returned by the HTTP client."""
+    return json.dumps(data, default=dict).encode()
+
+
+# Baseline arguments for validation tests; each case overrides one of them
+_VALID_ADDRESS_ARGS = {"address": "200 Spectrum Center Drive"}
 
 
 class TestGetSalesTaxByAddress:
     """Test cases for GetSalesTaxByAddress function."""
 
-    def test_basic_request(self, mock_http_client, mock_config, sample_v60_response):
+    def test_basic_request(self, mock_http_client, functions, sample_v60_response):
         """Test basic address request."""
-        mock_http_client.get.return_value = sample_v60_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
 
         response = functions.GetSalesTaxByAddress(
             "200 Spectrum Center Drive, Irvine, CA 92618"
@@ -42,14 +65,13 @@ class TestGetSalesTaxByAddress:
         assert isinstance(response, V60Response)
         assert response.metadata.version == "v60"
         assert response.metadata.response.code == 100
-        mock_http_client.get.assert_called_once()
+        mock_http_client.get_bytes.assert_called_once()
 
     def test_with_optional_parameters(
-        self, mock_http_client, mock_config, sample_v60_response
+        self, mock_http_client, functions, sample_v60_response
     ):
         """Test request with optional parameters."""
-        mock_http_client.get.return_value = sample_v60_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
 
         response = functions.GetSalesTaxByAddress(
             address="200 Spectrum Center Drive, Irvine, CA 92618",
@@ -60,7 +82,7 @@ class TestGetSalesTaxByAddress:
         )
 
         assert isinstance(response, V60Response)
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.get_bytes.call_args
         assert (
             call_args[1]["params"]["address"]
             == "200 Spectrum Center Drive, Irvine, CA 92618"
@@ -68,49 +90,200 @@ class TestGetSalesTaxByAddress:
         assert call_args[1]["params"]["taxabilityCode"] == "12345"
         assert call_args[1]["params"]["historical"] == "202401"
 
-    def test_empty_address_validation(self, mock_http_client, mock_config):
-        """Test validation of empty address."""
-        functions = Functions(mock_http_client, mock_config)
+    def test_repeated_lookup_served_from_cache(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test identical address lookups are served from the cache."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        functions.GetSalesTaxByAddress(address)
+        functions.GetSalesTaxByAddress(address)
+        functions.GetSalesTaxByAddress(address, historical="202401")
 
-        with pytest.raises(ZipTaxValidationError, match="Address cannot be empty"):
-            functions.GetSalesTaxByAddress("")
+        assert mock_http_client.get_bytes.call_count == 2
 
-    def test_address_too_long_validation(self, mock_http_client, mock_config):
-        """Test validation of address length."""
-        functions = Functions(mock_http_client, mock_config)
-        long_address = "a" * 101
+    def test_cache_key_normalizes_address_whitespace(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test lookups differing only in whitespace share a cache entry."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
 
-        with pytest.raises(ZipTaxValidationError, match="cannot exceed 100 characters"):
-            functions.GetSalesTaxByAddress(long_address)
+        functions.GetSalesTaxByAddress("200 Spectrum Center Drive, Irvine, CA 92618")
+        functions.GetSalesTaxByAddress(
+            "  200 Spectrum Center Drive,  Irvine, CA   92618 ", taxability_code=""
+        )
 
-    def test_invalid_country_code(self, mock_http_client, mock_config):
-        """Test validation of country code."""
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.assert_called_once()
 
-        with pytest.raises(ZipTaxValidationError, match="Country code must be one of"):
-            functions.GetSalesTaxByAddress(
-                "200 Spectrum Center Drive",
-                country_code="INVALID",
-            )
+    def test_failed_lookup_not_cached(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test a failed lookup is retried on the next call, not cached."""
+        mock_http_client.get_bytes.side_effect = [
+            ZipTaxValidationError("Bad request"),
+            _json_bytes(sample_v60_response),
+        ]
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        with pytest.raises(ZipTaxValidationError):
+            functions.GetSalesTaxByAddress(address)
+        response = functions.GetSalesTaxByAddress(address)
+
+        assert isinstance(response, V60Response)
+        assert mock_http_client.get_bytes.call_count == 2
 
-    def test_invalid_historical_format(self, mock_http_client, mock_config):
-        """Test validation of historical date format."""
-        functions = Functions(mock_http_client, mock_config)
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"address": ""}, "Address cannot be empty"),
+            ({"address": "a" * 101}, "cannot exceed 100 characters"),
+            ({"country_code": "INVALID"}, "Country code must be one of"),
+            ({"historical": "2024-13-01"}, "must be in YYYYMM format"),
+        ],
+    )
+    def test_invalid_arguments(self, functions, overrides, message):
+        """Test validation of the address, country code and historical date."""
+        with pytest.raises(ZipTaxValidationError, match=message):
+            functions.GetSalesTaxByAddress(**{**_VALID_ADDRESS_ARGS, **overrides})
 
+    def test_historical_trailing_newline_rejected(self, functions):
+        """Test that a trailing newline does not slip past the pattern."""
         with pytest.raises(ZipTaxValidationError, match="must be in YYYYMM format"):
             functions.GetSalesTaxByAddress(
                 "200 Spectrum Center Drive",
-                historical="2024-13-01",
+                historical="202401\n",
+            )
+
+    @pytest.mark.parametrize(
+        "historical, message",
+        [
+            ("189912", "Invalid year: 1899"),
+            ("202400", "Invalid month: 0"),
+            ("202413", "Invalid month: 13"),
+            ("２０２４０１", "must be in YYYYMM format"),
+        ],
+    )
+    def test_historical_out_of_range(self, functions, historical, message):
+        """Test year and month ranges and non-ASCII digits are rejected."""
+        with pytest.raises(ZipTaxValidationError, match=message):
+            functions.GetSalesTaxByAddress(
+                "200 Spectrum Center Drive", historical=historical
+            )
+
+
+class TestGetSalesTaxByAddresses:
+    """Test cases for GetSalesTaxByAddresses function."""
+
+    def test_returns_responses_in_order(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test batch lookup returns one response per address, in order."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        addresses = [
+            "200 Spectrum Center Drive, Irvine, CA 92618",
+            "323 Washington Ave N, Minneapolis, MN 55401",
+        ]
+
+        responses = functions.GetSalesTaxByAddresses(addresses)
+
+        assert len(responses) == 2
+        assert all(isinstance(r, V60Response) for r in responses)
+        requested = sorted(
+            call[1]["params"]["address"]
+            for call in mock_http_client.get_bytes.call_args_list
+        )
+        assert requested == sorted(addresses)
+
+    def test_duplicate_addresses_requested_once(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test duplicate addresses only trigger a single request."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        responses = functions.GetSalesTaxByAddresses([address, address])
+
+        assert responses[0] == responses[1]
+        assert responses[0] is not responses[1]
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_duplicate_results_are_independent(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test mutating one result leaves duplicates and the cache intact."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        address = "200 Spectrum Center Drive, Irvine, CA 92618"
+
+        responses = functions.GetSalesTaxByAddresses([address, address])
+        responses[0].metadata.response.message = "changed"
+
+        assert responses[1].metadata.response.message != "changed"
+        cached = functions.GetSalesTaxByAddress(address)
+        assert cached.metadata.response.message != "changed"
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_whitespace_variants_share_one_lookup(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test addresses differing only in whitespace reuse one response."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+
+        responses = functions.GetSalesTaxByAddresses(
+            [
+                "200 Spectrum Center Drive, Irvine, CA 92618",
+                "200  Spectrum Center Drive,  Irvine, CA 92618 ",
+            ]
+        )
+
+        assert responses[0] == responses[1]
+        assert responses[0] is not responses[1]
+        mock_http_client.get_bytes.assert_called_once()
+        params = mock_http_client.get_bytes.call_args[1]["params"]
+        assert params["address"] == "200 Spectrum Center Drive, Irvine, CA 92618"
+
+    def test_sequential_with_single_worker(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test max_workers=1 looks up addresses without a thread pool."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+
+        with patch("ziptax.resources.functions.ThreadPoolExecutor") as executor:
+            responses = functions.GetSalesTaxByAddresses(
+                ["123 Main St, Irvine, CA 92618", "456 Oak Ave, Irvine, CA 92618"],
+                max_workers=1,
             )
 
+        assert len(responses) == 2
+        executor.assert_not_called()
+
+    def test_invalid_address_fails_before_requests(self, mock_http_client, functions):
+        """Test an invalid address is rejected before any request is made."""
+        with pytest.raises(ZipTaxValidationError):
+            functions.GetSalesTaxByAddresses(["123 Main St, Irvine, CA 92618", ""])
+
+        mock_http_client.get_bytes.assert_not_called()
+
+    def test_each_address_validated_once(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test batch lookups do not re-validate inputs per request."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+        addresses = ["123 Main St, Irvine, CA 92618", "456 Oak Ave, Irvine, CA 92618"]
+
+        with patch("ziptax.resources.functions.validate_address_request") as validate:
+            functions.GetSalesTaxByAddresses(addresses, max_workers=1)
+
+        assert validate.call_count == 2
+        assert mock_http_client.get_bytes.call_count == 2
+
 
 class TestGetSalesTaxByGeoLocation:
     """Test cases for GetSalesTaxByGeoLocation function."""
 
-    def test_basic_request(self, mock_http_client, mock_config, sample_v60_response):
+    def test_basic_request(self, mock_http_client, functions, sample_v60_response):
         """Test basic geolocation request."""
-        mock_http_client.get.return_value = sample_v60_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
 
         response = functions.GetSalesTaxByGeoLocation(
             lat="33.6489",
@@ -120,14 +293,13 @@ class TestGetSalesTaxByGeoLocation:
         assert isinstance(response, V60Response)
         assert response.metadata.version == "v60"
         assert response.metadata.response.code == 100
-        mock_http_client.get.assert_called_once()
+        mock_http_client.get_bytes.assert_called_once()
 
     def test_with_optional_parameters(
-        self, mock_http_client, mock_config, sample_v60_response
+        self, mock_http_client, functions, sample_v60_response
     ):
         """Test request with optional parameters."""
-        mock_http_client.get.return_value = sample_v60_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
 
         response = functions.GetSalesTaxByGeoLocation(
             lat="33.6489",
@@ -138,131 +310,93 @@ class TestGetSalesTaxByGeoLocation:
         )
 
         assert isinstance(response, V60Response)
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.get_bytes.call_args
         assert call_args[1]["params"]["lat"] == "33.6489"
         assert call_args[1]["params"]["lng"] == "-117.8386"
 
-    def test_empty_coordinates_validation(self, mock_http_client, mock_config):
-        """Test validation of empty coordinates."""
-        functions = Functions(mock_http_client, mock_config)
-
-        with pytest.raises(ZipTaxValidationError, match="cannot be empty"):
-            functions.GetSalesTaxByGeoLocation(lat="", lng="")
-
-    def test_invalid_latitude_range(self, mock_http_client, mock_config):
-        """Test validation of latitude range."""
-        functions = Functions(mock_http_client, mock_config)
-
-        with pytest.raises(ZipTaxValidationError, match="Latitude must be between"):
-            functions.GetSalesTaxByGeoLocation(lat="100.0", lng="-117.8386")
-
-    def test_invalid_longitude_range(self, mock_http_client, mock_config):
-        """Test validation of longitude range."""
-        functions = Functions(mock_http_client, mock_config)
-
-        with pytest.raises(ZipTaxValidationError, match="Longitude must be between"):
-            functions.GetSalesTaxByGeoLocation(lat="33.6489", lng="200.0")
-
-    def test_invalid_coordinate_format(self, mock_http_client, mock_config):
-        """Test validation of coordinate format."""
-        functions = Functions(mock_http_client, mock_config)
-
-        with pytest.raises(ZipTaxValidationError, match="must be valid numbers"):
-            functions.GetSalesTaxByGeoLocation(lat="invalid", lng="-117.8386")
+    @pytest.mark.parametrize(
+        "lat, lng, message",
+        [
+            ("", "", "cannot be empty"),
+            ("100.0", "-117.8386", "Latitude must be between"),
+            ("33.6489", "200.0", "Longitude must be between"),
+            ("invalid", "-117.8386", "must be valid numbers"),
+        ],
+    )
+    def test_invalid_coordinates(self, functions, lat, lng, message):
+        """Test validation of empty, out-of-range and non-numeric coordinates."""
+        with pytest.raises(ZipTaxValidationError, match=message):
+            functions.GetSalesTaxByGeoLocation(lat=lat, lng=lng)
 
 
 class TestGetAccountMetrics:
     """Test cases for GetAccountMetrics function."""
 
-    def test_basic_request(self, mock_http_client, mock_config, sample_account_metrics):
-        """Test basic account metrics request."""
-        mock_http_client.get.return_value = sample_account_metrics
-        functions = Functions(mock_http_client, mock_config)
+    def test_basic_request(self, mock_http_client, functions, sample_account_metrics):
+        """Test basic account metrics request and parsed response fields."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_account_metrics)
 
         response = functions.GetAccountMetrics()
 
         assert isinstance(response, V60AccountMetrics)
         assert response.request_count == 15595
+        assert response.request_limit == 1000000
+        assert response.usage_percent == 1.5595
         assert response.is_active is True
-        mock_http_client.get.assert_called_once()
+        assert "support@zip.tax" in response.message
+        mock_http_client.get_bytes.assert_called_once()
 
     def test_with_key_parameter(
-        self, mock_http_client, mock_config, sample_account_metrics
+        self, mock_http_client, functions, sample_account_metrics
     ):
         """Test request with key parameter."""
-        mock_http_client.get.return_value = sample_account_metrics
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_account_metrics)
 
         response = functions.GetAccountMetrics(key="test-key")
 
         assert isinstance(response, V60AccountMetrics)
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.get_bytes.call_args
         assert call_args[1]["params"]["key"] == "test-key"
 
-    def test_response_fields(
-        self, mock_http_client, mock_config, sample_account_metrics
+    @pytest.mark.parametrize(
+        "prefix, count, limit, percent",
+        [("core_", 500, 10000, 5.0), ("geo_", 200, 5000, 4.0)],
+    )
+    def test_prefixed_fields(
+        self, mock_http_client, functions, prefix, count, limit, percent
     ):
-        """Test all response fields are properly parsed."""
-        mock_http_client.get.return_value = sample_account_metrics
-        functions = Functions(mock_http_client, mock_config)
-
-        response = functions.GetAccountMetrics()
-
-        assert response.request_count == 15595
-        assert response.request_limit == 1000000
-        assert response.usage_percent == 1.5595
-        assert response.is_active is True
-        assert "support@zip.tax" in response.message
-
-    def test_core_prefixed_fields(self, mock_http_client, mock_config):
-        """Test that core_* prefixed fields are accepted as aliases."""
-        mock_http_client.get.return_value = {
-            "core_request_count": 500,
-            "core_request_limit": 10000,
-            "core_usage_percent": 5.0,
-            "is_active": True,
-            "message": "OK",
-        }
-        functions = Functions(mock_http_client, mock_config)
-
-        response = functions.GetAccountMetrics()
-
-        assert isinstance(response, V60AccountMetrics)
-        assert response.request_count == 500
-        assert response.request_limit == 10000
-        assert response.usage_percent == 5.0
-
-    def test_geo_prefixed_fields(self, mock_http_client, mock_config):
-        """Test that geo_* prefixed fields are accepted as aliases."""
-        mock_http_client.get.return_value = {
-            "geo_request_count": 200,
-            "geo_request_limit": 5000,
-            "geo_usage_percent": 4.0,
-            "is_active": True,
-            "message": "OK",
-        }
-        functions = Functions(mock_http_client, mock_config)
+        """Test that core_* and geo_* prefixed fields are accepted as aliases."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            {
+                f"{prefix}request_count": count,
+                f"{prefix}request_limit": limit,
+                f"{prefix}usage_percent": percent,
+                "is_active": True,
+                "message": "OK",
+            }
+        )
 
         response = functions.GetAccountMetrics()
 
         assert isinstance(response, V60AccountMetrics)
-        assert response.request_count == 200
-        assert response.request_limit == 5000
-        assert response.usage_percent == 4.0
+        assert response.request_count == count
+        assert response.request_limit == limit
+        assert response.usage_percent == percent
 
-    def test_flat_fields_take_priority(self, mock_http_client, mock_config):
+    def test_flat_fields_take_priority(self, mock_http_client, functions):
         """Test that flat fields are preferred when both flat and prefixed exist."""
-        mock_http_client.get.return_value = {
-            "request_count": 999,
-            "core_request_count": 111,
-            "request_limit": 50000,
-            "core_request_limit": 11111,
-            "usage_percent": 2.0,
-            "core_usage_percent": 1.0,
-            "is_active": True,
-            "message": "OK",
-        }
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            {
+                "request_count": 999,
+                "core_request_count": 111,
+                "request_limit": 50000,
+                "core_request_limit": 11111,
+                "usage_percent": 2.0,
+                "core_usage_percent": 1.0,
+                "is_active": True,
+                "message": "OK",
+            }
+        )
 
         response = functions.GetAccountMetrics()
 
@@ -276,11 +410,12 @@ class TestGetRatesByPostalCode:
     """Test cases for GetRatesByPostalCode function."""
 
     def test_basic_request(
-        self, mock_http_client, mock_config, sample_postal_code_response
+        self, mock_http_client, functions, sample_postal_code_response
     ):
         """Test basic postal code request."""
-        mock_http_client.get.return_value = sample_postal_code_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
 
         response = functions.GetRatesByPostalCode("92694")
 
@@ -289,49 +424,133 @@ class TestGetRatesByPostalCode:
         assert response.r_code == 100
         assert len(response.results) == 1
         assert response.results[0].geo_postal_code == "92694"
-        mock_http_client.get.assert_called_once()
+        mock_http_client.get_bytes.assert_called_once()
 
     def test_with_format_parameter(
-        self, mock_http_client, mock_config, sample_postal_code_response
+        self, mock_http_client, functions, sample_postal_code_response
     ):
         """Test request with format parameter."""
-        mock_http_client.get.return_value = sample_postal_code_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
 
         response = functions.GetRatesByPostalCode(postal_code="92694", format="json")
 
         assert isinstance(response, V60PostalCodeResponse)
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.get_bytes.call_args
         assert call_args[1]["params"]["postalcode"] == "92694"
         assert call_args[1]["params"]["format"] == "json"
 
-    def test_invalid_postal_code(self, mock_http_client, mock_config):
-        """Test validation of invalid postal code."""
-        functions = Functions(mock_http_client, mock_config)
+    @pytest.mark.parametrize(
+        "postal_code, message",
+        [
+            ("", "Postal code cannot be empty"),
+            ("invalid", "Postal code must be"),
+            # 9-digit codes are not accepted by the API
+            ("92694-1234", "Postal code must be"),
+            # A trailing newline must not slip past the check
+            ("92694\n", "Postal code must be"),
+            # Only ASCII digits are accepted
+            ("9269²", "Postal code must be"),
+            ("٩٢٦٩٤", "Postal code must be"),
+            ("9269 ", "Postal code must be"),
+        ],
+    )
+    def test_invalid_postal_code(self, functions, postal_code, message):
+        """Test validation of empty, malformed and non-ASCII postal codes."""
+        with pytest.raises(ZipTaxValidationError, match=message):
+            functions.GetRatesByPostalCode(postal_code)
 
-        with pytest.raises(ZipTaxValidationError, match="Postal code must be"):
-            functions.GetRatesByPostalCode("invalid")
+    def test_repeated_lookup_served_from_cache(
+        self, mock_http_client, functions, sample_postal_code_response
+    ):
+        """Test repeated lookups for the same postal code hit the cache."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
 
-    def test_nine_digit_postal_code_rejected(self, mock_http_client, mock_config):
-        """Test that 9-digit postal codes are rejected (API does not accept them)."""
-        functions = Functions(mock_http_client, mock_config)
+        first = functions.GetRatesByPostalCode("92694")
+        second = functions.GetRatesByPostalCode("92694")
 
-        with pytest.raises(ZipTaxValidationError, match="Postal code must be"):
-            functions.GetRatesByPostalCode("92694-1234")
+        assert second == first
+        assert second is not first
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_mutating_result_does_not_affect_cache(
+        self, mock_http_client, functions, sample_postal_code_response
+    ):
+        """Test a caller mutating its response does not corrupt the cache."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+
+        first = functions.GetRatesByPostalCode("92694")
+        first.results.clear()
+        second = functions.GetRatesByPostalCode("92694")
+
+        assert second.results
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_cache_hit_logged_at_debug(
+        self, mock_http_client, functions, sample_postal_code_response, caplog
+    ):
+        """Test cache hits are logged only when DEBUG is enabled."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+        functions.GetRatesByPostalCode("92694")
+
+        with caplog.at_level(logging.INFO, logger="ziptax.resources.functions"):
+            functions.GetRatesByPostalCode("92694")
+        assert not caplog.records
+
+        with caplog.at_level(logging.DEBUG, logger="ziptax.resources.functions"):
+            functions.GetRatesByPostalCode("92694")
+        assert "cache hit" in caplog.text
+
+    def test_concurrent_lookups_share_one_request(
+        self, mock_http_client, mock_api_key, sample_postal_code_response
+    ):
+        """Test concurrent lookups for the same postal code are coalesced."""
+        config = Config(api_key=mock_api_key, cache_maxsize=0)
+
+        def slow_get_bytes(*args, **kwargs):
+            time.sleep(0.1)
+            return _json_bytes(sample_postal_code_response)
 
-    def test_empty_postal_code(self, mock_http_client, mock_config):
-        """Test validation of empty postal code."""
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.side_effect = slow_get_bytes
+        functions = Functions(mock_http_client, config)
 
-        with pytest.raises(ZipTaxValidationError, match="Postal code cannot be empty"):
-            functions.GetRatesByPostalCode("")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(
+                executor.map(functions.GetRatesByPostalCode, ["92694"] * 3)
+            )
+
+        assert all(response == responses[0] for response in responses)
+        assert len({id(response) for response in responses}) == 3
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_cache_clear_forces_new_request(
+        self, mock_http_client, functions, sample_postal_code_response
+    ):
+        """Test cache_clear causes the next lookup to hit the API."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+
+        functions.GetRatesByPostalCode("92694")
+        functions.cache_clear()
+        functions.GetRatesByPostalCode("92694")
+
+        assert mock_http_client.get_bytes.call_count == 2
 
     def test_response_fields(
-        self, mock_http_client, mock_config, sample_postal_code_response
+        self, mock_http_client, functions, sample_postal_code_response
     ):
         """Test all response fields are properly parsed."""
-        mock_http_client.get.return_value = sample_postal_code_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
 
         response = functions.GetRatesByPostalCode("92694")
         result = response.results[0]
@@ -343,66 +562,206 @@ class TestGetRatesByPostalCode:
         assert result.tax_use == 0.0775
 
 
+class TestGetRatesByPostalCodes:
+    """Test cases for GetRatesByPostalCodes function."""
+
+    def test_returns_responses_in_order(
+        self, mock_http_client, functions, sample_postal_code_response
+    ):
+        """Test batch lookup returns one response per postal code, in order."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+
+        responses = functions.GetRatesByPostalCodes(["92694", "55401"])
+
+        assert len(responses) == 2
+        assert all(isinstance(r, V60PostalCodeResponse) for r in responses)
+        requested = sorted(
+            call[1]["params"]["postalcode"]
+            for call in mock_http_client.get_bytes.call_args_list
+        )
+        assert requested == ["55401", "92694"]
+
+    def test_duplicate_postal_codes_requested_once(
+        self, mock_http_client, functions, sample_postal_code_response
+    ):
+        """Test duplicate postal codes only trigger a single request."""
+        mock_http_client.get_bytes.return_value = _json_bytes(
+            sample_postal_code_response
+        )
+
+        responses = functions.GetRatesByPostalCodes(["92694", "92694", "92694"])
+
+        assert len(responses) == 3
+        mock_http_client.get_bytes.assert_called_once()
+
+    def test_empty_list(self, mock_http_client, functions):
+        """Test empty input returns an empty list without any requests."""
+        assert functions.GetRatesByPostalCodes([]) == []
+        mock_http_client.get_bytes.assert_not_called()
+
+    def test_invalid_postal_code_fails_before_requests(
+        self, mock_http_client, functions
+    ):
+        """Test an invalid postal code is rejected before any request is made."""
+        with pytest.raises(ZipTaxValidationError, match="Postal code must be"):
+            functions.GetRatesByPostalCodes(["92694", "invalid"])
+
+        mock_http_client.get_bytes.assert_not_called()
+
+
+class TestFunctionsInstance:
+    """Test cases for Functions instance layout."""
+
+    def test_uses_slots(self, functions):
+        """Test Functions instances do not carry a __dict__."""
+        assert not hasattr(functions, "__dict__")
+        with pytest.raises(AttributeError):
+            functions.unknown_attribute = True
+
+    def test_retry_policy_applied_once(
+        self, mock_http_client, functions, sample_v60_response
+    ):
+        """Test requests reuse the retried senders built at construction."""
+        mock_http_client.get_bytes.return_value = _json_bytes(sample_v60_response)
+
+        with patch("ziptax.resources.functions.retry_with_backoff") as mock_retry:
+            functions.GetSalesTaxByAddress("200 Spectrum Center Dr, Irvine, CA")
+            functions.GetSalesTaxByAddress("323 Washington Ave N, Minneapolis, MN")
+
+        mock_retry.assert_not_called()
+        assert mock_http_client.get_bytes.call_count == 2
+
+
+class TestCircuitBreaker:
+    """Test cases for per-host circuit breaking."""
+
+    def test_outage_fails_fast_after_threshold(self, mock_http_client, mock_api_key):
+        """Test calls fail fast once the ZipTax circuit opens."""
+        config = Config(api_key=mock_api_key, circuit_failure_threshold=4)
+        mock_http_client.get_bytes.side_effect = ZipTaxServerError(
+            "Server error", 503, None
+        )
+        functions = Functions(mock_http_client, config)
+
+        with patch("time.sleep"):
+            with pytest.raises(ZipTaxRetryError):
+                functions.GetSalesTaxByGeoLocation("33.6489", "-117.8386")
+        with pytest.raises(ZipTaxCircuitOpenError):
+            functions.GetSalesTaxByGeoLocation("33.6489", "-117.8386")
+
+        assert mock_http_client.get_bytes.call_count == 4
+
+    def test_breakers_are_per_host(self, mock_http_client, mock_taxcloud_config):
+        """Test an open ZipTax circuit does not block TaxCloud requests."""
+        functions = Functions(
+            mock_http_client,
+            mock_taxcloud_config,
+            taxcloud_http_client=mock_http_client,
+        )
+
+        for _ in range(mock_taxcloud_config.circuit_failure_threshold):
+            functions._breaker_zt.record_failure()
+
+        with pytest.raises(ZipTaxCircuitOpenError):
+            functions._breaker_zt.allow()
+        functions._breaker_tc.allow()
+
+
+class TestRetryPolicy:
+    """Test cases for the retry policy passed to Functions."""
+
+    @pytest.mark.parametrize("retry_jitter", [True, False])
+    def test_backoff_is_capped(self, mock_http_client, mock_config, retry_jitter):
+        """Test retry delays never exceed retry_max_delay."""
+        mock_http_client.get_bytes.side_effect = ZipTaxServerError(
+            "Server error", 503, None
+        )
+        functions = Functions(
+            mock_http_client,
+            mock_config,
+            max_retries=3,
+            retry_delay=10.0,
+            retry_max_delay=15.0,
+            retry_jitter=retry_jitter,
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(ZipTaxRetryError):
+                functions.GetSalesTaxByGeoLocation("33.6489", "-117.8386")
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert all(0 <= delay <= 15.0 for delay in delays)
+        if not retry_jitter:
+            assert delays == [10.0, 15.0, 15.0]
+
+
 class TestSearchProductCodes:
     """Test cases for SearchProductCodes function."""
 
     def test_basic_request(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_search_response,
     ):
         """Test basic product code search request."""
-        mock_http_client.post.return_value = sample_product_code_search_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
 
         response = functions.SearchProductCodes("baked goods sold in plastic packaging")
 
         assert isinstance(response, ProductCodeSearchResponse)
         assert response.query == "baked goods sold in plastic packaging"
         assert len(response.results) == 2
-        mock_http_client.post.assert_called_once()
+        mock_http_client.post_bytes.assert_called_once()
 
     def test_uses_correct_path(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_search_response,
     ):
         """Test that SearchProductCodes calls the correct API path."""
-        mock_http_client.post.return_value = sample_product_code_search_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
 
         functions.SearchProductCodes("test query")
 
-        call_args = mock_http_client.post.call_args
+        call_args = mock_http_client.post_bytes.call_args
         assert call_args[0][0] == "/search/tic"
 
     def test_request_body(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_search_response,
     ):
         """Test that request body contains the query."""
-        mock_http_client.post.return_value = sample_product_code_search_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
 
         functions.SearchProductCodes("baked goods")
 
-        call_args = mock_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body == {"query": "baked goods"}
 
     def test_result_fields_parsed(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_search_response,
     ):
         """Test that result fields are properly parsed with correct types."""
-        mock_http_client.post.return_value = sample_product_code_search_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
 
         response = functions.SearchProductCodes("test")
 
@@ -421,12 +780,13 @@ class TestSearchProductCodes:
     def test_multiple_results_parsed(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_search_response,
     ):
         """Test that multiple results are properly parsed."""
-        mock_http_client.post.return_value = sample_product_code_search_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_search_response
+        )
 
         response = functions.SearchProductCodes("test")
 
@@ -436,39 +796,32 @@ class TestSearchProductCodes:
         assert response.results[1].tic_id == 40030
         assert response.results[1].rank == 2
 
-    def test_empty_query_validation(self, mock_http_client, mock_config):
+    def test_empty_query_validation(self, functions):
         """Test validation of empty query."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="cannot be empty"):
             functions.SearchProductCodes("")
 
-    def test_whitespace_only_query_validation(self, mock_http_client, mock_config):
+    def test_whitespace_only_query_validation(self, functions):
         """Test validation of whitespace-only query."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="cannot be empty"):
             functions.SearchProductCodes("   ")
 
     @pytest.mark.parametrize(
         "invalid_query", [None, 123, 12.34, ["list"], {"dict": "val"}]
     )
-    def test_non_string_query_validation(
-        self, mock_http_client, mock_config, invalid_query
-    ):
+    def test_non_string_query_validation(self, functions, invalid_query):
         """Test validation of non-string query values."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="must be a string"):
             functions.SearchProductCodes(invalid_query)
 
-    def test_empty_results_list(self, mock_http_client, mock_config):
+    def test_empty_results_list(self, mock_http_client, functions):
         """Test handling of empty results from API."""
-        mock_http_client.post.return_value = {
-            "query": "nonexistent product xyz",
-            "results": [],
-        }
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            {
+                "query": "nonexistent product xyz",
+                "results": [],
+            }
+        )
 
         response = functions.SearchProductCodes("nonexistent product xyz")
 
@@ -483,12 +836,13 @@ class TestRecommendProductCode:
     def test_basic_request(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_recommendation_response,
     ):
         """Test basic product code recommendation request."""
-        mock_http_client.post.return_value = sample_product_code_recommendation_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_recommendation_response
+        )
 
         response = functions.RecommendProductCode(
             "baked goods sold in plastic packaging"
@@ -496,48 +850,51 @@ class TestRecommendProductCode:
 
         assert isinstance(response, ProductCodeRecommendationResponse)
         assert len(response.predictions) == 1
-        mock_http_client.post.assert_called_once()
+        mock_http_client.post_bytes.assert_called_once()
 
     def test_uses_correct_path(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_recommendation_response,
     ):
         """Test that RecommendProductCode calls the correct API path."""
-        mock_http_client.post.return_value = sample_product_code_recommendation_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_recommendation_response
+        )
 
         functions.RecommendProductCode("test query")
 
-        call_args = mock_http_client.post.call_args
+        call_args = mock_http_client.post_bytes.call_args
         assert call_args[0][0] == "/search/tic/recommend"
 
     def test_request_body(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_recommendation_response,
     ):
         """Test that request body contains the query."""
-        mock_http_client.post.return_value = sample_product_code_recommendation_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_recommendation_response
+        )
 
         functions.RecommendProductCode("baked goods")
 
-        call_args = mock_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body == {"query": "baked goods"}
 
     def test_prediction_fields_parsed(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_product_code_recommendation_response,
     ):
         """Test that prediction fields are properly parsed with correct types."""
-        mock_http_client.post.return_value = sample_product_code_recommendation_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_product_code_recommendation_response
+        )
 
         response = functions.RecommendProductCode("test")
 
@@ -553,48 +910,41 @@ class TestRecommendProductCode:
             "baked goods sold in plastic packaging"
         )
 
-    def test_empty_query_validation(self, mock_http_client, mock_config):
+    def test_empty_query_validation(self, functions):
         """Test validation of empty query."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="cannot be empty"):
             functions.RecommendProductCode("")
 
-    def test_whitespace_only_query_validation(self, mock_http_client, mock_config):
+    def test_whitespace_only_query_validation(self, functions):
         """Test validation of whitespace-only query."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="cannot be empty"):
             functions.RecommendProductCode("   ")
 
     @pytest.mark.parametrize(
         "invalid_query", [None, 123, 12.34, ["list"], {"dict": "val"}]
     )
-    def test_non_string_query_validation(
-        self, mock_http_client, mock_config, invalid_query
-    ):
+    def test_non_string_query_validation(self, functions, invalid_query):
         """Test validation of non-string query values."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxValidationError, match="must be a string"):
             functions.RecommendProductCode(invalid_query)
 
-    def test_prediction_with_error(self, mock_http_client, mock_config):
+    def test_prediction_with_error(self, mock_http_client, functions):
         """Test handling of a prediction with error status."""
-        mock_http_client.post.return_value = {
-            "predictions": [
-                {
-                    "status": "fail",
-                    "error": "Unable to determine product code",
-                    "ticId": "0",
-                    "label": "",
-                    "naturalLabel": "",
-                    "tic_description": "",
-                    "product_description": "ambiguous product",
-                }
-            ]
-        }
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            {
+                "predictions": [
+                    {
+                        "status": "fail",
+                        "error": "Unable to determine product code",
+                        "ticId": "0",
+                        "label": "",
+                        "naturalLabel": "",
+                        "tic_description": "",
+                        "product_description": "ambiguous product",
+                    }
+                ]
+            }
+        )
 
         response = functions.RecommendProductCode("ambiguous product")
 
@@ -605,89 +955,152 @@ class TestRecommendProductCode:
         assert prediction.tic_id == 0
 
 
-class TestCalculateCart:
-    """Test cases for CalculateCart function."""
-
-    def _build_request(self):
-        """Build a sample CalculateCartRequest for testing."""
-        return CalculateCartRequest(
-            items=[
-                CartItem(
-                    customer_id="customer-453",
-                    currency=CartCurrency(currency_code="USD"),
-                    destination=CartAddress(
-                        address="200 Spectrum Center Dr, Irvine, CA 92618-1905"
+def _build_cart_request():
+    """Build a sample CalculateCartRequest for testing."""
+    return CalculateCartRequest(
+        items=[
+            CartItem(
+                customer_id="customer-453",
+                currency=CartCurrency(currency_code="USD"),
+                destination=CartAddress(
+                    address="200 Spectrum Center Dr, Irvine, CA 92618-1905"
+                ),
+                origin=CartAddress(
+                    address="323 Washington Ave N, Minneapolis, MN 55401-2427"
+                ),
+                line_items=[
+                    CartLineItem(
+                        item_id="item-1",
+                        price=10.75,
+                        quantity=1.5,
                     ),
-                    origin=CartAddress(
-                        address="323 Washington Ave N, Minneapolis, MN 55401-2427"
+                    CartLineItem(
+                        item_id="item-2",
+                        price=25.00,
+                        quantity=2.0,
+                        taxability_code=0,
                     ),
-                    line_items=[
-                        CartLineItem(
-                            item_id="item-1",
-                            price=10.75,
-                            quantity=1.5,
-                        ),
-                        CartLineItem(
-                            item_id="item-2",
-                            price=25.00,
-                            quantity=2.0,
-                            taxability_code=0,
-                        ),
-                    ],
-                )
-            ]
-        )
+                ],
+            )
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def cart_request():
+    """CalculateCartRequest shared by tests that only read it."""
+    return _build_cart_request()
+
+
+class TestCalculateCart:
+    """Test cases for CalculateCart function."""
 
     def test_basic_request(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test basic cart tax calculation request."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = functions.CalculateCart(cart_request)
 
         assert isinstance(response, CalculateCartResponse)
         assert len(response.items) == 1
         assert response.items[0].cart_id == "ce4a1234-5678-90ab-cdef-1234567890ab"
         assert response.items[0].customer_id == "customer-453"
-        mock_http_client.post.assert_called_once()
+        mock_http_client.post_bytes.assert_called_once()
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_calculate_carts_preserves_order(
+        self,
+        mock_http_client,
+        functions,
+        sample_calculate_cart_response,
+        max_workers,
+    ):
+        """Test that CalculateCarts sends every cart and keeps input order."""
+
+        def post_bytes(path, content):
+            customer_id = json.loads(content)["items"][0]["customerId"]
+            data = dict(sample_calculate_cart_response)
+            data["items"] = [
+                dict(sample_calculate_cart_response["items"][0], customerId=customer_id)
+            ]
+            return _json_bytes(data)
+
+        mock_http_client.post_bytes.side_effect = post_bytes
+        requests = []
+        for customer_id in ("customer-1", "customer-2", "customer-3"):
+            request = _build_cart_request()
+            request.items[0].customer_id = customer_id
+            requests.append(request)
+
+        responses = functions.CalculateCarts(requests, max_workers=max_workers)
+
+        assert [r.items[0].customer_id for r in responses] == [
+            "customer-1",
+            "customer-2",
+            "customer-3",
+        ]
+        assert mock_http_client.post_bytes.call_count == 3
+
+    def test_retry_reuses_serialized_body(
+        self,
+        mock_http_client,
+        functions,
+        sample_calculate_cart_response,
+        cart_request,
+    ):
+        """Test that retries resend the body serialized on the first attempt."""
+        mock_http_client.post_bytes.side_effect = [
+            ZipTaxServerError("Server error", 503, None),
+            _json_bytes(sample_calculate_cart_response),
+        ]
+
+        with patch("time.sleep"):
+            functions.CalculateCart(cart_request)
+
+        first_call, second_call = mock_http_client.post_bytes.call_args_list
+        assert first_call[1]["content"] is second_call[1]["content"]
 
     def test_request_uses_correct_path(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that CalculateCart calls the correct API path."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        functions.CalculateCart(cart_request)
 
-        call_args = mock_http_client.post.call_args
+        call_args = mock_http_client.post_bytes.call_args
         assert call_args[0][0] == "/calculate/cart"
 
     def test_request_body_serialization(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that request body uses camelCase field names (by_alias)."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        functions.CalculateCart(cart_request)
 
-        call_args = mock_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
 
         # Verify top-level structure
         assert "items" in json_body
@@ -710,12 +1123,13 @@ class TestCalculateCart:
     def test_optional_taxability_code_excluded_when_none(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
     ):
         """Test that taxabilityCode is excluded from JSON when not set."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
         request = CalculateCartRequest(
             items=[
@@ -740,26 +1154,27 @@ class TestCalculateCart:
         )
         functions.CalculateCart(request)
 
-        call_args = mock_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         line_item = json_body["items"][0]["lineItems"][0]
         assert "taxabilityCode" not in line_item
 
     def test_optional_taxability_code_included_when_set(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that taxabilityCode is included in JSON when set."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        functions.CalculateCart(cart_request)
 
-        call_args = mock_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         # Second line item has taxability_code=0
         line_item = json_body["items"][0]["lineItems"][1]
         assert "taxabilityCode" in line_item
@@ -768,15 +1183,16 @@ class TestCalculateCart:
     def test_response_line_items_parsed(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that response line items and tax details are properly parsed."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = functions.CalculateCart(cart_request)
 
         cart = response.items[0]
         assert len(cart.line_items) == 2
@@ -800,15 +1216,16 @@ class TestCalculateCart:
     def test_response_addresses_parsed(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that response addresses are properly parsed."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = functions.CalculateCart(cart_request)
 
         cart = response.items[0]
         assert (
@@ -818,21 +1235,13 @@ class TestCalculateCart:
 
     # ----- Pydantic Validation Tests -----
 
-    def test_price_must_be_greater_than_zero(self):
-        """Test that CartLineItem rejects price <= 0."""
-        with pytest.raises(ValidationError, match="greater than 0"):
-            CartLineItem(item_id="item-1", price=0, quantity=1.0)
-
-        with pytest.raises(ValidationError, match="greater than 0"):
-            CartLineItem(item_id="item-1", price=-5.00, quantity=1.0)
-
-    def test_quantity_must_be_greater_than_zero(self):
-        """Test that CartLineItem rejects quantity <= 0."""
-        with pytest.raises(ValidationError, match="greater than 0"):
-            CartLineItem(item_id="item-1", price=10.00, quantity=0)
-
+    @pytest.mark.parametrize(
+        "price, quantity", [(0, 1.0), (-5.00, 1.0), (10.00, 0), (10.00, -1.0)]
+    )
+    def test_price_and_quantity_must_be_greater_than_zero(self, price, quantity):
+        """Test that CartLineItem rejects price or quantity <= 0."""
         with pytest.raises(ValidationError, match="greater than 0"):
-            CartLineItem(item_id="item-1", price=10.00, quantity=-1.0)
+            CartLineItem(item_id="item-1", price=price, quantity=quantity)
 
     def test_items_must_contain_exactly_one_cart(self):
         """Test that CalculateCartRequest rejects empty or multi-cart arrays."""
@@ -869,128 +1278,101 @@ class TestCalculateCart:
 class TestCalculateCartTaxCloudRouting:
     """Test cases for CalculateCart TaxCloud routing."""
 
-    def _build_request(self):
-        """Build a sample CalculateCartRequest for testing."""
-        return CalculateCartRequest(
-            items=[
-                CartItem(
-                    customer_id="customer-453",
-                    currency=CartCurrency(currency_code="USD"),
-                    destination=CartAddress(
-                        address="200 Spectrum Center Dr, Irvine, CA 92618-1905"
-                    ),
-                    origin=CartAddress(
-                        address="323 Washington Ave N, Minneapolis, MN 55401-2427"
-                    ),
-                    line_items=[
-                        CartLineItem(
-                            item_id="item-1",
-                            price=10.75,
-                            quantity=1.5,
-                        ),
-                        CartLineItem(
-                            item_id="item-2",
-                            price=25.00,
-                            quantity=2.0,
-                            taxability_code=0,
-                        ),
-                    ],
-                )
-            ]
-        )
-
     # ----- Routing Logic Tests -----
 
     def test_routes_to_ziptax_without_taxcloud_config(
         self,
         mock_http_client,
-        mock_config,
+        functions,
         sample_calculate_cart_response,
+        cart_request,
     ):
         """Test that CalculateCart routes to ZipTax when TaxCloud is not configured."""
-        mock_http_client.post.return_value = sample_calculate_cart_response
-        functions = Functions(mock_http_client, mock_config)
+        mock_http_client.post_bytes.return_value = _json_bytes(
+            sample_calculate_cart_response
+        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = functions.CalculateCart(cart_request)
 
         assert isinstance(response, CalculateCartResponse)
-        mock_http_client.post.assert_called_once()
-        call_args = mock_http_client.post.call_args
+        mock_http_client.post_bytes.assert_called_once()
+        call_args = mock_http_client.post_bytes.call_args
         assert call_args[0][0] == "/calculate/cart"
 
     def test_routes_to_taxcloud_with_taxcloud_config(
         self,
         mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that CalculateCart routes to TaxCloud when configured."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = taxcloud_functions.CalculateCart(cart_request)
 
         assert isinstance(response, TaxCloudCalculateCartResponse)
-        mock_taxcloud_http_client.post.assert_called_once()
+        mock_taxcloud_http_client.post_bytes.assert_called_once()
         # ZipTax http_client should NOT be called
-        mock_http_client.post.assert_not_called()
+        mock_http_client.post_bytes.assert_not_called()
+
+    def test_taxcloud_retry_reuses_encoded_body(
+        self,
+        taxcloud_functions,
+        mock_taxcloud_http_client,
+        sample_taxcloud_calculate_cart_response,
+        cart_request,
+    ):
+        """Test that TaxCloud retries resend the body encoded on the first attempt."""
+        mock_taxcloud_http_client.post_bytes.side_effect = [
+            ZipTaxServerError("Server error", 503, None),
+            _json_bytes(sample_taxcloud_calculate_cart_response),
+        ]
+
+        with patch("time.sleep"):
+            taxcloud_functions.CalculateCart(cart_request)
+
+        first_call, second_call = mock_taxcloud_http_client.post_bytes.call_args_list
+        assert first_call[1]["content"] is second_call[1]["content"]
 
     def test_taxcloud_uses_correct_path(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that TaxCloud route uses the correct API path with connectionId."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
         assert call_args[0][0] == "/tax/connections/test-connection-id-uuid/carts"
 
     # ----- Request Transformation Tests -----
 
     def test_address_parsing_destination(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that destination address is parsed into structured components."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         dest = json_body["items"][0]["destination"]
         assert dest["line1"] == "200 Spectrum Center Dr"
         assert dest["city"] == "Irvine"
@@ -999,80 +1381,195 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_address_parsing_origin(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that origin address is parsed into structured components."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         origin = json_body["items"][0]["origin"]
         assert origin["line1"] == "323 Washington Ave N"
         assert origin["city"] == "Minneapolis"
         assert origin["state"] == "MN"
         assert origin["zip"] == "55401-2427"
 
-    def test_line_items_have_index(
+    def test_same_origin_and_destination_parsed_once(self):
+        """Test an origin matching the destination is parsed only once."""
+        request = CalculateCartRequest(
+            items=[
+                CartItem(
+                    customer_id="customer-453",
+                    currency=CartCurrency(currency_code="USD"),
+                    destination=CartAddress(
+                        address="200 Spectrum Center Dr, Irvine, CA 92618"
+                    ),
+                    origin=CartAddress(
+                        address=" 200 Spectrum Center Dr,  Irvine, CA 92618"
+                    ),
+                    line_items=[
+                        CartLineItem(item_id="item-1", price=10.75, quantity=1.0)
+                    ],
+                )
+            ]
+        )
+
+        with patch(
+            "ziptax.utils.validation.parse_address_string",
+            wraps=parse_address_string,
+        ) as parse:
+            body = Functions._transform_cart_for_taxcloud(request)
+
+        parse.assert_called_once()
+        assert body["items"][0]["origin"] == body["items"][0]["destination"]
+
+    def test_calculate_carts_taxcloud_parses_before_sending(
         self,
         mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
-        """Test that line items get 0-based index added."""
-        mock_taxcloud_http_client.post.return_value = (
+        """Test CalculateCarts parses every cart before sending any of them."""
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
+        bad = _build_cart_request()
+        bad.items[0].destination = CartAddress(address="Irvine, California")
+
+        with pytest.raises(ZipTaxValidationError):
+            taxcloud_functions.CalculateCarts([cart_request, bad])
+        mock_taxcloud_http_client.post_bytes.assert_not_called()
+
+        responses = taxcloud_functions.CalculateCarts([cart_request] * 2)
+
+        assert all(isinstance(r, TaxCloudCalculateCartResponse) for r in responses)
+        assert mock_taxcloud_http_client.post_bytes.call_count == 2
+        mock_http_client.post_bytes.assert_not_called()
+
+    def test_shared_origin_parsed_once_across_carts(self):
+        """Test an origin shared by several carts is parsed once."""
+        origin = CartAddress(address="323 Washington Ave N, Minneapolis, MN 55401")
+        requests = [
+            CalculateCartRequest(
+                items=[
+                    CartItem(
+                        customer_id=f"customer-{i}",
+                        currency=CartCurrency(currency_code="USD"),
+                        destination=CartAddress(address=destination),
+                        origin=origin,
+                        line_items=[
+                            CartLineItem(item_id="item-1", price=10.75, quantity=1.0)
+                        ],
+                    )
+                ]
+            )
+            for i, destination in enumerate(
+                [
+                    "200 Spectrum Center Dr, Irvine, CA 92618",
+                    "1 Main St, Springfield, IL 62701",
+                ]
+            )
+        ]
+
+        with patch(
+            "ziptax.utils.validation.parse_address_string",
+            wraps=parse_address_string,
+        ) as parse:
+            first, second = Functions._transform_carts_for_taxcloud(requests)
+
+        assert parse.call_count == 3
+        assert first["items"][0]["origin"] == second["items"][0]["origin"]
+        assert first["items"][0]["origin"] is not second["items"][0]["origin"]
+        assert first["items"][0]["destination"]["state"] == "CA"
+        assert second["items"][0]["destination"]["state"] == "IL"
+
+    def test_structured_addresses_skip_parsing(self):
+        """Test caller-supplied address components are used without parsing."""
+        destination = CartAddress(
+            address="200 Spectrum Center Dr, Irvine, CA 92618",
+            structured=TaxCloudAddress(
+                line1="200 Spectrum Center Dr",
+                city="Irvine",
+                state="CA",
+                zip="92618",
+            ),
+        )
+        request = CalculateCartRequest(
+            items=[
+                CartItem(
+                    customer_id="customer-453",
+                    currency=CartCurrency(currency_code="USD"),
+                    destination=destination,
+                    origin=destination,
+                    line_items=[
+                        CartLineItem(item_id="item-1", price=10.75, quantity=1.0)
+                    ],
+                )
+            ]
         )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        with patch("ziptax.utils.validation.parse_address_string") as parse:
+            body = Functions._transform_cart_for_taxcloud(request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        parse.assert_not_called()
+        assert body["items"][0]["destination"] == {
+            "line1": "200 Spectrum Center Dr",
+            "city": "Irvine",
+            "state": "CA",
+            "zip": "92618",
+            "countryCode": "US",
+        }
+        assert body["items"][0]["origin"] == body["items"][0]["destination"]
+        # The ZipTax route still sends only the address string
+        assert destination.model_dump(by_alias=True, exclude_none=True) == {
+            "address": "200 Spectrum Center Dr, Irvine, CA 92618"
+        }
+
+    def test_line_items_have_index(
+        self,
+        taxcloud_functions,
+        mock_taxcloud_http_client,
+        sample_taxcloud_calculate_cart_response,
+        cart_request,
+    ):
+        """Test that line items get 0-based index added."""
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_taxcloud_calculate_cart_response
+        )
+
+        taxcloud_functions.CalculateCart(cart_request)
+
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         line_items = json_body["items"][0]["lineItems"]
         assert line_items[0]["index"] == 0
         assert line_items[1]["index"] == 1
 
     def test_taxability_code_mapped_to_tic(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that taxabilityCode is mapped to tic field."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         line_items = json_body["items"][0]["lineItems"]
         # item-1 has no taxability_code -> tic defaults to 0
         assert line_items[0]["tic"] == 0
@@ -1081,20 +1578,14 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_taxability_code_nonzero_mapped_to_tic(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
     ):
         """Test that a non-zero taxabilityCode is passed through to tic."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CalculateCartRequest(
             items=[
@@ -1118,81 +1609,63 @@ class TestCalculateCartTaxCloudRouting:
                 )
             ]
         )
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body["items"][0]["lineItems"][0]["tic"] == 31000
 
     def test_currency_code_passed_through(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that currency code is passed through to TaxCloud."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body["items"][0]["currency"]["currencyCode"] == "USD"
 
     def test_customer_id_passed_through(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that customerId is passed through to TaxCloud."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        functions.CalculateCart(request)
+        taxcloud_functions.CalculateCart(cart_request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body["items"][0]["customerId"] == "customer-453"
 
     # ----- Response Parsing Tests -----
 
     def test_taxcloud_response_parsed(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test that TaxCloud response is properly parsed."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = taxcloud_functions.CalculateCart(cart_request)
 
         assert isinstance(response, TaxCloudCalculateCartResponse)
         assert response.connection_id == "test-connection-id-uuid"
@@ -1201,23 +1674,17 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_taxcloud_response_cart_fields(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test TaxCloud response cart item fields are properly parsed."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = taxcloud_functions.CalculateCart(cart_request)
 
         cart = response.items[0]
         assert cart.cart_id == "ce4a1234-5678-90ab-cdef-1234567890ab"
@@ -1229,23 +1696,17 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_taxcloud_response_addresses(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test TaxCloud response structured addresses are properly parsed."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = taxcloud_functions.CalculateCart(cart_request)
 
         cart = response.items[0]
         assert cart.destination.line1 == "200 Spectrum Center Dr"
@@ -1261,23 +1722,17 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_taxcloud_response_line_items(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_taxcloud_calculate_cart_response,
+        cart_request,
     ):
         """Test TaxCloud response line items with tax details are parsed."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_taxcloud_calculate_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
-        request = self._build_request()
-        response = functions.CalculateCart(request)
+        response = taxcloud_functions.CalculateCart(cart_request)
 
         cart = response.items[0]
         assert len(cart.line_items) == 2
@@ -1304,17 +1759,9 @@ class TestCalculateCartTaxCloudRouting:
 
     def test_invalid_address_raises_validation_error(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
-        mock_taxcloud_http_client,
+        taxcloud_functions,
     ):
         """Test that unparseable address raises ZipTaxValidationError."""
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
-
         request = CalculateCartRequest(
             items=[
                 CartItem(
@@ -1332,21 +1779,13 @@ class TestCalculateCartTaxCloudRouting:
         )
 
         with pytest.raises(ZipTaxValidationError, match="Cannot parse address"):
-            functions.CalculateCart(request)
+            taxcloud_functions.CalculateCart(request)
 
     def test_address_missing_state_zip_raises_error(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
-        mock_taxcloud_http_client,
+        taxcloud_functions,
     ):
         """Test that address with invalid state/zip segment raises error."""
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
-
         request = CalculateCartRequest(
             items=[
                 CartItem(
@@ -1366,18 +1805,35 @@ class TestCalculateCartTaxCloudRouting:
         )
 
         with pytest.raises(ZipTaxValidationError, match="Cannot parse state and ZIP"):
-            functions.CalculateCart(request)
+            taxcloud_functions.CalculateCart(request)
+
+    @pytest.mark.parametrize(
+        "state_zip, expected",
+        [
+            ("CA 92618", ("CA", "92618")),
+            ("ca 92618-1905", ("CA", "92618-1905")),
+            ("CA  92618", ("CA", "92618")),
+            ("CA\t92618-1905", ("CA", "92618-1905")),
+        ],
+    )
+    def test_address_state_zip_spacing(self, state_zip, expected):
+        """Test single and irregular spacing parse the same way."""
+        parsed = parse_address_string(f"1 Main St, Springfield, {state_zip}")
+
+        assert (parsed["state"], parsed["zip"]) == expected
+
+    @pytest.mark.parametrize("state_zip", ["CA 9261", "CA 92618-19", "C1 92618"])
+    def test_address_malformed_state_zip(self, state_zip):
+        """Test malformed state and ZIP segments are rejected."""
+        with pytest.raises(ZipTaxValidationError, match="Cannot parse state and ZIP"):
+            parse_address_string(f"1 Main St, Springfield, {state_zip}")
 
 
 class TestTaxCloudFunctions:
     """Test cases for TaxCloud order management functions."""
 
-    def test_check_taxcloud_config_raises_without_config(
-        self, mock_http_client, mock_config
-    ):
+    def test_check_taxcloud_config_raises_without_config(self, functions):
         """Test that TaxCloud functions raise without TaxCloud config."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(
             ZipTaxCloudConfigError,
             match="TaxCloud credentials not configured",
@@ -1386,308 +1842,242 @@ class TestTaxCloudFunctions:
 
     def test_create_order(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_order_response,
+        sample_create_order_request,
     ):
         """Test creating an order."""
-        mock_taxcloud_http_client.post.return_value = sample_order_response
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
-
-        request = CreateOrderRequest(
-            order_id="test-order-1",
-            customer_id="customer-1",
-            transaction_date="2024-01-15T09:30:00Z",
-            completed_date="2024-01-15T09:30:00Z",
-            origin={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            destination={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            line_items=[
-                {
-                    "index": 0,
-                    "itemId": "item-1",
-                    "price": 10.80,
-                    "quantity": 1.5,
-                    "tax": {"amount": 1.31, "rate": 0.0813},
-                }
-            ],
-            currency={"currencyCode": "USD"},
-        )
-
-        response = functions.CreateOrder(request)
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_order_response
+        )
+
+        response = taxcloud_functions.CreateOrder(sample_create_order_request)
 
         assert isinstance(response, OrderResponse)
         assert response.order_id == "test-order-1"
-        mock_taxcloud_http_client.post.assert_called_once()
+        mock_taxcloud_http_client.post_bytes.assert_called_once()
 
     def test_get_order(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_order_response,
     ):
         """Test retrieving an order."""
-        mock_taxcloud_http_client.get.return_value = sample_order_response
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
+        mock_taxcloud_http_client.get_bytes.return_value = _json_bytes(
+            sample_order_response
         )
 
-        response = functions.GetOrder("test-order-1")
+        response = taxcloud_functions.GetOrder("test-order-1")
 
         assert isinstance(response, OrderResponse)
         assert response.order_id == "test-order-1"
-        mock_taxcloud_http_client.get.assert_called_once()
+        mock_taxcloud_http_client.get_bytes.assert_called_once_with(
+            "/tax/connections/test-connection-id-uuid/orders/test-order-1"
+        )
 
-    def test_update_order(
+    def test_get_orders(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_order_response,
     ):
-        """Test updating an order."""
-        mock_taxcloud_http_client.patch.return_value = sample_order_response
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
+        """Test retrieving multiple orders keeps input order."""
+
+        def get_bytes(path):
+            order_id = path.rsplit("/", 1)[1]
+            return _json_bytes(dict(sample_order_response, orderId=order_id))
+
+        mock_taxcloud_http_client.get_bytes.side_effect = get_bytes
+
+        responses = taxcloud_functions.GetOrders(["order-1", "order-2", "order-3"])
+
+        assert [r.order_id for r in responses] == ["order-1", "order-2", "order-3"]
+
+    def test_get_orders_return_exceptions(
+        self,
+        taxcloud_functions,
+        mock_taxcloud_http_client,
+        sample_order_response,
+    ):
+        """Test a failed order is returned in place when return_exceptions is set."""
+        error = ZipTaxNotFoundError("Order not found", 404)
+        mock_taxcloud_http_client.get_bytes.side_effect = [
+            _json_bytes(sample_order_response),
+            error,
+        ]
+
+        responses = taxcloud_functions.GetOrders(
+            ["test-order-1", "missing"], max_workers=1, return_exceptions=True
         )
 
-        request = UpdateOrderRequest(completed_date="2024-01-16T10:00:00Z")
-        response = functions.UpdateOrder("test-order-1", request)
+        assert isinstance(responses[0], OrderResponse)
+        assert responses[1] is error
 
-        assert isinstance(response, OrderResponse)
-        assert response.order_id == "test-order-1"
-        mock_taxcloud_http_client.patch.assert_called_once()
+    def test_get_orders_raises_by_default(
+        self, taxcloud_functions, mock_taxcloud_http_client
+    ):
+        """Test a failed order raises unless return_exceptions is set."""
+        mock_taxcloud_http_client.get_bytes.side_effect = ZipTaxNotFoundError(
+            "Order not found", 404
+        )
 
-    def test_refund_order(
+        with pytest.raises(ZipTaxNotFoundError):
+            taxcloud_functions.GetOrders(["missing"])
+
+    def test_create_orders(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
-        sample_refund_response,
+        sample_order_response,
+        sample_create_order_request,
     ):
-        """Test refunding an order."""
-        mock_taxcloud_http_client.post.return_value = [sample_refund_response]
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
+        """Test creating multiple orders forwards the autocomplete option."""
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_order_response
         )
+        requests = [
+            sample_create_order_request.model_copy(
+                update={"order_id": f"test-order-{i}"}
+            )
+            for i in range(3)
+        ]
 
-        request = RefundTransactionRequest(
-            items=[{"itemId": "item-1", "quantity": 1.0}]
+        responses = taxcloud_functions.CreateOrders(
+            requests, address_autocomplete="all"
         )
-        response = functions.RefundOrder("test-order-1", request)
 
-        assert isinstance(response, list)
-        assert len(response) == 1
-        assert isinstance(response[0], RefundTransactionResponse)
-        mock_taxcloud_http_client.post.assert_called_once()
+        assert len(responses) == 3
+        assert all(isinstance(r, OrderResponse) for r in responses)
+        for call in mock_taxcloud_http_client.post_bytes.call_args_list:
+            assert call[1]["params"] == {"addressAutocomplete": "all"}
+
+    def test_create_orders_validates_before_requests(
+        self, taxcloud_functions, mock_taxcloud_http_client
+    ):
+        """Test an invalid autocomplete option is rejected before any request."""
+        with pytest.raises(ZipTaxValidationError):
+            taxcloud_functions.CreateOrders([], address_autocomplete="bogus")
 
-    def test_refund_order_full(
+        mock_taxcloud_http_client.post_bytes.assert_not_called()
+
+    def test_update_order(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
-        sample_refund_response,
+        sample_order_response,
     ):
-        """Test full refund (no request body)."""
-        mock_taxcloud_http_client.post.return_value = [sample_refund_response]
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
+        """Test updating an order."""
+        mock_taxcloud_http_client.patch_bytes.return_value = _json_bytes(
+            sample_order_response
         )
 
-        response = functions.RefundOrder("test-order-1")
+        request = UpdateOrderRequest(completed_date="2024-01-16T10:00:00Z")
+        response = taxcloud_functions.UpdateOrder("test-order-1", request)
 
-        assert isinstance(response, list)
-        assert len(response) == 1
-        mock_taxcloud_http_client.post.assert_called_once()
+        assert isinstance(response, OrderResponse)
+        assert response.order_id == "test-order-1"
+        mock_taxcloud_http_client.patch_bytes.assert_called_once()
+        assert (
+            mock_taxcloud_http_client.patch_bytes.call_args[0][0]
+            == "/tax/connections/test-connection-id-uuid/orders/test-order-1"
+        )
 
-    def test_refund_order_single_dict_response(
+    @pytest.mark.parametrize(
+        "refund_request, body",
+        [
+            (
+                RefundTransactionRequest(items=[{"itemId": "item-1", "quantity": 1.0}]),
+                "list",
+            ),
+            (None, "list"),
+            (
+                RefundTransactionRequest(items=[{"itemId": "item-1", "quantity": 1.0}]),
+                "dict",
+            ),
+        ],
+        ids=["partial", "full", "single_dict_response"],
+    )
+    def test_refund_order(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_refund_response,
+        refund_request,
+        body,
     ):
-        """Test that RefundOrder handles API returning a single dict (not a list)."""
+        """Test partial and full refunds, including a single-dict API response."""
         # API sometimes returns a single dict for partial refunds
-        mock_taxcloud_http_client.post.return_value = sample_refund_response
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
+        payload = [sample_refund_response] if body == "list" else sample_refund_response
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(payload)
 
-        request = RefundTransactionRequest(
-            items=[{"itemId": "item-1", "quantity": 1.0}]
-        )
-        response = functions.RefundOrder("test-order-1", request)
+        response = taxcloud_functions.RefundOrder("test-order-1", refund_request)
 
         assert isinstance(response, list)
         assert len(response) == 1
         assert isinstance(response[0], RefundTransactionResponse)
         assert response[0].connection_id == "test-connection-id-uuid"
+        mock_taxcloud_http_client.post_bytes.assert_called_once()
 
-    def test_create_order_without_taxcloud_config(self, mock_http_client, mock_config):
+    def test_create_order_without_taxcloud_config(
+        self, functions, sample_create_order_request
+    ):
         """Test CreateOrder raises without TaxCloud config."""
-        functions = Functions(mock_http_client, mock_config)
-
         with pytest.raises(ZipTaxCloudConfigError):
-            functions.CreateOrder(
-                CreateOrderRequest(
-                    order_id="x",
-                    customer_id="y",
-                    transaction_date="2024-01-15T09:30:00Z",
-                    completed_date="2024-01-15T09:30:00Z",
-                    origin={
-                        "line1": "123 Main",
-                        "city": "City",
-                        "state": "ST",
-                        "zip": "12345",
-                    },
-                    destination={
-                        "line1": "123 Main",
-                        "city": "City",
-                        "state": "ST",
-                        "zip": "12345",
-                    },
-                    line_items=[
-                        {
-                            "index": 0,
-                            "itemId": "i",
-                            "price": 1.0,
-                            "quantity": 1,
-                            "tax": {"amount": 0.1, "rate": 0.1},
-                        }
-                    ],
-                    currency={"currencyCode": "USD"},
-                )
-            )
+            functions.CreateOrder(sample_create_order_request)
 
     def test_create_order_with_valid_address_autocomplete(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_order_response,
+        sample_create_order_request,
     ):
         """Test CreateOrder accepts all valid address_autocomplete values."""
-        mock_taxcloud_http_client.post.return_value = sample_order_response
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
-
-        request = CreateOrderRequest(
-            order_id="test-order-1",
-            customer_id="customer-1",
-            transaction_date="2024-01-15T09:30:00Z",
-            completed_date="2024-01-15T09:30:00Z",
-            origin={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            destination={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            line_items=[
-                {
-                    "index": 0,
-                    "itemId": "item-1",
-                    "price": 10.80,
-                    "quantity": 1.5,
-                    "tax": {"amount": 1.31, "rate": 0.0813},
-                }
-            ],
-            currency={"currencyCode": "USD"},
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
+            sample_order_response
         )
 
         for value in ["none", "origin", "destination", "all"]:
-            mock_taxcloud_http_client.post.reset_mock()
-            response = functions.CreateOrder(request, address_autocomplete=value)
+            mock_taxcloud_http_client.post_bytes.reset_mock()
+            response = taxcloud_functions.CreateOrder(
+                sample_create_order_request, address_autocomplete=value
+            )
             assert isinstance(response, OrderResponse)
 
     def test_create_order_with_invalid_address_autocomplete(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
-        mock_taxcloud_http_client,
+        taxcloud_functions,
+        sample_create_order_request,
     ):
         """Test CreateOrder raises for invalid address_autocomplete."""
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
-
-        request = CreateOrderRequest(
-            order_id="test-order-1",
-            customer_id="customer-1",
-            transaction_date="2024-01-15T09:30:00Z",
-            completed_date="2024-01-15T09:30:00Z",
-            origin={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            destination={
-                "line1": "323 Washington Ave N",
-                "city": "Minneapolis",
-                "state": "MN",
-                "zip": "55401",
-            },
-            line_items=[
-                {
-                    "index": 0,
-                    "itemId": "item-1",
-                    "price": 10.80,
-                    "quantity": 1.5,
-                    "tax": {"amount": 1.31, "rate": 0.0813},
-                }
-            ],
-            currency={"currencyCode": "USD"},
-        )
-
         with pytest.raises(
             ZipTaxValidationError,
             match="address_autocomplete must be one of",
         ):
-            functions.CreateOrder(request, address_autocomplete="invalid")
-
-    def test_get_order_without_taxcloud_config(self, mock_http_client, mock_config):
-        """Test GetOrder raises without TaxCloud config."""
-        functions = Functions(mock_http_client, mock_config)
+            taxcloud_functions.CreateOrder(
+                sample_create_order_request, address_autocomplete="invalid"
+            )
 
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("GetOrder", ("test-order-1",)),
+            (
+                "UpdateOrder",
+                (
+                    "test-order-1",
+                    UpdateOrderRequest(completed_date="2024-01-16T10:00:00Z"),
+                ),
+            ),
+            ("RefundOrder", ("test-order-1",)),
+        ],
+    )
+    def test_order_methods_without_taxcloud_config(self, functions, method, args):
+        """Test order lookups, updates and refunds raise without TaxCloud config."""
         with pytest.raises(ZipTaxCloudConfigError):
-            functions.GetOrder("test-order-1")
+            getattr(functions, method)(*args)
 
 
 class TestCreateOrderFromCart:
@@ -1695,111 +2085,87 @@ class TestCreateOrderFromCart:
 
     def test_basic_request(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_create_order_from_cart_response,
     ):
         """Test basic CreateOrderFromCart request."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_create_order_from_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
         )
-        response = functions.CreateOrderFromCart(request)
+        response = taxcloud_functions.CreateOrderFromCart(request)
 
         assert isinstance(response, OrderResponse)
         assert response.order_id == "my-order-1"
         assert response.customer_id == "customer-453"
         assert response.connection_id == "test-connection-id-uuid"
-        mock_taxcloud_http_client.post.assert_called_once()
+        mock_taxcloud_http_client.post_bytes.assert_called_once()
 
     def test_uses_correct_path(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_create_order_from_cart_response,
     ):
         """Test that CreateOrderFromCart uses the correct API path."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_create_order_from_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
         )
-        functions.CreateOrderFromCart(request)
+        taxcloud_functions.CreateOrderFromCart(request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
         assert (
             call_args[0][0] == "/tax/connections/test-connection-id-uuid/carts/orders"
         )
 
     def test_request_body_serialization(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_create_order_from_cart_response,
     ):
         """Test that request body uses camelCase field names (by_alias)."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_create_order_from_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
         )
-        functions.CreateOrderFromCart(request)
+        taxcloud_functions.CreateOrderFromCart(request)
 
-        call_args = mock_taxcloud_http_client.post.call_args
-        json_body = call_args[1]["json"]
+        call_args = mock_taxcloud_http_client.post_bytes.call_args
+        json_body = json.loads(call_args[1]["content"])
         assert json_body["cartId"] == "ce4a1234-5678-90ab-cdef-1234567890ab"
         assert json_body["orderId"] == "my-order-1"
 
     def test_response_fields_parsed(
         self,
-        mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_create_order_from_cart_response,
     ):
         """Test that all response fields are properly parsed."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_create_order_from_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
         )
-        response = functions.CreateOrderFromCart(request)
+        response = taxcloud_functions.CreateOrderFromCart(request)
 
         assert response.transaction_date == "2024-01-15T09:30:00Z"
         assert response.completed_date is None
@@ -1815,10 +2181,8 @@ class TestCreateOrderFromCart:
         assert response.delivered_by_seller is False
         assert response.exclude_from_filing is False
 
-    def test_without_taxcloud_config_raises(self, mock_http_client, mock_config):
+    def test_without_taxcloud_config_raises(self, functions):
         """Test CreateOrderFromCart raises without TaxCloud config."""
-        functions = Functions(mock_http_client, mock_config)
-
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
@@ -1833,28 +2197,23 @@ class TestCreateOrderFromCart:
     def test_does_not_call_ziptax_http_client(
         self,
         mock_http_client,
-        mock_taxcloud_config,
+        taxcloud_functions,
         mock_taxcloud_http_client,
         sample_create_order_from_cart_response,
     ):
         """Test that CreateOrderFromCart only uses TaxCloud client."""
-        mock_taxcloud_http_client.post.return_value = (
+        mock_taxcloud_http_client.post_bytes.return_value = _json_bytes(
             sample_create_order_from_cart_response
         )
-        functions = Functions(
-            mock_http_client,
-            mock_taxcloud_config,
-            taxcloud_http_client=mock_taxcloud_http_client,
-        )
 
         request = CreateOrderFromCartRequest(
             cart_id="ce4a1234-5678-90ab-cdef-1234567890ab",
             order_id="my-order-1",
         )
-        functions.CreateOrderFromCart(request)
+        taxcloud_functions.CreateOrderFromCart(request)
 
-        mock_http_client.post.assert_not_called()
-        mock_http_client.get.assert_not_called()
+        mock_http_client.post_bytes.assert_not_called()
+        mock_http_client.get_bytes.assert_not_called()
 
     # ----- Pydantic Validation Tests -----
 
@@ -1,7 +1,8 @@
 """Tests for HTTP client utilities."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
+import httpx
 import pytest
 import requests
 
@@ -15,7 +16,7 @@ from ziptax.exceptions import (
     ZipTaxServerError,
     ZipTaxTimeoutError,
 )
-from ziptax.utils.http import HTTPClient
+from ziptax.utils.http import AsyncHTTPClient, HTTPClient
 
 
 @pytest.fixture
@@ -37,6 +38,45 @@ def test_http_client_initialization(http_client):
     assert http_client.session.headers["X-API-Key"] == "test-key-123"
 
 
+def test_http_client_connection_pool():
+    """Test HTTPClient mounts a keep-alive connection pool for both schemes."""
+    client = HTTPClient(
+        "test-key", "https://api.zip-tax.com", 30, pool_connections=4, pool_maxsize=50
+    )
+
+    adapter = client.session.get_adapter("https://api.zip-tax.com")
+    assert adapter is client.session.get_adapter("http://api.zip-tax.com")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 0
+    assert client.session.headers["Connection"] == "keep-alive"
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+
+
+def test_http_clients_use_slots():
+    """Test the HTTP clients do not carry a per-instance __dict__."""
+    client = HTTPClient("test-key", "https://api.zip-tax.com", 30)
+
+    assert not hasattr(client, "__dict__")
+    assert "client" in AsyncHTTPClient.__slots__
+
+
+def test_http_client_shares_connection_pool():
+    """Test clients with the same pool sizes share one adapter across close()."""
+    first = HTTPClient("key-1", "https://api.zip-tax.com", 30, pool_connections=3)
+    adapter = first.session.get_adapter("https://api.zip-tax.com")
+    pool = adapter.poolmanager.connection_from_url("https://api.zip-tax.com")
+    first.close()
+
+    second = HTTPClient("key-2", "https://api.zip-tax.com", 30, pool_connections=3)
+    assert second.session.get_adapter("https://api.zip-tax.com") is adapter
+    assert adapter.poolmanager.connection_from_url("https://api.zip-tax.com") is pool
+    assert second.session.headers["X-API-Key"] == "key-2"
+
+    other = HTTPClient("key-3", "https://api.zip-tax.com", 30, pool_connections=5)
+    assert other.session.get_adapter("https://api.zip-tax.com") is not adapter
+
+
 def test_http_client_context_manager():
     """Test HTTPClient as context manager."""
     with HTTPClient("test-key", "https://api.zip-tax.com", 30) as client:
@@ -49,9 +89,9 @@ def test_get_success(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         result = http_client.get("/test", params={"key": "value"})
 
     assert result == {"data": "test"}
@@ -62,15 +102,16 @@ def test_get_with_headers(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
 
     with patch.object(
-        http_client.session, "get", return_value=mock_response
+        http_client.session, "request", return_value=mock_response
     ) as mock_get:
         result = http_client.get("/test", headers={"Custom": "header"})
 
     assert result == {"data": "test"}
     mock_get.assert_called_once()
+    assert mock_get.call_args[0] == ("GET", "https://api.zip-tax.com/test")
 
 
 def test_get_authentication_error(http_client):
@@ -79,9 +120,9 @@ def test_get_authentication_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 401
     mock_response.text = "Unauthorized"
-    mock_response.json.return_value = {"message": "Invalid API key"}
+    mock_response.content = b'{"message": "Invalid API key"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxAuthenticationError) as exc_info:
             http_client.get("/test")
 
@@ -95,9 +136,9 @@ def test_get_authorization_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 403
     mock_response.text = "Forbidden"
-    mock_response.json.return_value = {"message": "Access denied"}
+    mock_response.content = b'{"message": "Access denied"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxAuthorizationError) as exc_info:
             http_client.get("/test")
 
@@ -111,9 +152,9 @@ def test_get_not_found_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 404
     mock_response.text = "Not Found"
-    mock_response.json.return_value = {"message": "Resource not found"}
+    mock_response.content = b'{"message": "Resource not found"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxNotFoundError) as exc_info:
             http_client.get("/test")
 
@@ -128,9 +169,9 @@ def test_get_rate_limit_error(http_client):
     mock_response.status_code = 429
     mock_response.text = "Too Many Requests"
     mock_response.headers = {"Retry-After": "60"}
-    mock_response.json.return_value = {"message": "Rate limit exceeded"}
+    mock_response.content = b'{"message": "Rate limit exceeded"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxRateLimitError) as exc_info:
             http_client.get("/test")
 
@@ -146,9 +187,9 @@ def test_get_rate_limit_error_no_retry_after(http_client):
     mock_response.status_code = 429
     mock_response.text = "Too Many Requests"
     mock_response.headers = {}
-    mock_response.json.return_value = {"message": "Rate limit exceeded"}
+    mock_response.content = b'{"message": "Rate limit exceeded"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxRateLimitError) as exc_info:
             http_client.get("/test")
 
@@ -161,9 +202,9 @@ def test_get_server_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    mock_response.json.return_value = {"message": "Server error"}
+    mock_response.content = b'{"message": "Server error"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.get("/test")
 
@@ -177,9 +218,9 @@ def test_get_server_error_503(http_client):
     mock_response.ok = False
     mock_response.status_code = 503
     mock_response.text = "Service Unavailable"
-    mock_response.json.return_value = {"message": "Service unavailable"}
+    mock_response.content = b'{"message": "Service unavailable"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.get("/test")
 
@@ -192,9 +233,9 @@ def test_get_generic_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 400
     mock_response.text = "Bad Request"
-    mock_response.json.return_value = {"message": "Invalid request"}
+    mock_response.content = b'{"message": "Invalid request"}'
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxAPIError) as exc_info:
             http_client.get("/test")
 
@@ -202,15 +243,31 @@ def test_get_generic_error(http_client):
     assert "API error" in str(exc_info.value)
 
 
+def test_error_message_does_not_decode_text(http_client):
+    """Test the envelope message is used without decoding response.text."""
+    mock_response = Mock()
+    mock_response.ok = False
+    mock_response.status_code = 404
+    mock_response.content = b'{"message": "Order not found"}'
+    text = PropertyMock(return_value="unused")
+    type(mock_response).text = text
+
+    with patch.object(http_client.session, "request", return_value=mock_response):
+        with pytest.raises(ZipTaxNotFoundError, match="Order not found"):
+            http_client.get("/test")
+
+    text.assert_not_called()
+
+
 def test_get_error_without_json(http_client):
     """Test GET request error when response is not JSON."""
     mock_response = Mock()
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    mock_response.json.side_effect = ValueError("Not JSON")
+    mock_response.content = b"Internal Server Error"
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.get("/test")
 
@@ -223,9 +280,9 @@ def test_get_error_empty_response(http_client):
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = ""
-    mock_response.json.side_effect = ValueError("Not JSON")
+    mock_response.content = b""
 
-    with patch.object(http_client.session, "get", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.get("/test")
 
@@ -235,7 +292,9 @@ def test_get_error_empty_response(http_client):
 def test_get_timeout_error(http_client):
     """Test GET request with timeout error."""
     with patch.object(
-        http_client.session, "get", side_effect=requests.exceptions.Timeout("Timeout")
+        http_client.session,
+        "request",
+        side_effect=requests.exceptions.Timeout("Timeout"),
     ):
         with pytest.raises(ZipTaxTimeoutError) as exc_info:
             http_client.get("/test")
@@ -247,7 +306,7 @@ def test_get_connection_error(http_client):
     """Test GET request with connection error."""
     with patch.object(
         http_client.session,
-        "get",
+        "request",
         side_effect=requests.exceptions.ConnectionError("Connection failed"),
     ):
         with pytest.raises(ZipTaxConnectionError) as exc_info:
@@ -259,7 +318,7 @@ def test_get_connection_error(http_client):
 def test_get_unexpected_error(http_client):
     """Test GET request with unexpected error."""
     with patch.object(
-        http_client.session, "get", side_effect=RuntimeError("Unexpected error")
+        http_client.session, "request", side_effect=RuntimeError("Unexpected error")
     ):
         with pytest.raises(ZipTaxAPIError) as exc_info:
             http_client.get("/test")
@@ -267,6 +326,78 @@ def test_get_unexpected_error(http_client):
     assert "Unexpected error" in str(exc_info.value)
 
 
+@pytest.mark.parametrize("method", ["get", "post", "patch"])
+def test_invalid_json_body_raises_api_error(http_client, method):
+    """Test an undecodable success body is wrapped for every verb."""
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.content = b"<html>"
+
+    with patch.object(http_client.session, "request", return_value=mock_response):
+        with pytest.raises(ZipTaxAPIError, match="Unexpected error"):
+            getattr(http_client, method)("/test")
+
+
+def test_get_bytes_returns_raw_body(http_client):
+    """Test get_bytes returns the undecoded response body."""
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+
+    with patch.object(
+        http_client.session, "request", return_value=mock_response
+    ) as mock_get:
+        result = http_client.get_bytes("/test", params={"key": "value"})
+
+    assert result == b'{"data": "test"}'
+    mock_response.json.assert_not_called()
+    assert mock_get.call_args[1]["params"] == {"key": "value"}
+
+
+def test_post_bytes_with_content(http_client):
+    """Test post_bytes sends a pre-encoded body and returns the raw body."""
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.content = b"[]"
+
+    with patch.object(
+        http_client.session, "request", return_value=mock_response
+    ) as mock_post:
+        result = http_client.post_bytes("/test", content=b"{}")
+
+    assert result == b"[]"
+    assert mock_post.call_args[0] == ("POST", "https://api.zip-tax.com/test")
+    assert mock_post.call_args[1]["data"] == b"{}"
+    assert mock_post.call_args[1]["headers"]["Content-Type"] == "application/json"
+
+
+def test_patch_bytes_server_error(http_client):
+    """Test patch_bytes maps error responses to SDK exceptions."""
+    mock_response = Mock()
+    mock_response.ok = False
+    mock_response.status_code = 500
+    mock_response.text = "Internal Server Error"
+    mock_response.content = b'{"message": "Server error"}'
+
+    with patch.object(http_client.session, "request", return_value=mock_response):
+        with pytest.raises(ZipTaxServerError):
+            http_client.patch_bytes("/test", content=b"{}")
+
+
+def test_get_bytes_timeout_error(http_client):
+    """Test get_bytes maps timeouts to ZipTaxTimeoutError."""
+    with patch.object(
+        http_client.session,
+        "request",
+        side_effect=requests.exceptions.Timeout("Timeout"),
+    ):
+        with pytest.raises(ZipTaxTimeoutError):
+            http_client.get_bytes("/test")
+
+
 def test_close(http_client):
     """Test closing the HTTP client session."""
     with patch.object(http_client.session, "close") as mock_close:
@@ -284,12 +415,18 @@ def test_post_success(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"orderId": "test-1"}
+    mock_response.content = b'{"orderId": "test-1"}'
 
-    with patch.object(http_client.session, "post", return_value=mock_response):
+    with patch.object(
+        http_client.session, "request", return_value=mock_response
+    ) as mock_post:
         result = http_client.post("/test", json={"key": "value"})
 
     assert result == {"orderId": "test-1"}
+    call_kwargs = mock_post.call_args[1]
+    assert call_kwargs["data"] == b'{"key":"value"}'
+    assert call_kwargs["headers"]["Content-Type"] == "application/json"
+    assert "json" not in call_kwargs
 
 
 def test_post_with_params(http_client):
@@ -297,10 +434,10 @@ def test_post_with_params(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
 
     with patch.object(
-        http_client.session, "post", return_value=mock_response
+        http_client.session, "request", return_value=mock_response
     ) as mock_post:
         result = http_client.post(
             "/test", json={"body": "data"}, params={"param1": "value1"}
@@ -310,15 +447,33 @@ def test_post_with_params(http_client):
     mock_post.assert_called_once()
 
 
+def test_post_with_content(http_client):
+    """Test POST request with a pre-encoded JSON body."""
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+
+    with patch.object(
+        http_client.session, "request", return_value=mock_response
+    ) as mock_post:
+        result = http_client.post("/test", content=b'{"body":"data"}')
+
+    assert result == {"data": "test"}
+    call_kwargs = mock_post.call_args[1]
+    assert call_kwargs["data"] == b'{"body":"data"}'
+    assert call_kwargs["headers"]["Content-Type"] == "application/json"
+
+
 def test_post_authentication_error(http_client):
     """Test POST request with 401 authentication error."""
     mock_response = Mock()
     mock_response.ok = False
     mock_response.status_code = 401
     mock_response.text = "Unauthorized"
-    mock_response.json.return_value = {"message": "Invalid API key"}
+    mock_response.content = b'{"message": "Invalid API key"}'
 
-    with patch.object(http_client.session, "post", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxAuthenticationError) as exc_info:
             http_client.post("/test", json={})
 
@@ -331,9 +486,9 @@ def test_post_server_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    mock_response.json.return_value = {"message": "Server error"}
+    mock_response.content = b'{"message": "Server error"}'
 
-    with patch.object(http_client.session, "post", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.post("/test", json={})
 
@@ -344,7 +499,7 @@ def test_post_timeout_error(http_client):
     """Test POST request with timeout error."""
     with patch.object(
         http_client.session,
-        "post",
+        "request",
         side_effect=requests.exceptions.Timeout("Timeout"),
     ):
         with pytest.raises(ZipTaxTimeoutError):
@@ -355,7 +510,7 @@ def test_post_connection_error(http_client):
     """Test POST request with connection error."""
     with patch.object(
         http_client.session,
-        "post",
+        "request",
         side_effect=requests.exceptions.ConnectionError("Connection failed"),
     ):
         with pytest.raises(ZipTaxConnectionError):
@@ -372,9 +527,9 @@ def test_patch_success(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"orderId": "test-1", "updated": True}
+    mock_response.content = b'{"orderId": "test-1", "updated": true}'
 
-    with patch.object(http_client.session, "patch", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         result = http_client.patch("/test", json={"completedDate": "2024-01"})
 
     assert result == {"orderId": "test-1", "updated": True}
@@ -385,10 +540,10 @@ def test_patch_with_params(http_client):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
 
     with patch.object(
-        http_client.session, "patch", return_value=mock_response
+        http_client.session, "request", return_value=mock_response
     ) as mock_patch:
         result = http_client.patch(
             "/test", json={"body": "data"}, params={"param1": "value1"}
@@ -396,6 +551,7 @@ def test_patch_with_params(http_client):
 
     assert result == {"data": "test"}
     mock_patch.assert_called_once()
+    assert mock_patch.call_args[0] == ("PATCH", "https://api.zip-tax.com/test")
 
 
 def test_patch_not_found_error(http_client):
@@ -404,9 +560,9 @@ def test_patch_not_found_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 404
     mock_response.text = "Not Found"
-    mock_response.json.return_value = {"message": "Order not found"}
+    mock_response.content = b'{"message": "Order not found"}'
 
-    with patch.object(http_client.session, "patch", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxNotFoundError) as exc_info:
             http_client.patch("/test", json={})
 
@@ -419,9 +575,9 @@ def test_patch_server_error(http_client):
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    mock_response.json.return_value = {"message": "Server error"}
+    mock_response.content = b'{"message": "Server error"}'
 
-    with patch.object(http_client.session, "patch", return_value=mock_response):
+    with patch.object(http_client.session, "request", return_value=mock_response):
         with pytest.raises(ZipTaxServerError) as exc_info:
             http_client.patch("/test", json={})
 
@@ -432,7 +588,7 @@ def test_patch_timeout_error(http_client):
     """Test PATCH request with timeout error."""
     with patch.object(
         http_client.session,
-        "patch",
+        "request",
         side_effect=requests.exceptions.Timeout("Timeout"),
     ):
         with pytest.raises(ZipTaxTimeoutError):
@@ -443,7 +599,7 @@ def test_patch_connection_error(http_client):
     """Test PATCH request with connection error."""
     with patch.object(
         http_client.session,
-        "patch",
+        "request",
         side_effect=requests.exceptions.ConnectionError("Connection failed"),
     ):
         with pytest.raises(ZipTaxConnectionError):
@@ -460,12 +616,12 @@ def test_get_debug_logs_exclude_param_values(http_client, caplog):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
 
     import logging
 
     with caplog.at_level(logging.DEBUG, logger="ziptax.utils.http"):
-        with patch.object(http_client.session, "get", return_value=mock_response):
+        with patch.object(http_client.session, "request", return_value=mock_response):
             http_client.get("/test", params={"address": "123 Main St", "zip": "90210"})
 
     log_text = caplog.text
@@ -484,12 +640,12 @@ def test_post_debug_logs_exclude_body_values(http_client, caplog):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"orderId": "order-1"}
+    mock_response.content = b'{"orderId": "order-1"}'
 
     import logging
 
     with caplog.at_level(logging.DEBUG, logger="ziptax.utils.http"):
-        with patch.object(http_client.session, "post", return_value=mock_response):
+        with patch.object(http_client.session, "request", return_value=mock_response):
             http_client.post(
                 "/orders",
                 json={
@@ -515,12 +671,12 @@ def test_patch_debug_logs_exclude_body_values(http_client, caplog):
     mock_response = Mock()
     mock_response.ok = True
     mock_response.status_code = 200
-    mock_response.json.return_value = {"orderId": "order-1"}
+    mock_response.content = b'{"orderId": "order-1"}'
 
     import logging
 
     with caplog.at_level(logging.DEBUG, logger="ziptax.utils.http"):
-        with patch.object(http_client.session, "patch", return_value=mock_response):
+        with patch.object(http_client.session, "request", return_value=mock_response):
             http_client.patch(
                 "/orders/order-1",
                 json={"completedDate": "2024-01-15", "deliveryAddress": "789 Elm St"},
@@ -533,3 +689,148 @@ def test_patch_debug_logs_exclude_body_values(http_client, caplog):
     # Values must NOT appear
     assert "2024-01-15" not in log_text
     assert "789 Elm St" not in log_text
+
+
+def test_debug_logs_skipped_when_disabled(http_client, caplog):
+    """Test nothing is formatted or logged when DEBUG is disabled."""
+    mock_response = Mock()
+    mock_response.ok = True
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+
+    import logging
+
+    with caplog.at_level(logging.INFO, logger="ziptax.utils.http"):
+        with patch.object(http_client.session, "request", return_value=mock_response):
+            with patch("ziptax.utils.http.logger.debug") as mock_debug:
+                http_client.post("/test", json={"key": "value"})
+
+    mock_debug.assert_called_once_with("%s %s status=%s", "POST", "/test", 200)
+
+
+@pytest.fixture
+async def async_http_client():
+    """Create an AsyncHTTPClient instance for testing."""
+    client = AsyncHTTPClient(
+        api_key="test-key-123",
+        base_url="https://api.zip-tax.com",
+        timeout=30,
+    )
+    yield client
+    await client.close()
+
+
+async def test_async_http_client_initialization(async_http_client):
+    """Test AsyncHTTPClient initialization."""
+    assert async_http_client.api_key == "test-key-123"
+    assert async_http_client.base_url == "https://api.zip-tax.com"
+    assert async_http_client.client.headers["X-API-Key"] == "test-key-123"
+    assert "gzip" in async_http_client.client.headers["Accept-Encoding"]
+
+
+async def test_async_get_success(async_http_client):
+    """Test successful async GET request."""
+    response = httpx.Response(200, json={"data": "test"})
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ) as mock_request:
+        result = await async_http_client.get("/test", params={"key": "value"})
+
+    assert result == {"data": "test"}
+    assert mock_request.call_args[0] == ("GET", "https://api.zip-tax.com/test")
+    assert mock_request.call_args[1]["params"] == {"key": "value"}
+
+
+async def test_async_post_success(async_http_client):
+    """Test successful async POST request."""
+    response = httpx.Response(200, json=[{"id": 1}])
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ) as mock_request:
+        result = await async_http_client.post("/test", json={"key": "value"})
+
+    assert result == [{"id": 1}]
+    assert mock_request.call_args[1]["json"] == {"key": "value"}
+
+
+async def test_async_post_with_content(async_http_client):
+    """Test async POST request with a pre-encoded JSON body."""
+    response = httpx.Response(200, json={"id": 1})
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ) as mock_request:
+        await async_http_client.post("/test", content=b'{"key":"value"}')
+
+    assert mock_request.call_args[1]["content"] == b'{"key":"value"}'
+    assert mock_request.call_args[1]["json"] is None
+    assert mock_request.call_args[1]["headers"]["Content-Type"] == "application/json"
+
+
+async def test_async_get_bytes_returns_raw_body(async_http_client):
+    """Test async get_bytes returns the undecoded response body."""
+    response = httpx.Response(200, content=b'{"data": "test"}')
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ):
+        result = await async_http_client.get_bytes("/test")
+
+    assert result == b'{"data": "test"}'
+
+
+async def test_async_patch_not_found_error(async_http_client):
+    """Test async PATCH request with 404 not found error."""
+    response = httpx.Response(404, json={"message": "Order not found"})
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ):
+        with pytest.raises(ZipTaxNotFoundError) as exc_info:
+            await async_http_client.patch("/orders/1", json={})
+
+    assert exc_info.value.status_code == 404
+    assert "Order not found" in str(exc_info.value)
+
+
+async def test_async_rate_limit_error(async_http_client):
+    """Test async request with 429 rate limit error."""
+    response = httpx.Response(
+        429, headers={"Retry-After": "30"}, json={"message": "Slow down"}
+    )
+
+    with patch.object(
+        async_http_client.client, "request", AsyncMock(return_value=response)
+    ):
+        with pytest.raises(ZipTaxRateLimitError) as exc_info:
+            await async_http_client.get("/test")
+
+    assert exc_info.value.retry_after == 30
+
+
+async def test_async_timeout_error(async_http_client):
+    """Test async request with timeout error."""
+    with patch.object(
+        async_http_client.client,
+        "request",
+        AsyncMock(side_effect=httpx.ReadTimeout("Timeout")),
+    ):
+        with pytest.raises(ZipTaxTimeoutError) as exc_info:
+            await async_http_client.get("/test")
+
+    assert "Request timed out after 30s" in str(exc_info.value)
+
+
+async def test_async_connection_error(async_http_client):
+    """Test async request with connection error."""
+    with patch.object(
+        async_http_client.client,
+        "request",
+        AsyncMock(side_effect=httpx.ConnectError("Connection failed")),
+    ):
+        with pytest.raises(ZipTaxConnectionError) as exc_info:
+            await async_http_client.get("/test")
+
+    assert "Connection error" in str(exc_info.value)
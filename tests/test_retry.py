@@ -1,10 +1,15 @@
 """Tests for retry utilities."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from ziptax.exceptions import (
+    ZipTaxCircuitOpenError,
     ZipTaxConnectionError,
     ZipTaxRateLimitError,
     ZipTaxRetryError,
@@ -12,8 +17,10 @@ from ziptax.exceptions import (
     ZipTaxTimeoutError,
     ZipTaxValidationError,
 )
+from ziptax.utils.circuit import CircuitBreaker
 from ziptax.utils.retry import (
     async_retry_with_backoff,
+    parse_retry_after,
     retry_with_backoff,
     should_retry,
 )
@@ -24,6 +31,12 @@ def test_should_retry_server_error():
     assert should_retry(ZipTaxServerError("Server error", 500, None))
 
 
+@pytest.mark.parametrize("status_code", [501, 505])
+def test_should_retry_non_transient_server_error(status_code):
+    """Test should_retry returns False for non-transient 5xx errors."""
+    assert not should_retry(ZipTaxServerError("Server error", status_code, None))
+
+
 def test_should_retry_rate_limit_error():
     """Test should_retry returns True for rate limit errors."""
     assert should_retry(ZipTaxRateLimitError("Rate limit", None, 429, None))
@@ -77,6 +90,24 @@ def test_retry_with_backoff_success_after_retry():
     assert mock_func.call_count == 2
 
 
+def test_retry_with_backoff_logs_lazily(caplog):
+    """Test retry warnings pass their values as logging arguments."""
+    error = ZipTaxServerError("Server error", 500, None)
+    mock_func = Mock(side_effect=[error, "success"])
+    decorated = retry_with_backoff(max_retries=2, base_delay=0.5, jitter=False)(
+        mock_func
+    )
+
+    with caplog.at_level(logging.WARNING, logger="ziptax.utils.retry"):
+        with patch("time.sleep"):
+            decorated()
+
+    assert caplog.records[0].getMessage() == (
+        "Attempt 1/2 failed: Server error. Retrying in 0.50s..."
+    )
+    assert caplog.records[0].args == (1, 2, error, 0.5)
+
+
 def test_retry_with_backoff_max_retries_exceeded():
     """Test retry_with_backoff raises ZipTaxRetryError when max retries exceeded."""
     mock_func = Mock(side_effect=ZipTaxServerError("Server error", 500, None))
@@ -106,7 +137,11 @@ def test_retry_with_backoff_exponential_delay():
     """Test retry_with_backoff uses exponential backoff delays."""
     mock_func = Mock(side_effect=ZipTaxServerError("Server error", 500, None))
     decorated = retry_with_backoff(
-        max_retries=3, base_delay=1.0, exponential_base=2.0, max_delay=60.0
+        max_retries=3,
+        base_delay=1.0,
+        exponential_base=2.0,
+        max_delay=60.0,
+        jitter=False,
     )(mock_func)
 
     with patch("time.sleep") as mock_sleep:
@@ -122,7 +157,11 @@ def test_retry_with_backoff_max_delay():
     """Test retry_with_backoff respects max_delay."""
     mock_func = Mock(side_effect=ZipTaxServerError("Server error", 500, None))
     decorated = retry_with_backoff(
-        max_retries=5, base_delay=10.0, exponential_base=2.0, max_delay=30.0
+        max_retries=5,
+        base_delay=10.0,
+        exponential_base=2.0,
+        max_delay=30.0,
+        jitter=False,
     )(mock_func)
 
     with patch("time.sleep") as mock_sleep:
@@ -155,6 +194,113 @@ def test_retry_with_backoff_rate_limit_retry_after():
     mock_sleep.assert_called_once_with(5)
 
 
+def test_retry_with_backoff_retry_after_capped_at_max_delay():
+    """Test an oversized Retry-After is clamped to max_delay."""
+    mock_func = Mock(
+        side_effect=[
+            ZipTaxRateLimitError(
+                "Rate limit", retry_after=86400, status_code=429, response=None
+            ),
+            "success",
+        ]
+    )
+    decorated = retry_with_backoff(max_retries=2, base_delay=1.0, max_delay=30.0)(
+        mock_func
+    )
+
+    with patch("time.sleep") as mock_sleep:
+        result = decorated()
+
+    assert result == "success"
+    mock_sleep.assert_called_once_with(30.0)
+
+
+def test_retry_with_backoff_full_jitter():
+    """Test retry_with_backoff draws delays uniformly up to the backoff cap."""
+    mock_func = Mock(side_effect=ZipTaxServerError("Server error", 500, None))
+    decorated = retry_with_backoff(
+        max_retries=3, base_delay=1.0, exponential_base=2.0, max_delay=3.0
+    )(mock_func)
+
+    with patch("time.sleep"), patch(
+        "ziptax.utils.retry.random.uniform", return_value=0.5
+    ) as mock_uniform:
+        with pytest.raises(ZipTaxRetryError):
+            decorated()
+
+    uniform_calls = [call[0] for call in mock_uniform.call_args_list]
+    assert uniform_calls == [(0, 1.0), (0, 2.0), (0, 3.0)]
+
+
+def test_retry_with_backoff_decorrelated_jitter():
+    """Test decorrelated jitter grows from the previous delay up to the cap."""
+    mock_func = Mock(side_effect=ZipTaxServerError("Server error", 500, None))
+    decorated = retry_with_backoff(
+        max_retries=3, base_delay=1.0, max_delay=5.0, jitter="decorrelated"
+    )(mock_func)
+
+    with patch("time.sleep") as mock_sleep, patch(
+        "ziptax.utils.retry.random.uniform", side_effect=lambda a, b: b
+    ) as mock_uniform:
+        with pytest.raises(ZipTaxRetryError):
+            decorated()
+
+    uniform_calls = [call[0] for call in mock_uniform.call_args_list]
+    assert uniform_calls == [(1.0, 3.0), (1.0, 9.0), (1.0, 15.0)]
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [3.0, 5.0, 5.0]
+
+
+def test_retry_with_backoff_unknown_jitter():
+    """Test an unknown jitter strategy is rejected when decorating."""
+    with pytest.raises(ValueError, match="jitter must be"):
+        retry_with_backoff(jitter="equal")
+
+
+def test_retry_with_backoff_retry_after_header_on_server_error():
+    """Test retry_with_backoff honors Retry-After on 503 responses."""
+    response = Mock()
+    response.headers = {"Retry-After": "7"}
+    mock_func = Mock(
+        side_effect=[
+            ZipTaxServerError("Unavailable", 503, response),
+            "success",
+        ]
+    )
+    decorated = retry_with_backoff(max_retries=2, base_delay=1.0)(mock_func)
+
+    with patch("time.sleep") as mock_sleep:
+        result = decorated()
+
+    assert result == "success"
+    mock_sleep.assert_called_once_with(7.0)
+
+
+def test_parse_retry_after_seconds():
+    """Test parse_retry_after parses delta-seconds values."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 0 ") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    """Test parse_retry_after parses HTTP-date values."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert delay is not None
+    assert 25.0 <= delay <= 30.0
+
+
+def test_parse_retry_after_past_date():
+    """Test parse_retry_after never returns a negative delay."""
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_invalid(value):
+    """Test parse_retry_after returns None for missing or invalid values."""
+    assert parse_retry_after(value) is None
+
+
 @pytest.mark.asyncio
 async def test_async_retry_with_backoff_success():
     """Test async_retry_with_backoff decorator with successful call."""
@@ -234,7 +380,11 @@ async def test_async_retry_with_backoff_exponential_delay():
         raise ZipTaxServerError("Server error", 500, None)
 
     decorator = async_retry_with_backoff(
-        max_retries=3, base_delay=1.0, exponential_base=2.0, max_delay=60.0
+        max_retries=3,
+        base_delay=1.0,
+        exponential_base=2.0,
+        max_delay=60.0,
+        jitter=False,
     )
     decorated = decorator(async_func)
 
@@ -270,3 +420,100 @@ async def test_async_retry_with_backoff_rate_limit_retry_after():
     assert result == "success"
     # Should use retry_after value (5) instead of exponential delay (1)
     mock_sleep.assert_called_once_with(5)
+
+
+async def test_async_retry_with_backoff_retry_after_capped_at_max_delay():
+    """Test an oversized Retry-After is clamped to max_delay."""
+    async_func = AsyncMock(
+        side_effect=[
+            ZipTaxRateLimitError(
+                "Rate limit", retry_after=86400, status_code=429, response=None
+            ),
+            "success",
+        ]
+    )
+    decorated = async_retry_with_backoff(max_retries=2, base_delay=1.0, max_delay=30.0)(
+        async_func
+    )
+
+    with patch("asyncio.sleep") as mock_sleep:
+        result = await decorated()
+
+    assert result == "success"
+    mock_sleep.assert_called_once_with(30.0)
+
+
+def test_retry_with_backoff_breaker_fails_fast_when_open():
+    """Test an open circuit stops retries without calling the function."""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=30.0)
+    mock_func = Mock(side_effect=ZipTaxServerError("Server error", 503, None))
+    decorated = retry_with_backoff(max_retries=5, base_delay=0.01, breaker=breaker)(
+        mock_func
+    )
+
+    with patch("time.sleep"):
+        with pytest.raises(ZipTaxCircuitOpenError):
+            decorated()
+
+    assert mock_func.call_count == 2
+
+
+def test_retry_with_backoff_breaker_ignores_non_transient_errors():
+    """Test non-retryable errors do not count against the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    mock_func = Mock(side_effect=ZipTaxValidationError("Invalid input"))
+    decorated = retry_with_backoff(breaker=breaker)(mock_func)
+
+    with pytest.raises(ZipTaxValidationError):
+        decorated()
+
+    assert breaker.state == "closed"
+
+
+def test_retry_with_backoff_breaker_interrupted_probe_released():
+    """Test an interrupted half-open probe does not wedge the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.0)
+    breaker.record_failure()
+    mock_func = Mock(side_effect=[KeyboardInterrupt, "success"])
+    decorated = retry_with_backoff(breaker=breaker)(mock_func)
+
+    with pytest.raises(KeyboardInterrupt):
+        decorated()
+
+    assert decorated() == "success"
+    assert breaker.state == "closed"
+
+
+async def test_async_retry_with_backoff_breaker_fails_fast_when_open():
+    """Test an open circuit stops async retries without calling the function."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30.0)
+    breaker.record_failure()
+    mock_func = AsyncMock(return_value="success")
+    decorated = async_retry_with_backoff(breaker=breaker)(mock_func)
+
+    with pytest.raises(ZipTaxCircuitOpenError):
+        await decorated()
+
+    mock_func.assert_not_called()
+
+
+async def test_async_retry_with_backoff_breaker_cancelled_probe_released():
+    """Test a cancelled half-open probe does not wedge the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.0)
+    breaker.record_failure()
+    started = asyncio.Event()
+
+    async def hang():
+        started.set()
+        await asyncio.sleep(10)
+
+    decorated = async_retry_with_backoff(breaker=breaker)(hang)
+    task = asyncio.ensure_future(decorated())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    probe = async_retry_with_backoff(breaker=breaker)(AsyncMock(return_value="success"))
+    assert await probe() == "success"
+    assert breaker.state == "closed"
@@ -0,0 +1,52 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ziptax.utils.serialization import dumps, loads
+
+
+def test_dumps_returns_compact_bytes():
+    """Test dumps returns compact UTF-8 JSON bytes."""
+    result = dumps({"items": [{"price": 10.75, "city": "Düsseldorf"}]})
+
+    assert isinstance(result, bytes)
+    assert b" " not in result
+    assert json.loads(result) == {"items": [{"price": 10.75, "city": "Düsseldorf"}]}
+
+
+def test_dumps_falls_back_to_stdlib():
+    """Test dumps matches orjson's output when orjson is unavailable."""
+    data = {"query": "baked goods", "quantity": 1.5, "tic": 0}
+
+    with patch("ziptax.utils.serialization.orjson", None):
+        result = dumps(data)
+
+    assert result == b'{"query":"baked goods","quantity":1.5,"tic":0}'
+    assert result == dumps(data)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_decodes_bytes(use_orjson):
+    """Test loads decodes UTF-8 bytes with and without orjson."""
+    body = '{"city":"Düsseldorf","rate":0.0775}'.encode()
+
+    if use_orjson:
+        assert loads(body) == {"city": "Düsseldorf", "rate": 0.0775}
+    else:
+        with patch("ziptax.utils.serialization.orjson", None):
+            assert loads(body) == {"city": "Düsseldorf", "rate": 0.0775}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_invalid_raises_value_error(use_orjson):
+    """Test invalid JSON raises a ValueError subclass either way."""
+    if use_orjson:
+        with pytest.raises(ValueError):
+            loads(b"Not JSON")
+    else:
+        with patch("ziptax.utils.serialization.orjson", None):
+            with pytest.raises(ValueError):
+                loads(b"Not JSON")
@@ -0,0 +1,135 @@
+"""Tests for request coalescing utilities."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ziptax.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_singleflight_returns_result():
+    """Test a lone call runs the function and returns its result."""
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: "value") == "value"
+    assert len(flight) == 0
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    """Test concurrent calls for the same key run the function once."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", slow)
+        assert started.wait(timeout=5)
+        followers = [executor.submit(flight.do, "key", slow) for _ in range(3)]
+        # Give the followers time to join the in-flight call
+        time.sleep(0.1)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_singleflight_shares_exception():
+    """Test waiters receive the exception raised by the shared call."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", failing)
+        assert started.wait(timeout=5)
+        follower = executor.submit(flight.do, "key", failing)
+        time.sleep(0.1)
+        release.set()
+
+        with pytest.raises(ValueError, match="boom"):
+            leader.result()
+        with pytest.raises(ValueError, match="boom"):
+            follower.result()
+
+
+def test_singleflight_runs_again_after_completion():
+    """Test a key is released once its call has finished."""
+    flight = SingleFlight()
+    calls = []
+
+    flight.do("key", lambda: calls.append(1))
+    flight.do("key", lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+async def test_async_singleflight_coalesces_concurrent_calls():
+    """Test concurrent coroutines for the same key await one call."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("key", slow) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+
+
+async def test_async_singleflight_shares_exception():
+    """Test waiting coroutines receive the exception of the shared call."""
+    flight = AsyncSingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", failing),
+        flight.do("key", failing),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+async def test_async_singleflight_cancelled_leader_does_not_cancel_waiters():
+    """Test a waiter retries when the leading caller is cancelled."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 42
+
+    leader = asyncio.ensure_future(asyncio.wait_for(flight.do("key", slow), 0.05))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(flight.do("key", slow))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await leader
+    assert await waiter == 42
+    assert len(calls) == 2
+    assert len(flight) == 0